@@ -0,0 +1,59 @@
+import dataclasses
+import time
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+import tyro
+
+
+@dataclasses.dataclass
+class Adam:
+    lr: float = 1e-3
+    betas: Tuple[float, float] = (0.9, 0.999)
+    eps: float = 1e-8
+
+
+@dataclasses.dataclass
+class Sgd:
+    lr: float = 1e-2
+    momentum: float = 0.9
+    nesterov: bool = False
+
+
+@dataclasses.dataclass
+class Lamb:
+    lr: float = 1e-3
+    trust_clip: Optional[float] = None
+
+
+@dataclasses.dataclass
+class Data:
+    paths: List[str] = dataclasses.field(default_factory=list)
+    split: Literal["train", "val", "test"] = "train"
+    weights: Dict[str, float] = dataclasses.field(default_factory=dict)
+    shuffle: bool = True
+    seed: Optional[int] = None
+
+
+@dataclasses.dataclass
+class Config:
+    train_data: Data = dataclasses.field(default_factory=Data)
+    val_data: Data = dataclasses.field(default_factory=Data)
+    optimizer: Union[Adam, Sgd, Lamb] = dataclasses.field(default_factory=Adam)
+    fallback: Union[Adam, Sgd, Lamb, None] = None
+    steps: int = 1000
+    log_every: Optional[int] = 10
+    tags: Tuple[str, ...] = ()
+    mode: Literal["fast", "slow"] = "fast"
+
+
+def main(n: int = 100) -> None:
+    """Build a CLI with many union members and non-struct fields, which all need
+    to be classified as struct or non-struct types."""
+    start = time.perf_counter()
+    for _ in range(n):
+        tyro.cli(Config, args=["optimizer:sgd", "fallback:lamb"])
+    print(f"{(time.perf_counter() - start) / n * 1000:.2f}ms per call")
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
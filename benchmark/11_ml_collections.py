@@ -0,0 +1,52 @@
+import time
+import tracemalloc
+
+import numpy as np
+from ml_collections import ConfigDict, FieldReference, FrozenConfigDict
+
+import tyro
+
+
+def make_config(tables: int, table_mb: int) -> ConfigDict:
+    """A config with large arrays, nested tables, and a field reference."""
+    rows = table_mb * 1024 * 1024 // (8 * 64)
+    config = ConfigDict()
+    config.lr = 1e-3
+    config.warmup = FieldReference(100)
+    config.schedule = ConfigDict()
+    config.schedule.warmup = config.get_ref("warmup")
+    config.schedule.decay = 0.99
+    config.tables = ConfigDict()
+    for i in range(tables):
+        config.tables[f"table_{i}"] = ConfigDict()
+        config.tables[f"table_{i}"].scale = 1.0
+        config.tables[f"table_{i}"].values = np.zeros((rows, 64))
+        config.tables[f"table_{i}"].names = [f"row_{j}" for j in range(1000)]
+    return config
+
+
+def main(n: int = 5, tables: int = 8, table_mb: int = 32) -> None:
+    """Instantiate large ConfigDicts with a few overridden values."""
+    args = ["--config.lr", "3e-4", "--config.warmup", "10"]
+    for config_type in (ConfigDict, FrozenConfigDict):
+        default = config_type(make_config(tables, table_mb))
+
+        def train(config: config_type = default) -> config_type:  # type: ignore
+            return config
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(n):
+            out = tyro.cli(train, args=args)
+        elapsed = (time.perf_counter() - start) / n
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert out.schedule.warmup == 10
+        print(
+            f"{config_type.__name__} ({tables * table_mb}MB of tables):"
+            f" {elapsed * 1000:.1f}ms, peak {peak / 1024 / 1024:.1f}MB allocated"
+        )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
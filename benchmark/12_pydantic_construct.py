@@ -0,0 +1,51 @@
+import time
+from typing import Dict, List
+
+from pydantic import BaseModel, Field
+
+import tyro
+
+
+def load_vocabulary() -> List[str]:
+    """Stand-in for an expensive default factory."""
+    return [f"token_{i}" for i in range(20_000)]
+
+
+class Layer(BaseModel):
+    width: int = 256
+    dropout: float = 0.1
+    activation: str = "gelu"
+    bias: bool = True
+
+
+class Encoder(BaseModel):
+    input: Layer = Field(default_factory=Layer)
+    hidden: Layer = Field(default_factory=Layer)
+    output: Layer = Field(default_factory=Layer)
+    vocabulary: List[str] = Field(default_factory=load_vocabulary)
+
+
+class Settings(BaseModel):
+    name: str = "experiment"
+    seed: int = 0
+    encoder: Encoder = Field(default_factory=Encoder)
+    decoder: Encoder = Field(default_factory=Encoder)
+    weights: Dict[str, float] = Field(default_factory=dict)
+
+
+def main(n: int = 20) -> None:
+    """Instantiate nested pydantic models, with and without validation."""
+    args = ["--seed", "3", "--encoder.hidden.width", "512"]
+    for config in ((), (tyro.conf.PydanticValidationOff,)):
+        start = time.perf_counter()
+        for _ in range(n):
+            out = tyro.cli(Settings, args=args, config=config)
+        assert out.encoder.hidden.width == 512
+        print(
+            f"{'validation off' if config else 'default'}:"
+            f" {(time.perf_counter() - start) / n * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
@@ -0,0 +1,45 @@
+import time
+from typing import List
+
+import msgspec
+
+import tyro
+
+
+class Layer(msgspec.Struct):
+    width: int = 256
+    dropout: float = 0.1
+    activation: str = "gelu"
+    tags: List[str] = msgspec.field(default_factory=list)
+
+
+class Block(msgspec.Struct):
+    a: Layer = msgspec.field(default_factory=Layer)
+    b: Layer = msgspec.field(default_factory=Layer)
+    c: Layer = msgspec.field(default_factory=Layer)
+
+
+class Model(msgspec.Struct):
+    b1: Block = msgspec.field(default_factory=Block)
+    b2: Block = msgspec.field(default_factory=Block)
+    b3: Block = msgspec.field(default_factory=Block)
+    b4: Block = msgspec.field(default_factory=Block)
+    seed: int = 0
+
+
+def main(n: int = 20) -> None:
+    """Instantiate nested msgspec structs, with and without msgspec.convert."""
+    args = ["--seed", "3", "--b1.a.width", "512"]
+    for config in ((), (tyro.conf.UseMsgspecConvert,)):
+        start = time.perf_counter()
+        for _ in range(n):
+            out = tyro.cli(Model, args=args, config=config)
+        assert out.b1.a.width == 512
+        print(
+            f"{'convert' if config else 'default'}:"
+            f" {(time.perf_counter() - start) / n * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
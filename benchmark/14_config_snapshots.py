@@ -0,0 +1,58 @@
+import dataclasses
+import json
+import pathlib
+import tempfile
+import time
+from typing import Dict, List
+
+import tyro
+
+
+@dataclasses.dataclass(frozen=True)
+class Layer:
+    width: int = 256
+    dropout: float = 0.1
+    activation: str = "gelu"
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    encoder: Layer = Layer()
+    decoder: Layer = Layer()
+    vocabulary: List[str] = dataclasses.field(default_factory=list)
+    weights: Dict[str, float] = dataclasses.field(default_factory=dict)
+    seed: int = 0
+
+
+def main(n: int = 20) -> None:
+    """Load a large base config file, with and without cached snapshots."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "base.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "encoder": {"width": 512},
+                    "vocabulary": [f"token_{i}" for i in range(50_000)],
+                    "weights": {f"w{i}": i / 10 for i in range(10)},
+                }
+            )
+        )
+        args = ["--config", str(path), "--seed", "3"]
+        for use_snapshots in (False, True):
+            start = time.perf_counter()
+            for _ in range(n):
+                out = tyro.extras.config_file_cli(
+                    Config,
+                    args=args,
+                    snapshot_dir=pathlib.Path(tmp) / "snapshots",
+                    use_snapshots=use_snapshots,
+                )
+            assert out.seed == 3 and out.encoder.width == 512
+            print(
+                f"{'snapshots' if use_snapshots else 'no snapshots'}:"
+                f" {(time.perf_counter() - start) / n * 1000:.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
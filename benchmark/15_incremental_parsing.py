@@ -0,0 +1,44 @@
+import dataclasses
+import time
+from typing import List
+
+import tyro
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    lr: float = 1e-3
+    batch_size: int = 32
+    seed: int = 0
+    name: str = "run"
+
+
+def main(n: int = 20) -> None:
+    """Re-parse long command lines after an edit, like live validation in a REPL.
+
+    Editing the first token re-parses every token. Editing the last token only
+    re-parses the tokens after it."""
+    for num_tokens in (100, 1_000, 10_000):
+        prefix = ["--seed", "1", "--name", "x"] * (num_tokens // 4 - 1)
+        parser = tyro.extras.IncrementalParser(Config)
+        for edit in ("first", "last"):
+
+            def make_argv(value: int) -> List[str]:
+                if edit == "first":
+                    return ["--batch-size", str(value), *prefix, "--lr", "0.1"]
+                return ["--lr", "0.1", *prefix, "--batch-size", str(value)]
+
+            # The first parse records checkpoints.
+            parser.parse(make_argv(1))
+            start = time.perf_counter()
+            for i in range(n):
+                out = parser.parse(make_argv(i % 2))
+                assert isinstance(out, Config) and out.batch_size == i % 2
+            print(
+                f"{num_tokens} tokens, {edit} token edited:"
+                f" {(time.perf_counter() - start) / n * 1000:.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
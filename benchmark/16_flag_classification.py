@@ -0,0 +1,50 @@
+import dataclasses
+import time
+from typing import List
+
+from typing_extensions import Annotated
+
+import tyro
+
+# 200 integer fields, plus counters with single-character aliases.
+Config = dataclasses.make_dataclass(
+    "Config",
+    [(f"field_{i}", int, dataclasses.field(default=0)) for i in range(200)]
+    + [
+        (
+            f"count_{ch}",
+            Annotated[
+                tyro.conf.UseCounterAction[int], tyro.conf.arg(aliases=(f"-{ch}",))
+            ],
+            dataclasses.field(default=0),
+        )
+        for ch in "abcdef"
+    ]
+    + [("names", List[str], dataclasses.field(default_factory=list))],
+    frozen=True,
+)
+
+
+def main(n: int = 100_000) -> None:
+    """Classify long argument lists against a large set of flags.
+
+    Each list has `n` tokens: flags spelled with underscores instead of hyphens,
+    clustered short flags, and values for a variable-length argument."""
+    for name, args in (
+        (
+            "--field_i VALUE",
+            [token for i in range(n // 2) for token in (f"--field_{i % 200}", str(i))],
+        ),
+        ("-abcdef", ["-abcdef"] * n),
+        ("--names VALUE...", ["--names", *(f"name{i}" for i in range(n - 1))]),
+    ):
+        start = time.perf_counter()
+        tyro.cli(Config, args=args)
+        print(
+            f"{name} with {len(args)} tokens:"
+            f" {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
@@ -0,0 +1,37 @@
+import contextlib
+import io
+import time
+
+import tyro
+
+
+def main(n: int = 20_000) -> None:
+    """Scale the number of choices in a `Literal` type."""
+    for num_choices in (n // 100, n // 10, n):
+        Choices = tyro.extras.literal_type_from_choices(
+            [f"dataset{i:06d}" for i in range(num_choices)]
+        )
+
+        def train(dataset: Choices = "dataset000000") -> None:  # type: ignore
+            del dataset
+
+        start = time.perf_counter()
+        tyro.cli(train, args=["--dataset", f"dataset{num_choices - 1:06d}"])
+        parse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                tyro.cli(train, args=["--help"])
+            except SystemExit:
+                pass
+        help_time = time.perf_counter() - start
+
+        print(
+            f"{num_choices} choices: parse {parse_time * 1000:.1f}ms,"
+            f" help {help_time * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
@@ -0,0 +1,77 @@
+import contextlib
+import importlib.util
+import io
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+import tyro
+
+
+def _write_config_module(path: pathlib.Path, n: int) -> None:
+    """Write a module containing a config with `n` documented arguments, split
+    into nested groups of 20."""
+    groups_count = max(n // 20, 1)
+    lines = ["import dataclasses", ""]
+    for i in range(groups_count):
+        lines.extend(
+            [
+                "@dataclasses.dataclass",
+                f"class Group{i}:",
+                f'    """Settings for group {i}, which configure one part of the run."""',
+            ]
+        )
+        for j in range(n // groups_count):
+            lines.append(
+                f"    option_{j}: int = {j}"
+                f"  # Option {j} of group {i}. Controls a setting that has a"
+                " fairly long description, which needs to be wrapped."
+            )
+        lines.append("")
+    lines.extend(["@dataclasses.dataclass", "class Config:"])
+    for i in range(groups_count):
+        lines.append(
+            f"    group_{i}: Group{i} = dataclasses.field(default_factory=Group{i})"
+        )
+    path.write_text("\n".join(lines) + "\n")
+
+
+def main(n: int = 1_000, repeats: int = 3) -> None:
+    """Render the helptext of a config with `n` arguments at several terminal
+    widths."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir) / "wide_help_config.py"
+        _write_config_module(path, n)
+        spec = importlib.util.spec_from_file_location("wide_help_config", path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        # Registered so that `inspect` can find the source for docstrings.
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+
+        original_columns = os.environ.get("COLUMNS")
+        try:
+            for width in (60, 80, 120, 200, 300):
+                os.environ["COLUMNS"] = str(width)
+                times = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        try:
+                            tyro.cli(module.Config, args=["--help"])
+                        except SystemExit:
+                            pass
+                    times.append(time.perf_counter() - start)
+                print(f"{n} args, width {width}: help {min(times) * 1000:.1f}ms")
+        finally:
+            if original_columns is None:
+                os.environ.pop("COLUMNS", None)
+            else:
+                os.environ["COLUMNS"] = original_columns
+            sys.modules.pop(spec.name)
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
@@ -0,0 +1,40 @@
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import tyro
+
+
+def main(n: int = 1_000_000) -> None:
+    """Scale the number of elements passed to sequence and dict arguments."""
+    for length in (n // 100, n // 10, n):
+        ints = [str(i) for i in range(length)]
+
+        def ints_main(x: List[int]) -> None:
+            del x
+
+        def tuple_main(x: Tuple[str, ...]) -> None:
+            del x
+
+        def paths_main(x: List[Path]) -> None:
+            del x
+
+        def dict_main(x: Dict[str, int]) -> None:
+            del x
+
+        for name, f, args in (
+            ("List[int]", ints_main, ints),
+            ("Tuple[str, ...]", tuple_main, ints),
+            ("List[Path]", paths_main, ints),
+            ("Dict[str, int]", dict_main, ints[: length - length % 2]),
+        ):
+            start = time.perf_counter()
+            tyro.cli(f, args=["--x", *args])
+            print(
+                f"{name} with {len(args)} elements:"
+                f" {(time.perf_counter() - start) * 1000:.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
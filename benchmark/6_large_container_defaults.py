@@ -0,0 +1,37 @@
+import time
+from typing import List, Optional
+
+import tyro
+
+
+def main(n: int = 1_000_000) -> None:
+    """Scale the size of container defaults, which are inspected when building
+    the CLI."""
+    for length in (n // 100, n // 10, n):
+        floats = [float(i) for i in range(length)]
+        pairs = tuple((i, float(i)) for i in range(length))
+
+        def list_main(x: list = floats) -> None:
+            del x
+
+        def tuple_main(x: tuple = pairs) -> None:
+            del x
+
+        def optional_main(x: Optional[List[float]] = floats) -> None:
+            del x
+
+        for name, f in (
+            ("list", list_main),
+            ("tuple of pairs", tuple_main),
+            ("Optional[List[float]]", optional_main),
+        ):
+            start = time.perf_counter()
+            tyro.cli(f, args=[])
+            print(
+                f"{name} default with {length} elements:"
+                f" {(time.perf_counter() - start) * 1000:.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
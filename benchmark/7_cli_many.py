@@ -0,0 +1,32 @@
+import dataclasses
+import time
+
+import tyro
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    lr: float = 1e-3
+    batch_size: int = 32
+    layers: int = 4
+    name: str = "run"
+
+
+def main(n: int = 10_000) -> None:
+    """Compare parsing many argument lists with `tyro.cli()` in a loop against
+    `tyro.cli_many()`."""
+    argvs = [["--lr", str(i * 1e-5), "--name", f"run-{i}"] for i in range(n)]
+
+    start = time.perf_counter()
+    for argv in argvs:
+        tyro.cli(Config, args=argv)
+    print(f"tyro.cli() loop: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    start = time.perf_counter()
+    for _ in tyro.cli_many(Config, argvs):
+        pass
+    print(f"tyro.cli_many(): {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
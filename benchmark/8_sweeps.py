@@ -0,0 +1,33 @@
+import dataclasses
+import time
+
+import tyro
+
+
+@dataclasses.dataclass(frozen=True)
+class Optimizer:
+    lr: float = 1e-3
+    weight_decay: float = 0.0
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    optimizer: Optimizer
+    seed: int = 0
+    name: str = "run"
+
+
+def main(n: int = 100_000) -> None:
+    """Stream a sweep over `n` configurations."""
+    start = time.perf_counter()
+    count = 0
+    for _ in tyro.cli_sweep(
+        Config,
+        args=["--optimizer.lr", "1e-3,3e-4,1e-4,3e-5", "--seed", f"0..{n // 4 - 1}"],
+    ):
+        count += 1
+    print(f"{count} sweep outputs: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
@@ -0,0 +1,62 @@
+import dataclasses
+import time
+from typing import Literal, Tuple
+
+import tyro
+
+
+@dataclasses.dataclass
+class OptimizerConfig:
+    lr: float = 1e-3
+    """Learning rate."""
+    betas: Tuple[float, float] = (0.9, 0.999)
+    weight_decay: float = 0.0
+    schedule: Literal["cosine", "linear", "constant"] = "cosine"
+    warmup_steps: int = 1000
+
+
+@dataclasses.dataclass
+class Block:
+    attention: OptimizerConfig = dataclasses.field(default_factory=OptimizerConfig)
+    mlp: OptimizerConfig = dataclasses.field(default_factory=OptimizerConfig)
+    enabled: bool = True
+
+
+@dataclasses.dataclass
+class Stage:
+    first: Block = dataclasses.field(default_factory=Block)
+    second: Block = dataclasses.field(default_factory=Block)
+
+
+@dataclasses.dataclass
+class Tower:
+    first: Stage = dataclasses.field(default_factory=Stage)
+    second: Stage = dataclasses.field(default_factory=Stage)
+
+
+@dataclasses.dataclass
+class Model:
+    left: Tower = dataclasses.field(default_factory=Tower)
+    right: Tower = dataclasses.field(default_factory=Tower)
+
+
+@dataclasses.dataclass
+class Ensemble:
+    first: Model = dataclasses.field(default_factory=Model)
+    second: Model = dataclasses.field(default_factory=Model)
+
+
+def main(n: int = 10) -> None:
+    """Build CLIs where the same struct types are used at many locations."""
+    for root, count in ((Stage, 4), (Tower, 8), (Model, 16), (Ensemble, 32)):
+        start = time.perf_counter()
+        for _ in range(n):
+            tyro.cli(root, args=[])
+        print(
+            f"{root.__name__} ({count} optimizer configs):"
+            f" {(time.perf_counter() - start) / n * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    tyro.cli(main)
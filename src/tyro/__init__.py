@@ -6,6 +6,9 @@ __version__ = "1.0.15"
 from . import conf as conf
 from . import constructors as constructors
 from ._cli import cli as cli
+from ._cli import cli_many as cli_many
+from ._cli import cli_sweep as cli_sweep
+from ._errors import ParseErrorEvent as ParseErrorEvent
 from ._settings import _experimental_options as _experimental_options
 from ._singleton import MISSING as MISSING
 from ._singleton import MISSING_NONPROP as MISSING_NONPROP
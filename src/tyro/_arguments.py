@@ -4,7 +4,10 @@ argparse's `add_argument()`."""
 from __future__ import annotations
 
 import collections.abc
+import copy
 import dataclasses
+import enum
+import inspect
 import json
 import shlex
 from functools import cached_property
@@ -12,6 +15,7 @@ from typing import (
     Any,
     Callable,
     Iterable,
+    Iterator,
     Literal,
     Optional,
     Sequence,
@@ -26,13 +30,14 @@ from typing_extensions import get_args, get_origin
 from . import _fields, _settings, _singleton, _strings
 from . import _fmtlib as fmt
 from ._backends import _argparse as argparse
-from ._typing_compat import is_typing_union
+from ._typing_compat import is_typing_literal, is_typing_union
 from .conf import _markers
 from .constructors import (
     ConstructorRegistry,
     PrimitiveTypeInfo,
     UnsupportedTypeAnnotationError,
 )
+from .constructors._primitive_spec import _IndexedTuple
 
 _T = TypeVar("_T")
 
@@ -123,6 +128,11 @@ class ArgumentDefinition:
     extern_prefix: str  # User-facing prefix.
     subcommand_prefix: str  # Prefix for nesting.
     field: _fields.FieldDefinition
+    template: ArgumentDefinition | None = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
+    """Argument that this one was relocated from. Relocated arguments share
+    lowering work that doesn't depend on their prefixes."""
 
     def get_output_key(self) -> str:
         """Get key used for this arg in the parsed output dict."""
@@ -175,10 +185,13 @@ class ArgumentDefinition:
         kwargs = dict(self.lowered.__dict__)  # type: ignore
         kwargs.pop("instance_from_str")
         kwargs.pop("str_from_instance")
+        kwargs.pop("str_from_instance_lazy")
         # `value_tokens` is tyro-internal (used by the native backend for
         # flag-vs-value disambiguation); it is not an argparse add_argument()
         # parameter, so drop it before forwarding.
         kwargs.pop("value_tokens")
+        kwargs.pop("sweepable")
+        kwargs.pop("sweep_choices")
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
         name_or_flags = kwargs.pop("name_or_flags")
 
@@ -235,14 +248,25 @@ class ArgumentDefinition:
                     pass
 
     @cached_property
-    def lowered(self) -> LoweredArgumentDefinition:
-        """Lowered argument definition, generated by applying a sequence of rules."""
+    def _lowered_from_field(self) -> LoweredArgumentDefinition:
+        """Result of the lowering rules that only depend on the field, and not
+        on the argument's prefixes."""
+        if self.template is not None:
+            return self.template._lowered_from_field
+
         # Each rule will mutate the lowered object. This is (unfortunately)
         # much faster than a functional approach.
         lowered = LoweredArgumentDefinition()
         _rule_handle_boolean_flags(self, lowered)
         _rule_apply_primitive_specs(self, lowered)
         _rule_counters(self, lowered)
+        _rule_sweep_syntax(self, lowered)
+        return lowered
+
+    @cached_property
+    def lowered(self) -> LoweredArgumentDefinition:
+        """Lowered argument definition, generated by applying a sequence of rules."""
+        lowered = copy.copy(self._lowered_from_field)
         _rule_generate_helptext(self, lowered)
         _rule_set_name_or_flag_and_dest(self, lowered)
         _rule_positional_special_handling(self, lowered)
@@ -330,6 +354,7 @@ class LoweredArgumentDefinition:
     # mixed-type tuples.
     instance_from_str: Optional[Callable] = None
     str_from_instance: Optional[Callable] = None
+    str_from_instance_lazy: Optional[Callable] = None
 
     def is_fixed(self) -> bool:
         """If the instantiator is set to `None`, even after all argument
@@ -338,6 +363,12 @@ class LoweredArgumentDefinition:
         field default."""
         return self.instance_from_str is None
 
+    # Whether sweep syntax can be used with this argument. See `tyro.cli_sweep()`.
+    sweepable: bool = False
+    # Choices that swept values are checked against. `choices` is cleared for
+    # sweepable arguments, since tokens like `a,b` aren't choices themselves.
+    sweep_choices: Optional[Tuple[str, ...]] = None
+
     # From here on out, all fields correspond 1:1 to inputs to argparse's
     # add_argument() method.
     name_or_flags: Tuple[str, ...] = ()
@@ -434,7 +465,7 @@ def _value_choice_tokens(typ: Any, markers: set[_markers.Marker]) -> Tuple[str,
         and spec.choices is not None
     ):
         return spec.choices
-    return tuple(
+    return _IndexedTuple(
         dict.fromkeys(
             token
             for arg_type in get_args(typ)
@@ -479,6 +510,7 @@ def _rule_apply_primitive_specs(
             cast(type, arg.field.type),
             arg.field.markers,
             exclude_markers=exclude_markers,
+            default=arg.field.default,
         )
     )
     if isinstance(spec, UnsupportedTypeAnnotationError):
@@ -603,6 +635,7 @@ def _rule_apply_primitive_specs(
 
         lowered.instance_from_str = append_instantiator
         lowered.str_from_instance = spec.str_from_instance
+        lowered.str_from_instance_lazy = spec._str_from_instance_lazy
         lowered.choices = spec.choices
         lowered.value_tokens = _value_choice_tokens(arg.field.type, arg.field.markers)
         lowered.nargs = spec.nargs if not isinstance(spec.nargs, tuple) else "*"
@@ -613,6 +646,7 @@ def _rule_apply_primitive_specs(
     else:
         lowered.instance_from_str = spec.instance_from_str
         lowered.str_from_instance = spec.str_from_instance
+        lowered.str_from_instance_lazy = spec._str_from_instance_lazy
         lowered.choices = spec.choices
         lowered.value_tokens = _value_choice_tokens(arg.field.type, arg.field.markers)
         lowered.nargs = spec.nargs if not isinstance(spec.nargs, tuple) else "*"
@@ -644,6 +678,32 @@ def _rule_counters(
         return
 
 
+def _rule_sweep_syntax(
+    arg: ArgumentDefinition,
+    lowered: LoweredArgumentDefinition,
+) -> None:
+    """Mark numeric and choice-valued arguments as sweepable, when sweep syntax
+    is enabled."""
+    if (
+        _markers._SWEEP_SYNTAX not in arg.field.markers
+        or lowered.is_fixed()
+        or lowered.action is not None
+        or lowered.nargs not in (1, "?")
+    ):
+        return
+    typ = arg.field.type_stripped
+    if typ in (int, float):
+        lowered.sweepable = True
+    elif is_typing_literal(get_origin(typ)) or (
+        inspect.isclass(typ) and issubclass(typ, enum.Enum)
+    ):
+        if lowered.choices is None:
+            return
+        lowered.sweepable = True
+        lowered.sweep_choices = lowered.choices
+        lowered.choices = None
+
+
 def _rule_generate_helptext(
     arg: ArgumentDefinition,
     lowered: LoweredArgumentDefinition,
@@ -743,6 +803,33 @@ def _rule_apply_argconf(
         lowered.name_or_flags = arg.field.argconf.aliases + lowered.name_or_flags
 
 
+_MAX_DEFAULT_ELEMENTS = 16
+"""Container defaults with more elements than this are abbreviated in helptext."""
+
+_MAX_DEFAULT_CHARS = 400
+"""Container defaults are abbreviated in helptext after this many characters."""
+
+
+def _bounded_default_label(count: int, element_strings: Iterator[list[str]]) -> str:
+    """Format the string arguments of a container default for helptext. At most
+    `_MAX_DEFAULT_ELEMENTS` elements are stringified, and the rest are
+    summarized."""
+    parts: list[str] = []
+    shown = 0
+    length = 0
+    for strings in element_strings:
+        shown += 1
+        if len(strings) > 0:
+            part = " ".join(map(shlex.quote, strings))
+            parts.append(part)
+            length += len(part) + 1
+        if shown >= _MAX_DEFAULT_ELEMENTS or length >= _MAX_DEFAULT_CHARS:
+            break
+    if count > shown:
+        parts.append(f"[... {count - shown:,} more]")
+    return " ".join(parts)
+
+
 def generate_argument_helptext(
     arg: ArgumentDefinition, lowered: LoweredArgumentDefinition, compact: bool = False
 ) -> fmt._Text:
@@ -765,6 +852,7 @@ def generate_argument_helptext(
     if not lowered.required:
         # Get the default value.
         # Note: lowered.default is the stringified version!
+        default_label: str | None = None
         if (
             arg.is_positional()
             and lowered.nargs == "*"
@@ -788,6 +876,16 @@ def generate_argument_helptext(
             default = arg.field.default
         elif arg.field.default is _singleton.EXCLUDE_FROM_CALL:
             default = None
+        elif (
+            lowered.str_from_instance_lazy is not None
+            and arg.field.argconf.constructor_factory is None
+        ):
+            # Containers are stringified lazily, which bounds the cost of
+            # rendering large defaults.
+            default = arg.field.default
+            default_label = _bounded_default_label(
+                *lowered.str_from_instance_lazy(default)
+            )
         else:
             # Standard cases where we convert to a string representation.
             default = (
@@ -797,7 +895,9 @@ def generate_argument_helptext(
             )
 
         # Get the default value label.
-        if arg.field.argconf.constructor_factory is not None:
+        if default_label is not None:
+            pass
+        elif arg.field.argconf.constructor_factory is not None:
             default_label = (
                 str(default)
                 if arg.field.type_stripped is not json.loads
@@ -811,7 +911,9 @@ def generate_argument_helptext(
             # In all cases, we want to display (default: 0 1 2 3), for consistency with
             # the format that argparse expects when we set nargs.
             assert default is not None
-            default_label = " ".join(map(shlex.quote, map(str, default)))
+            default_label = _bounded_default_label(
+                len(default), ([str(x)] for x in default)
+            )
         else:
             default_label = str(default)
 
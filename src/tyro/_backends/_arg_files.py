@@ -0,0 +1,72 @@
+"""Expansion of ``@path`` argument files. Shared by the tyro and argparse
+backends, and enabled via :data:`tyro.conf.UseArgFiles`."""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Iterable, Iterator
+
+from . import _tyro_help_formatting
+
+
+def expand_arg_files(
+    args: Iterable[str],
+    *,
+    prog: str,
+    console_outputs: bool,
+    add_help: bool,
+) -> list[str]:
+    """Replace each ``@path`` argument with the arguments in ``path``.
+
+    Each line of an argument file is read as one argument, which matches
+    argparse's default ``convert_arg_line_to_args()``. Files are read one line
+    at a time, so a file's contents are never held in memory twice. Argument
+    files can reference other argument files, and ``@-`` reads arguments from
+    stdin.
+    """
+    # Real paths of the argument files currently being expanded. Used to catch
+    # files that (directly or indirectly) include themselves.
+    active_paths: list[str] = []
+
+    def _lines(f: Iterable[str]) -> Iterator[str]:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+    def _expand(args: Iterable[str]) -> Iterator[str]:
+        for arg in args:
+            if len(arg) <= 1 or not arg.startswith("@"):
+                yield arg
+            elif arg == "@-":
+                yield from _expand(_lines(sys.stdin))
+            else:
+                path = arg[1:]
+                real_path = os.path.realpath(path)
+                if real_path in active_paths:
+                    _tyro_help_formatting.error_and_exit(
+                        "Recursive argument file",
+                        f"Argument file {path!r} includes itself.",
+                        prog=prog,
+                        console_outputs=console_outputs,
+                        add_help=add_help,
+                    )
+                try:
+                    f = open(
+                        path,
+                        encoding=sys.getfilesystemencoding(),
+                        errors=sys.getfilesystemencodeerrors(),
+                    )
+                except OSError as e:
+                    _tyro_help_formatting.error_and_exit(
+                        "Unreadable argument file",
+                        f"Could not read argument file {path!r}: {e.strerror}.",
+                        prog=prog,
+                        console_outputs=console_outputs,
+                        add_help=add_help,
+                    )
+                active_paths.append(real_path)
+                with f:
+                    yield from _expand(_lines(f))
+                active_paths.pop()
+
+    return list(_expand(args))
@@ -589,7 +589,7 @@ def add_subparsers_to_leaves(
     return MaterializedSubparsersTree(
         subparser_spec=dataclasses.replace(
             root.subparser_spec,
-            required=root.subparser_spec.required or leaf.required,
+            _required=root.subparser_spec.required or leaf.required,
         ),
         parser_tree_from_name=new_parser_trees,
     )
@@ -67,6 +67,17 @@ class TyroArgumentParser(argparse.ArgumentParser, argparse_sys.ArgumentParser):
 
         if is_missing(value):
             return
+        if action.choices is not None and value not in action.choices:
+            # Large choice sets are truncated, like in the tyro backend.
+            from .. import _errors
+
+            choices_text, close_matches = _errors._describe_choices(
+                tuple(action.choices), value
+            )
+            msg = f"invalid choice: {value!r} (choose from {choices_text})"
+            if close_matches:
+                msg += f"; did you mean {', '.join(map(repr, close_matches))}?"
+            raise argparse.ArgumentError(action, msg)
         return super()._check_value(action, value)
 
     @override
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import dataclasses
-import difflib
 import inspect
 import os
 import shlex
@@ -11,15 +9,19 @@ import shutil
 import sys
 from typing import TYPE_CHECKING, Callable, NoReturn
 
-from tyro.conf._markers import CascadeSubcommandArgs, ShowSourcePath
+from tyro.conf._markers import ShowSourcePath
 from tyro.conf._mutex_group import _MutexGroupConfig
 
 from .. import _fmtlib as fmt
-from .. import _settings, conf
-from ..constructors._primitive_spec import UnsupportedTypeAnnotationError
+from .. import _settings
+from ._similar_args import (
+    OptionStringIndex,
+    _ArgumentInfo,
+    recursive_arg_search,
+    similar_arguments,
+)
 
 if TYPE_CHECKING:
-    from .._arguments import ArgumentDefinition
     from .._parsers import ParserSpecification, SubparsersSpecification
 
 
@@ -343,126 +345,6 @@ def format_help(
     return out
 
 
-def recursive_arg_search(
-    args: list[str],
-    parser_spec: ParserSpecification,
-    prog: str,
-    unrecognized_arguments: set[str],
-) -> tuple[list[_ArgumentInfo], bool, bool]:
-    """Recursively search for arguments in a ParserSpecification. Used for error message
-    printing.
-
-    Returns a list of arguments, whether the parser has subcommands or not, and -- if
-    `unrecognized_arguments` is passed in --- whether an unrecognized argument exists
-    under a different subparser.
-
-    Args:
-        args: Arguments being parsed. Used for heuristics on subcommands.
-        parser_spec: Argument parser specification.
-        subcommands: Prog corresponding to parser_spec.
-        unrecognized_arguments: Used for same_exists return value.
-    """
-    # Argument name => subcommands it came from.
-    arguments: list[_ArgumentInfo] = []
-    has_subcommands = False
-    same_exists = False
-
-    def _recursive_arg_search(
-        parser_spec: ParserSpecification,
-        prog: str,
-        subcommand_match_score: float,
-    ) -> None:
-        """Find all possible arguments that could have been passed in."""
-
-        # When tyro.conf.CascadeSubcommandArgs is turned on, arguments will
-        # only appear in the help message for "leaf" subparsers.
-        help_flag = (
-            " (other subcommands) --help"
-            if CascadeSubcommandArgs in parser_spec.markers
-            and len(parser_spec.subparsers_from_intern_prefix) > 0
-            else " --help"
-        )
-        for arg in parser_spec.args:
-            if arg.is_positional() or arg.lowered.is_fixed():
-                # Skip positional arguments.
-                continue
-
-            # Skip suppressed arguments.
-            if conf.Suppress in arg.field.markers or (
-                conf.SuppressFixed in arg.field.markers
-                and conf.Fixed in arg.field.markers
-            ):
-                continue
-
-            option_strings = arg.lowered.name_or_flags
-
-            # Handle actions, eg BooleanOptionalAction will map ("--flag",) to
-            # ("--flag", "--no-flag"). Short flags (like -f) cannot be inverted.
-            if arg.lowered.action == "boolean_optional_action":
-                from .._arguments import flag_to_inverse
-
-                inverted = tuple(
-                    inv
-                    for option in option_strings
-                    if (inv := flag_to_inverse(option)) is not None
-                )
-                option_strings = option_strings + inverted
-
-            # Evaluate lazy help if callable.
-            help_text = arg.lowered.help
-            if callable(help_text):
-                help_text = help_text()
-
-            arguments.append(
-                _ArgumentInfo(
-                    # Currently doesn't handle actions well, eg boolean optional
-                    # arguments.
-                    arg,
-                    option_strings=option_strings,
-                    metavar=arg.lowered.metavar,
-                    usage_hint=prog + help_flag,
-                    help=help_text,
-                    subcommand_match_score=subcommand_match_score,
-                )
-            )
-
-            # An unrecognized argument.
-            nonlocal same_exists
-            if not same_exists and any(
-                map(lambda x: x in unrecognized_arguments, arg.lowered.name_or_flags)
-            ):
-                same_exists = True
-
-        # Check subparsers from the parser spec's frontier.
-        if len(parser_spec.subparsers_from_intern_prefix) > 0:
-            nonlocal has_subcommands
-            has_subcommands = True
-            for subparser_spec in parser_spec.subparsers_from_intern_prefix.values():
-                for (
-                    subparser_name,
-                    child_parser_spec,
-                ) in subparser_spec.parser_from_name.items():
-                    child_spec = child_parser_spec.evaluate()
-                    # Error should have been caught earlier.
-                    assert not isinstance(child_spec, UnsupportedTypeAnnotationError), (
-                        "Unexpected UnsupportedTypeAnnotationError in backend"
-                    )
-                    _recursive_arg_search(
-                        child_spec,
-                        prog + " " + subparser_name,
-                        # Leaky (!!) heuristic for if this subcommand is matched or not.
-                        subcommand_match_score=subcommand_match_score
-                        + (1 if subparser_name in args else -0.001),
-                    )
-
-        for child in parser_spec.child_from_prefix.values():
-            _recursive_arg_search(child, prog, subcommand_match_score)
-
-    _recursive_arg_search(parser_spec, prog, 0)
-
-    return arguments, has_subcommands, same_exists
-
-
 def unrecognized_args_error(
     prog: str,
     unrecognized_args_and_progs: list[tuple[str, str]],
@@ -505,59 +387,19 @@ def unrecognized_args_error(
         )
 
     # Show similar arguments for keyword options.
+    option_string_index = OptionStringIndex(
+        option_string
+        for arg_info in arguments
+        for option_string in arg_info.option_strings
+    )
     for unrecognized_argument in unrecognized_arguments:
-        # Sort arguments by similarity.
-        scored_arguments: list[tuple[_ArgumentInfo, float]] = []
-        for arg_info in arguments:
-            # Compute a score for each argument.
-            assert unrecognized_argument.startswith("--")
-
-            def get_score(option_string: str) -> float:
-                if option_string.endswith(
-                    unrecognized_argument[2:]
-                ) or option_string.startswith(unrecognized_argument[2:]):
-                    return 0.9
-                elif len(unrecognized_argument) >= 4 and all(
-                    map(
-                        lambda part: part in option_string,
-                        unrecognized_argument[2:].split("."),
-                    )
-                ):
-                    return 0.9
-                else:
-                    return difflib.SequenceMatcher(
-                        a=unrecognized_argument, b=option_string
-                    ).ratio()
-
-            scored_arguments.append(
-                (arg_info, max(map(get_score, arg_info.option_strings)))
-            )
-
         # Add information about similar arguments.
         prev_arg_option_strings: tuple[str, ...] | None = None
         show_arguments: list[_ArgumentInfo] = []
         unique_counter = 0
-        for arg_info, score in (
-            # Sort scores greatest to least.
-            sorted(
-                scored_arguments,
-                key=lambda arg_score: (
-                    # Highest scores first.
-                    -arg_score[1],
-                    # Prefer arguments available in the currently specified
-                    # subcommands.
-                    -arg_score[0].subcommand_match_score,
-                    # Cluster by flag name, metavar, usage hint, help message.
-                    arg_score[0].option_strings[0],
-                    # `or ""` to handle None values in sorting.
-                    arg_score[0].metavar or "",
-                    arg_score[0].usage_hint,
-                    arg_score[0].help or "",
-                ),
-            )
+        for arg_info, score in similar_arguments(
+            unrecognized_argument, arguments, option_string_index
         ):
-            if score < 0.8:
-                break
             if (
                 score < 0.9
                 and unique_counter >= 3
@@ -782,14 +624,3 @@ def error_and_exit(
             flush=True,
         )
     sys.exit(2)
-
-
-@dataclasses.dataclass(frozen=True)
-class _ArgumentInfo:
-    arg: ArgumentDefinition
-    option_strings: tuple[str, ...]
-    metavar: str | None
-    usage_hint: str
-    help: str | None
-    subcommand_match_score: float
-    """Priority value used when an argument is in the current subcommand tree."""
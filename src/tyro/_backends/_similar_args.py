@@ -0,0 +1,310 @@
+"""Argument search and similarity scoring for unrecognized-argument errors.
+Shared by the tyro and argparse backends."""
+
+from __future__ import annotations
+
+import dataclasses
+import difflib
+import itertools
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable
+
+from tyro.conf._markers import CascadeSubcommandArgs
+
+from .. import conf
+from ..constructors._primitive_spec import UnsupportedTypeAnnotationError
+
+if TYPE_CHECKING:
+    from .._arguments import ArgumentDefinition
+    from .._parsers import ParserSpecification
+
+
+SIMILARITY_THRESHOLD = 0.8
+"""Arguments scoring below this are never suggested."""
+
+MAX_LAZY_SUBPARSERS = 32
+"""Maximum number of unevaluated subparsers that are evaluated while searching
+for arguments. Subparsers that were already evaluated are always searched."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _ArgumentInfo:
+    arg: ArgumentDefinition
+    option_strings: tuple[str, ...]
+    metavar: str | None
+    usage_hint: str
+    subcommand_match_score: float
+    """Priority value used when an argument is in the current subcommand tree."""
+
+    @cached_property
+    def help(self) -> str | None:
+        """Helptext for the argument. Computed lazily, since most arguments
+        that are searched are never displayed."""
+        help_text = self.arg.lowered.help
+        if callable(help_text):
+            help_text = help_text()
+        return help_text
+
+
+def recursive_arg_search(
+    args: list[str],
+    parser_spec: ParserSpecification,
+    prog: str,
+    unrecognized_arguments: set[str],
+) -> tuple[list[_ArgumentInfo], bool, bool]:
+    """Recursively search for arguments in a ParserSpecification. Used for error message
+    printing.
+
+    Returns a list of arguments, whether the parser has subcommands or not, and -- if
+    `unrecognized_arguments` is passed in --- whether an unrecognized argument exists
+    under a different subparser.
+
+    Args:
+        args: Arguments being parsed. Used for heuristics on subcommands.
+        parser_spec: Argument parser specification.
+        subcommands: Prog corresponding to parser_spec.
+        unrecognized_arguments: Used for same_exists return value.
+    """
+    # Argument name => subcommands it came from.
+    arguments: list[_ArgumentInfo] = []
+    has_subcommands = False
+    same_exists = False
+    lazy_budget = MAX_LAZY_SUBPARSERS
+
+    def _recursive_arg_search(
+        parser_spec: ParserSpecification,
+        prog: str,
+        subcommand_match_score: float,
+    ) -> None:
+        """Find all possible arguments that could have been passed in."""
+
+        # When tyro.conf.CascadeSubcommandArgs is turned on, arguments will
+        # only appear in the help message for "leaf" subparsers.
+        help_flag = (
+            " (other subcommands) --help"
+            if CascadeSubcommandArgs in parser_spec.markers
+            and len(parser_spec.subparsers_from_intern_prefix) > 0
+            else " --help"
+        )
+        for arg in parser_spec.args:
+            if arg.is_positional() or arg.lowered.is_fixed():
+                # Skip positional arguments.
+                continue
+
+            # Skip suppressed arguments.
+            if conf.Suppress in arg.field.markers or (
+                conf.SuppressFixed in arg.field.markers
+                and conf.Fixed in arg.field.markers
+            ):
+                continue
+
+            option_strings = arg.lowered.name_or_flags
+
+            # Handle actions, eg BooleanOptionalAction will map ("--flag",) to
+            # ("--flag", "--no-flag"). Short flags (like -f) cannot be inverted.
+            if arg.lowered.action == "boolean_optional_action":
+                from .._arguments import flag_to_inverse
+
+                inverted = tuple(
+                    inv
+                    for option in option_strings
+                    if (inv := flag_to_inverse(option)) is not None
+                )
+                option_strings = option_strings + inverted
+
+            arguments.append(
+                _ArgumentInfo(
+                    # Currently doesn't handle actions well, eg boolean optional
+                    # arguments.
+                    arg,
+                    option_strings=option_strings,
+                    metavar=arg.lowered.metavar,
+                    usage_hint=prog + help_flag,
+                    subcommand_match_score=subcommand_match_score,
+                )
+            )
+
+            # An unrecognized argument.
+            nonlocal same_exists
+            if not same_exists and any(
+                map(lambda x: x in unrecognized_arguments, arg.lowered.name_or_flags)
+            ):
+                same_exists = True
+
+        # Check subparsers from the parser spec's frontier.
+        if len(parser_spec.subparsers_from_intern_prefix) > 0:
+            nonlocal has_subcommands
+            has_subcommands = True
+            for subparser_spec in parser_spec.subparsers_from_intern_prefix.values():
+                for (
+                    subparser_name,
+                    child_parser_spec,
+                ) in subparser_spec.parser_from_name.items():
+                    # Evaluating every subparser in a large tree can take
+                    # seconds, so only a bounded number of unevaluated subparsers
+                    # are searched.
+                    nonlocal lazy_budget
+                    if child_parser_spec._cached is None:
+                        if lazy_budget == 0:
+                            continue
+                        lazy_budget -= 1
+                    child_spec = child_parser_spec.evaluate()
+                    # Error should have been caught earlier.
+                    assert not isinstance(child_spec, UnsupportedTypeAnnotationError), (
+                        "Unexpected UnsupportedTypeAnnotationError in backend"
+                    )
+                    _recursive_arg_search(
+                        child_spec,
+                        prog + " " + subparser_name,
+                        # Leaky (!!) heuristic for if this subcommand is matched or not.
+                        subcommand_match_score=subcommand_match_score
+                        + (1 if subparser_name in args else -0.001),
+                    )
+
+        for child in parser_spec.child_from_prefix.values():
+            _recursive_arg_search(child, prog, subcommand_match_score)
+
+    _recursive_arg_search(parser_spec, prog, 0)
+
+    return arguments, has_subcommands, same_exists
+
+
+class OptionStringIndex:
+    """Index over the unique option strings of a set of arguments.
+
+    Large CLIs often repeat the same option strings across many subcommands, and
+    most option strings are nowhere near the length of a typo. We score each
+    unique string once, and only run `difflib.SequenceMatcher` on strings whose
+    length and character counts leave it able to reach the threshold. Both
+    filters are exact upper bounds on `SequenceMatcher.ratio()`, so scores are
+    identical to scoring every option string.
+
+    Substring matches are found through an index of the 1-, 2-, and 3-grams of
+    each option string. Only strings that contain every n-gram of the
+    unrecognized argument's parts are checked."""
+
+    def __init__(self, option_strings: Iterable[str]) -> None:
+        self._option_strings = tuple(dict.fromkeys(option_strings))
+        self._from_length: dict[int, list[str]] = {}
+        self._from_ngram: dict[str, set[str]] = {}
+        for option_string in self._option_strings:
+            self._from_length.setdefault(len(option_string), []).append(option_string)
+            for n in (1, 2, 3):
+                for i in range(len(option_string) - n + 1):
+                    self._from_ngram.setdefault(option_string[i : i + n], set()).add(
+                        option_string
+                    )
+
+    def _containing(self, parts: list[str]) -> Iterable[str]:
+        """Option strings that may contain every part as a substring."""
+        postings: list[set[str]] = []
+        for part in parts:
+            n = min(3, len(part))
+            for i in range(len(part) - n + 1) if n > 0 else ():
+                posting = self._from_ngram.get(part[i : i + n])
+                if posting is None:
+                    return ()
+                postings.append(posting)
+        if len(postings) == 0:
+            return self._option_strings
+        postings.sort(key=len)
+        out = set(postings[0])
+        for posting in postings[1:]:
+            out &= posting
+            if len(out) == 0:
+                break
+        return out
+
+    def scores(self, unrecognized_argument: str) -> dict[str, float]:
+        """Scores for every indexed option string that reaches
+        `SIMILARITY_THRESHOLD`."""
+        assert unrecognized_argument.startswith("--")
+        body = unrecognized_argument[2:]
+        parts = body.split(".")
+
+        out: dict[str, float] = {}
+        # Each condition below implies that every part is a substring.
+        for option_string in self._containing(parts):
+            if (
+                option_string.endswith(body)
+                or option_string.startswith(body)
+                or (
+                    len(unrecognized_argument) >= 4
+                    and all(part in option_string for part in parts)
+                )
+            ):
+                out[option_string] = 0.9
+
+        matcher = difflib.SequenceMatcher(a=unrecognized_argument)
+        length_a = len(unrecognized_argument)
+        for length_b, option_strings in self._from_length.items():
+            # Same bound as `SequenceMatcher.real_quick_ratio()`.
+            if 2.0 * min(length_a, length_b) / (length_a + length_b) < (
+                SIMILARITY_THRESHOLD
+            ):
+                continue
+            for option_string in option_strings:
+                if option_string in out:
+                    continue
+                matcher.set_seq2(option_string)
+                if matcher.quick_ratio() < SIMILARITY_THRESHOLD:
+                    continue
+                ratio = matcher.ratio()
+                if ratio >= SIMILARITY_THRESHOLD:
+                    out[option_string] = ratio
+        return out
+
+
+def similar_arguments(
+    unrecognized_argument: str,
+    arguments: list[_ArgumentInfo],
+    index: OptionStringIndex,
+) -> list[tuple[_ArgumentInfo, float]]:
+    """Arguments similar to an unrecognized one, paired with their scores and
+    sorted from most to least similar."""
+    score_from_option_string = index.scores(unrecognized_argument)
+    scored_arguments: list[tuple[_ArgumentInfo, float]] = []
+    for arg_info in arguments:
+        score = max(
+            (
+                score_from_option_string[option_string]
+                for option_string in arg_info.option_strings
+                if option_string in score_from_option_string
+            ),
+            default=None,
+        )
+        if score is not None:
+            scored_arguments.append((arg_info, score))
+
+    # Sort without the helptext first: it is only a final tie-breaker, and
+    # generating it for every candidate is expensive.
+    scored_arguments.sort(
+        key=lambda arg_score: (
+            # Highest scores first.
+            -arg_score[1],
+            # Prefer arguments available in the currently specified
+            # subcommands.
+            -arg_score[0].subcommand_match_score,
+            # Cluster by flag name, metavar, usage hint, help message.
+            arg_score[0].option_strings[0],
+            # `or ""` to handle None values in sorting.
+            arg_score[0].metavar or "",
+            arg_score[0].usage_hint,
+        )
+    )
+    out: list[tuple[_ArgumentInfo, float]] = []
+    for _, group in itertools.groupby(
+        scored_arguments,
+        key=lambda arg_score: (
+            arg_score[1],
+            arg_score[0].subcommand_match_score,
+            arg_score[0].option_strings[0],
+            arg_score[0].metavar or "",
+            arg_score[0].usage_hint,
+        ),
+    ):
+        tied = list(group)
+        if len(tied) > 1:
+            tied.sort(key=lambda arg_score: arg_score[0].help or "")
+        out.extend(tied)
+    return out
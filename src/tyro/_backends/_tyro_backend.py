@@ -7,7 +7,10 @@ with many subcommands.
 
 from __future__ import annotations
 
+import bisect
 import itertools
+import operator
+import os
 import sys
 import warnings
 from collections import deque
@@ -96,6 +99,14 @@ def _blocks_value_consumption(token: str, kwarg_map: "KwargMap") -> bool:
     )
 
 
+def _normalize_flag(flag: str) -> str:
+    """Swap the delimiters of a long flag, like `--foo_bar` -> `--foo-bar`.
+    Other flags are returned unchanged."""
+    if len(flag) > 2 and flag.startswith("--"):
+        return "--" + _strings.swap_delimiters(flag[2:])
+    return flag
+
+
 class KwargMap:
     """Look-up table for tracking keyword arguments. Due to aliases, each
     argument can have multiple string representations, like -v and
@@ -110,6 +121,16 @@ class KwargMap:
         # positional arguments.
         self._arg_from_dest: dict[str | None, _arguments.ArgumentDefinition] = {}
 
+        # Precomputed when arguments are pushed, so tokens can be classified
+        # without string manipulation. `_normalized_from_flag` maps each
+        # registered kwarg, as well as the spelling of each long kwarg that
+        # uses the other delimiter (`--foo_bar` for `--foo-bar`), to the result
+        # of `_normalize_flag()`. Tokens that mix delimiters are missing from
+        # the index and are normalized on lookup.
+        self._normalized_from_flag: dict[str, str] = {}
+        self._short_from_char: dict[str, tuple[str, _arguments.ArgumentDefinition]] = {}
+        self._other_delimiter = "_" if _strings.get_delimiter() == "-" else "-"
+
     def args(self) -> Iterable[_arguments.ArgumentDefinition]:
         return self._arg_from_dest.values()
 
@@ -124,6 +145,9 @@ class KwargMap:
         for kwarg in arg.lowered.name_or_flags:
             assert kwarg not in self._arg_from_kwarg, "Name conflict"
             self._arg_from_kwarg[kwarg] = arg
+            self._index_kwarg(kwarg)
+            if len(kwarg) == 2 and kwarg[0] == "-" and kwarg[1] != "-":
+                self._short_from_char[kwarg[1]] = (kwarg, arg)
 
             if arg.lowered.action == "store_true":
                 self._value_from_boolean_flag[kwarg] = True
@@ -137,15 +161,56 @@ class KwargMap:
                     self._value_from_boolean_flag[inv_kwarg] = False
                     assert inv_kwarg not in self._arg_from_kwarg, "Name conflict"
                     self._arg_from_kwarg[inv_kwarg] = arg
+                    self._index_kwarg(inv_kwarg)
+
+    def _spellings(self, kwarg: str) -> tuple[str, ...]:
+        """The kwarg, and for long kwargs, its spelling with the other
+        delimiter."""
+        if len(kwarg) > 2 and kwarg.startswith("--"):
+            delimiter = "-" if self._other_delimiter == "_" else "_"
+            return (kwarg, "--" + kwarg[2:].replace(delimiter, self._other_delimiter))
+        return (kwarg,)
+
+    def _index_kwarg(self, kwarg: str) -> None:
+        for spelling in self._spellings(kwarg):
+            # The other spelling is only added if it normalizes back to this
+            # kwarg. Other spellings are handled by the fallback in
+            # `contains_normalized()`.
+            normalized = _normalize_flag(spelling)
+            if kwarg in (spelling, normalized):
+                self._normalized_from_flag[spelling] = normalized
+
+    def _unindex_kwarg(self, kwarg: str) -> None:
+        # Spellings can be shared by kwargs that differ only in delimiters, so
+        # an entry is kept while it still matches a remaining kwarg.
+        for spelling in self._spellings(kwarg):
+            normalized = self._normalized_from_flag.get(spelling)
+            if (
+                normalized is not None
+                and spelling not in self._arg_from_kwarg
+                and normalized not in self._arg_from_kwarg
+            ):
+                del self._normalized_from_flag[spelling]
+
+    def normalize_flag(self, flag: str) -> str:
+        """Normalize the delimiters of a flag, like `_normalize_flag()`. Looked
+        up in the index for registered flags."""
+        normalized = self._normalized_from_flag.get(flag)
+        return _normalize_flag(flag) if normalized is None else normalized
 
     def contains_normalized(self, token_key: str) -> bool:
         """Check if a flag key matches a known kwarg, considering
         underscore/hyphen normalization for long flags."""
-        if token_key in self._arg_from_kwarg:
+        if token_key in self._normalized_from_flag:
             return True
-        if len(token_key) > 2 and token_key.startswith("--"):
-            normalized = "--" + _strings.swap_delimiters(token_key[2:])
-            return normalized in self._arg_from_kwarg
+        # A token without the other delimiter normalizes to itself, so it
+        # can only match exactly.
+        if (
+            len(token_key) > 2
+            and token_key.startswith("--")
+            and self._other_delimiter in token_key[2:]
+        ):
+            return _normalize_flag(token_key) in self._arg_from_kwarg
         return False
 
     def expand_short_cluster(self, token: str) -> list[str] | None:
@@ -167,10 +232,11 @@ class KwargMap:
             return None
         expanded: list[str] = []
         for i, ch in enumerate(token[1:], start=1):
-            arg = self._arg_from_kwarg.get("-" + ch)
-            if arg is None:
+            short = self._short_from_char.get(ch)
+            if short is None:
                 return None
-            expanded.append("-" + ch)
+            kwarg, arg = short
+            expanded.append(kwarg)
             if arg.lowered.action not in _FLAG_ACTIONS:
                 # Value-taking short: the rest of the token is its value. A
                 # single `=` immediately after the value-taking flag character
@@ -200,6 +266,9 @@ class KwargMap:
         self._arg_from_dest.pop(arg.get_output_key())
         for kwarg_ in arg.lowered.name_or_flags:
             self._arg_from_kwarg.pop(kwarg_)
+            self._unindex_kwarg(kwarg_)
+            if len(kwarg_) == 2 and kwarg_[0] == "-" and kwarg_[1] != "-":
+                self._short_from_char.pop(kwarg_[1])
             if arg.lowered.action == "store_true":
                 self._value_from_boolean_flag.pop(kwarg_)
             elif arg.lowered.action == "store_false":
@@ -210,9 +279,143 @@ class KwargMap:
                 self._value_from_boolean_flag.pop(kwarg_)
                 if inv_kwarg_ is not None:
                     self._arg_from_kwarg.pop(inv_kwarg_)
+                    self._unindex_kwarg(inv_kwarg_)
                     self._value_from_boolean_flag.pop(inv_kwarg_)
         return arg
 
+    def copy(self) -> KwargMap:
+        out = KwargMap()
+        out._arg_from_kwarg = dict(self._arg_from_kwarg)
+        out._value_from_boolean_flag = dict(self._value_from_boolean_flag)
+        out._arg_from_dest = dict(self._arg_from_dest)
+        out._normalized_from_flag = dict(self._normalized_from_flag)
+        out._short_from_char = dict(self._short_from_char)
+        out._other_delimiter = self._other_delimiter
+        return out
+
+
+@dataclass(frozen=True)
+class _LevelSnapshot:
+    """State at the start of the token loop for one parser level. This is shared
+    by all checkpoints recorded in the loop. Containers are copies, since they
+    are modified after the loop."""
+
+    parser_spec: _parsers.ParserSpecification
+    local_prog: str
+    # Missing required arguments for parent levels. These are reported after
+    # this level is parsed.
+    pending_missing_args: tuple[list[_tyro_help_formatting.ArgWithContext], ...]
+    kwarg_map: KwargMap
+    positional_args: tuple[_arguments.ArgumentDefinition, ...]
+    subparser_frontier: dict[str, _parsers.SubparsersSpecification]
+    subparser_implicit_selectors: dict[str, set[str] | None]
+    implicit_arg_from_subcommand_name: dict[str, tuple[str, str]]
+    arg_ctx_from_dest: dict[str, _parsers.ArgWithContext]
+    required_mutex_args: dict[
+        conf._mutex_group._MutexGroupConfig, list[_arguments.ArgumentDefinition]
+    ]
+
+
+@dataclass(frozen=True)
+class _Checkpoint:
+    """Parser state before the token at `position` is consumed."""
+
+    level: _LevelSnapshot
+    position: int
+    # Lists are only appended to while parsing, so they are recorded as a
+    # reference and a length instead of being copied. See `_snapshot_output()`.
+    output: dict[str | None, tuple[Any, int]]
+    unknown_args_and_progs: list[tuple[str, str]]
+    num_unknown_args: int
+    observed_mutex_groups: dict[
+        conf._mutex_group._MutexGroupConfig,
+        tuple[str, _arguments.ArgumentDefinition],
+    ]
+    positional_args_consumed: int
+    args_to_pop: dict[str | None, _arguments.ArgumentDefinition]
+    seen_double_dash: bool
+    # True if values were reserved for positional arguments, which makes the
+    # state depend on the total number of tokens.
+    length_dependent: bool
+
+
+def _copy_output(output: dict[str | None, Any]) -> dict[str | None, Any]:
+    # Lists for `append` actions are modified in place.
+    return {k: list(v) if isinstance(v, list) else v for k, v in output.items()}
+
+
+def _snapshot_output(
+    output: dict[str | None, Any],
+) -> dict[str | None, tuple[Any, int]]:
+    """Record the output dict without copying its lists, so that recording a
+    checkpoint before every token doesn't take quadratic time. The lists in
+    `output` are only appended to, so the prefix of each one is the value at
+    the time of the snapshot."""
+    return {
+        k: (v, len(v)) if isinstance(v, list) else (v, -1) for k, v in output.items()
+    }
+
+
+def _restore_output(
+    snapshot: dict[str | None, tuple[Any, int]],
+) -> dict[str | None, Any]:
+    return {k: v[:length] if length >= 0 else v for k, (v, length) in snapshot.items()}
+
+
+class ParseCheckpoints:
+    """Parser states recorded by :class:`TyroBackend`, which are reused to
+    re-parse edited argument lists incrementally.
+
+    A checkpoint is recorded before each token is consumed. The state before a
+    token can depend on that token: for example, a variable-length argument
+    stops consuming values at the next flag. Checkpoints are therefore only
+    reused when the tokens up to and including their position are unchanged.
+    Checkpoints that depend on the total number of tokens are only reused when
+    the number of tokens is also unchanged.
+    """
+
+    def __init__(self) -> None:
+        self._key: tuple[Any, ...] | None = None
+        self._args: list[str] = []
+        # Sorted by position.
+        self._checkpoints: list[_Checkpoint] = []
+        self._positions: list[int] = []
+        # Every checkpoint after a length-dependent one is also
+        # length-dependent, so the others are a prefix of `_checkpoints`.
+        self._num_length_independent = 0
+
+    def _start(self, key: tuple[Any, ...], args: list[str]) -> _Checkpoint | None:
+        """Discard checkpoints that aren't valid for `args`, and return the
+        latest remaining one."""
+        if key != self._key:
+            self._key = key
+            del self._checkpoints[:], self._positions[:]
+            self._num_length_independent = 0
+
+        unchanged = next(
+            itertools.compress(itertools.count(), map(operator.ne, self._args, args)),
+            min(len(self._args), len(args)),
+        )
+        keep = bisect.bisect_left(self._positions, unchanged)
+        if len(self._args) != len(args):
+            keep = min(keep, self._num_length_independent)
+        self._args = args
+
+        del self._checkpoints[keep:], self._positions[keep:]
+        self._num_length_independent = min(self._num_length_independent, keep)
+        return self._checkpoints[-1] if keep > 0 else None
+
+    def _record(self, checkpoint: _Checkpoint) -> None:
+        # When a level is entered without consuming a token, for example when
+        # a flag implicitly selects a default subcommand, the parent level's
+        # checkpoint is kept. It doesn't depend on how the token is handled.
+        if len(self._positions) > 0 and self._positions[-1] >= checkpoint.position:
+            return
+        self._checkpoints.append(checkpoint)
+        self._positions.append(checkpoint.position)
+        if not checkpoint.length_dependent:
+            self._num_length_independent = len(self._checkpoints)
+
 
 @dataclass
 class TyroBackend(ParserBackend):
@@ -223,6 +426,10 @@ class TyroBackend(ParserBackend):
     It parses command-line arguments directly using the ParserSpecification tree.
     """
 
+    checkpoints: ParseCheckpoints | None = None
+    """If set, parser states are recorded here. When arguments are parsed again,
+    parsing resumes from the state before the first changed token."""
+
     def parse_args(
         self,
         parser_spec: _parsers.ParserSpecification,
@@ -261,11 +468,38 @@ class TyroBackend(ParserBackend):
         return_unknown_args: bool,
         compact_help: bool = False,
     ) -> tuple[dict[str | None, Any], list[tuple[str, str]]]:
+        # Find the state to resume from, if checkpoints from a previous call
+        # are still valid.
+        checkpoints = self.checkpoints
+        checkpoint_args: list[str] = []
+        resume: _Checkpoint | None = None
+        if checkpoints is not None:
+            checkpoint_args = list(args)
+            args = checkpoint_args
+            resume = checkpoints._start(
+                (
+                    parser_spec,
+                    prog,
+                    console_outputs,
+                    add_help,
+                    return_unknown_args,
+                    compact_help,
+                    _strings.get_delimiter(),
+                ),
+                checkpoint_args,
+            )
+        # Set if values were reserved for positional arguments. See `_Checkpoint`.
+        length_dependent = False
+
         # We'll start by setting up global values that persist across recursive calls.
         output: dict[str | None, Any] = {}
         unknown_args_and_progs: list[tuple[str, str]] = []
         subparser_frontier: dict[str, _parsers.SubparsersSpecification] = {}
-        subparser_implicit_selectors: dict[str, set[str]] = {}
+        # Flags that implicitly select each frontier subparser's default
+        # subcommand. `None` means not yet collected: this requires evaluating
+        # the default subcommand, which we defer until a flag can't be matched
+        # otherwise.
+        subparser_implicit_selectors: dict[str, set[str] | None] = {}
 
         def _missing_args_error(
             prog: str,
@@ -360,7 +594,11 @@ class TyroBackend(ParserBackend):
             return out
 
         def _recurse(
-            parser_spec: _parsers.ParserSpecification, local_prog: str
+            parser_spec: _parsers.ParserSpecification,
+            local_prog: str,
+            pending_missing_args: tuple[
+                list[_tyro_help_formatting.ArgWithContext], ...
+            ] = (),
         ) -> None:
             # Update the subparser frontier.
             subparser_frontier.update(parser_spec.subparsers_from_intern_prefix)
@@ -383,9 +621,7 @@ class TyroBackend(ParserBackend):
                         subparser_implicit_selectors[intern_prefix] = set()
                     continue
                 if cascade or _singleton.is_missing(subparser_spec.default_instance):
-                    subparser_implicit_selectors[intern_prefix] = _get_selectors(
-                        subparser_spec
-                    )
+                    subparser_implicit_selectors[intern_prefix] = None
 
             local_args: list[_tyro_help_formatting.ArgWithContext] = []
 
@@ -431,12 +667,99 @@ class TyroBackend(ParserBackend):
                 else:
                     kwarg_map.push(arg)
 
+            _consume_level(parser_spec, local_prog, pending_missing_args, resume=None)
+
+        def _consume_level(
+            parser_spec: _parsers.ParserSpecification,
+            local_prog: str,
+            pending_missing_args: tuple[
+                list[_tyro_help_formatting.ArgWithContext], ...
+            ],
+            resume: _Checkpoint | None,
+        ) -> None:
+            """Consume tokens for a parser level, after its arguments have been
+            registered. If `resume` is set, the loop state is restored from it."""
+            nonlocal length_dependent
+
+            level: _LevelSnapshot | None = None
+            if resume is not None:
+                level = resume.level
+            elif checkpoints is not None:
+                level = _LevelSnapshot(
+                    parser_spec=parser_spec,
+                    local_prog=local_prog,
+                    pending_missing_args=pending_missing_args,
+                    kwarg_map=kwarg_map.copy(),
+                    positional_args=tuple(positional_args),
+                    subparser_frontier=dict(subparser_frontier),
+                    subparser_implicit_selectors=dict(subparser_implicit_selectors),
+                    implicit_arg_from_subcommand_name=dict(
+                        implicit_arg_from_subcommand_name
+                    ),
+                    arg_ctx_from_dest=dict(arg_ctx_from_dest),
+                    required_mutex_args={
+                        k: list(v) for k, v in required_mutex_args.items()
+                    },
+                )
+
+            def consume_argument(
+                arg: _arguments.ArgumentDefinition, seen_double_dash: bool = False
+            ) -> None:
+                nonlocal length_dependent
+                # Variable-nargs arguments (keyword or positional) leave enough
+                # trailing values for the remaining required positionals.
+                min_remaining_positional = self._min_positional_consumption(
+                    positional_args
+                )
+                if min_remaining_positional > 0 and not isinstance(
+                    arg.lowered.nargs, int
+                ):
+                    length_dependent = True
+                self._consume_argument(
+                    arg,
+                    args_deque,
+                    output,
+                    kwarg_map,
+                    subparser_frontier,
+                    local_prog,
+                    add_help=add_help,
+                    console_outputs=console_outputs,
+                    seen_double_dash=seen_double_dash,
+                    min_remaining_positional=min_remaining_positional,
+                )
+
             # Consume strings and use them to populate the output dict.
             subparser_found: _parsers.ParserSpecification | None = None
             subparser_found_name: str = ""
-            args_to_pop: list[_arguments.ArgumentDefinition] = []
-            seen_double_dash = False  # Track if we've seen '--' end-of-options marker.
+            args_to_pop: dict[str | None, _arguments.ArgumentDefinition] = (
+                {} if resume is None else dict(resume.args_to_pop)
+            )
+            # Track if we've seen '--' end-of-options marker.
+            seen_double_dash = resume is not None and resume.seen_double_dash
             while len(args_deque) > 0:
+                if level is not None:
+                    assert checkpoints is not None
+                    position = len(checkpoint_args) - len(args_deque)
+                    # Checkpoints are only recorded between tokens of the
+                    # original arguments, not between tokens split from them
+                    # (like `--x=1` or `-abc`).
+                    if position >= 0 and args_deque[0] is checkpoint_args[position]:
+                        checkpoints._record(
+                            _Checkpoint(
+                                level=level,
+                                position=position,
+                                output=_snapshot_output(output),
+                                unknown_args_and_progs=unknown_args_and_progs,
+                                num_unknown_args=len(unknown_args_and_progs),
+                                observed_mutex_groups=dict(observed_mutex_groups),
+                                positional_args_consumed=len(level.positional_args)
+                                - len(positional_args),
+                                args_to_pop=dict(args_to_pop),
+                                seen_double_dash=seen_double_dash,
+                                length_dependent=length_dependent,
+                            )
+                        )
+
                 arg_value = args_deque.popleft()
 
                 # Handle '--' end-of-options marker. After this, all args are
@@ -453,21 +776,7 @@ class TyroBackend(ParserBackend):
                         continue
                     arg = positional_args.popleft()
                     args_deque.appendleft(arg_value)
-                    self._consume_argument(
-                        arg,
-                        args_deque,
-                        output,
-                        kwarg_map,
-                        subparser_frontier,
-                        local_prog,
-                        add_help=add_help,
-                        console_outputs=console_outputs,
-                        seen_double_dash=True,
-                        # Reserve trailing values for later required positionals.
-                        min_remaining_positional=self._min_positional_consumption(
-                            positional_args
-                        ),
-                    )
+                    consume_argument(arg, seen_double_dash=True)
                     continue
 
                 # Support --flag_name for --flag-name by swapping delimiters.
@@ -477,13 +786,13 @@ class TyroBackend(ParserBackend):
 
                 if len(arg_value) > 2 and arg_value.startswith("--"):
                     if "=" in arg_value:
-                        flag_part, _, equals_value = arg_value[2:].partition("=")
-                        maybe_flag_delimiter_swapped = "--" + _strings.swap_delimiters(
+                        flag_part, _, equals_value = arg_value.partition("=")
+                        maybe_flag_delimiter_swapped = kwarg_map.normalize_flag(
                             flag_part
                         )
                     else:
-                        maybe_flag_delimiter_swapped = "--" + _strings.swap_delimiters(
-                            arg_value[2:]
+                        maybe_flag_delimiter_swapped = kwarg_map.normalize_flag(
+                            arg_value
                         )
                 else:
                     maybe_flag_delimiter_swapped = arg_value
@@ -499,12 +808,21 @@ class TyroBackend(ParserBackend):
                     if compact_help
                     else ("-h", "--help")
                 )
-                if arg_value in help_flags and add_help:
+                # --help=PATTERN only formats groups with matching arguments.
+                help_flag = arg_value
+                help_group_filter: str | None = None
+                if equals_value is not None and arg_value.startswith("--"):
+                    help_flag = arg_value.partition("=")[0]
+                    help_group_filter = equals_value
+                if help_flag in help_flags and add_help:
                     # When compact_help is enabled, -H/--help-verbose shows full help.
-                    verbose = arg_value in ("-H", "--help-verbose") or not compact_help
+                    verbose = help_flag in ("-H", "--help-verbose") or not compact_help
                     if console_outputs:
-                        print(
-                            *_tyro_help_formatting.format_help(
+                        # Lines are written as they are formatted, so output for
+                        # large interfaces starts before the full helptext is
+                        # built.
+                        try:
+                            for line in _tyro_help_formatting.format_help(
                                 prog=local_prog,
                                 parser_spec=parser_spec,
                                 args=[
@@ -515,9 +833,17 @@ class TyroBackend(ParserBackend):
                                 ],
                                 subparser_frontier=subparser_frontier,
                                 verbose=verbose,
-                            ),
-                            sep="\n",
-                        )
+                                group_filter=help_group_filter,
+                            ):
+                                print(line)
+                            sys.stdout.flush()
+                        except BrokenPipeError:
+                            # The reader (for example, `head` or a pager) exited
+                            # early. Redirect remaining output to devnull to
+                            # avoid another error when Python flushes stdout on
+                            # exit.
+                            devnull = os.open(os.devnull, os.O_WRONLY)
+                            os.dup2(devnull, sys.stdout.fileno())
                     sys.exit(0)
 
                 # Handle assignments formatted as --flag=value.
@@ -597,7 +923,7 @@ class TyroBackend(ParserBackend):
                 if boolean_value is not None:
                     assert full_arg is not None
                     output[full_arg.lowered.dest] = boolean_value
-                    args_to_pop.append(full_arg)
+                    args_to_pop[full_arg.lowered.dest] = full_arg
                     continue
                 elif full_arg is not None:
                     # Counter argument.
@@ -610,20 +936,8 @@ class TyroBackend(ParserBackend):
                         continue
 
                     # Standard kwarg.
-                    self._consume_argument(
-                        full_arg,
-                        args_deque,
-                        output,
-                        kwarg_map,
-                        subparser_frontier,
-                        local_prog,
-                        add_help=add_help,
-                        console_outputs=console_outputs,
-                        min_remaining_positional=self._min_positional_consumption(
-                            positional_args
-                        ),
-                    )
-                    args_to_pop.append(full_arg)
+                    consume_argument(full_arg)
+                    args_to_pop[full_arg.lowered.dest] = full_arg
 
                     # If the flag is fixed (not user-settable) but the user
                     # supplied a value-like token right after it, attribute
@@ -681,13 +995,16 @@ class TyroBackend(ParserBackend):
                 # Note: maybe_flag_delimiter_swapped already has the "=value"
                 # part stripped out if present, so we can use it directly.
                 for intern_prefix, selectors in subparser_implicit_selectors.items():
-                    if maybe_flag_delimiter_swapped not in selectors:
-                        continue
                     # `intern_prefix` may have already been popped from the
                     # frontier when its subcommand was explicitly selected.
                     subparser = subparser_frontier.get(intern_prefix)
                     if subparser is None:
                         continue
+                    if selectors is None:
+                        selectors = _get_selectors(subparser)
+                        subparser_implicit_selectors[intern_prefix] = selectors
+                    if maybe_flag_delimiter_swapped not in selectors:
+                        continue
                     assert subparser.default_name is not None
                     # Track which subcommand names can't be selected
                     # because of some implicit selection. This will
@@ -721,21 +1038,7 @@ class TyroBackend(ParserBackend):
                     arg = positional_args.popleft()
                     args_deque.appendleft(arg_value)
                     assert arg.lowered.dest is None
-                    self._consume_argument(
-                        arg,
-                        args_deque,
-                        output,
-                        kwarg_map,
-                        subparser_frontier,
-                        local_prog,
-                        add_help=add_help,
-                        console_outputs=console_outputs,
-                        # A variable-nargs positional must leave enough trailing
-                        # values for the remaining required positionals.
-                        min_remaining_positional=self._min_positional_consumption(
-                            positional_args
-                        ),
-                    )
+                    consume_argument(arg)
                     continue
 
                 # If we reach here, we have an unknown argument.
@@ -758,7 +1061,7 @@ class TyroBackend(ParserBackend):
                 unknown_args_and_progs.append((arg_value, local_prog))
 
             # Pop parsed arguments. We de-duplicate using `dest`.
-            for arg in {arg.lowered.dest: arg for arg in args_to_pop}.values():
+            for arg in args_to_pop.values():
                 kwarg_map.pop(arg)
 
             # Process any missing arguments.
@@ -796,7 +1099,12 @@ class TyroBackend(ParserBackend):
 
             # Parse arguments for subparser.
             if subparser_found:
-                _recurse(subparser_found, local_prog + " " + subparser_found_name)
+                _recurse(
+                    subparser_found,
+                    local_prog + " " + subparser_found_name,
+                    pending_missing_args
+                    + ((missing_required_args,) if missing_required_args else ()),
+                )
 
             # Raise an error if there are mising arguments in this subcommand.
             # We parse subparsers before raising this error to make sure later
@@ -806,7 +1114,42 @@ class TyroBackend(ParserBackend):
             if len(missing_required_args) > 0:
                 _missing_args_error(prog, missing_required_args)
 
-        _recurse(parser_spec, prog)
+        if resume is None:
+            _recurse(parser_spec, prog)
+        else:
+            # Restore the state from before the first changed token. Containers
+            # in checkpoints are copied, since they are shared across calls.
+            level = resume.level
+            output.update(_restore_output(resume.output))
+            unknown_args_and_progs.extend(
+                resume.unknown_args_and_progs[: resume.num_unknown_args]
+            )
+            subparser_frontier.update(level.subparser_frontier)
+            subparser_implicit_selectors.update(level.subparser_implicit_selectors)
+            arg_ctx_from_dest.update(level.arg_ctx_from_dest)
+            kwarg_map = level.kwarg_map.copy()
+            positional_args.extend(
+                level.positional_args[resume.positional_args_consumed :]
+            )
+            implicit_arg_from_subcommand_name.update(
+                level.implicit_arg_from_subcommand_name
+            )
+            args_deque = deque(checkpoint_args[resume.position :])
+            required_mutex_args.update(
+                {k: list(v) for k, v in level.required_mutex_args.items()}
+            )
+            observed_mutex_groups.update(resume.observed_mutex_groups)
+            length_dependent = resume.length_dependent
+            _consume_level(
+                level.parser_spec,
+                level.local_prog,
+                level.pending_missing_args,
+                resume=resume,
+            )
+            # Like in `_consume_level()`, missing arguments for parent levels
+            # are reported after their subparsers are parsed.
+            for missing_required_args in reversed(level.pending_missing_args):
+                _missing_args_error(prog, missing_required_args)
 
         # Handle any missing/remaining arguments.
         def _check_for_missing_args() -> None:
@@ -924,6 +1267,10 @@ class TyroBackend(ParserBackend):
         # the default subcommand can have them via `tyro.MISSING`.
         _check_for_missing_args()
 
+        if checkpoints is not None:
+            # Checkpoints reference the lists in `output`, which must not be
+            # modified after parsing.
+            output = _copy_output(output)
         return output, unknown_args_and_progs
 
     @staticmethod
@@ -3,19 +3,25 @@
 from __future__ import annotations
 
 import dataclasses
-import difflib
+import fnmatch
 import shlex
 import shutil
 import sys
-from typing import TYPE_CHECKING, NoReturn
+from typing import TYPE_CHECKING, Iterator, NoReturn
 
 from tyro.conf._markers import CascadeSubcommandArgs, ShowSourcePath
 from tyro.conf._mutex_group import _MutexGroupConfig
 
 from .. import _fmtlib as fmt
-from .. import _settings, conf
+from .. import _settings
 from ..constructors._primitive_spec import UnsupportedTypeAnnotationError
 from ._argparse_help_formatting import _get_source_location
+from ._similar_args import (
+    OptionStringIndex,
+    _ArgumentInfo,
+    recursive_arg_search,
+    similar_arguments,
+)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -37,8 +43,22 @@ def format_help(
     parser_spec: ParserSpecification,
     args: list[ArgWithContext],
     subparser_frontier: dict[str, SubparsersSpecification],
+    *,
     verbose: bool = False,
-) -> list[str]:
+    group_filter: str | None = None,
+) -> Iterator[str]:
+    """Format helptext, one line at a time.
+
+    Lines are yielded as they are formatted. When argument groups are laid out
+    in a single column, which is always the case for terminals narrower than
+    130 characters, each group's helptext is only generated once the groups
+    before it have been output.
+
+    If `group_filter` is set, only argument groups that contain an argument
+    whose name matches the glob pattern are formatted. The pattern is matched
+    against argument names without leading dashes (`optimizer.*` matches
+    `--optimizer.lr`) and against group prefixes (`optimizer` matches the
+    `optimizer options` group)."""
     usage_strings = []
     group_description: dict[str, str | fmt._Text] = {}
 
@@ -57,10 +77,15 @@ def format_help(
             )
         )
 
-    groups: dict[_GroupKey, list[tuple[str | fmt._Text, fmt._Text]]] = {
+    # Helptext for arguments is generated when their group is formatted, so we
+    # store the argument itself until then.
+    groups: dict[
+        _GroupKey, list[tuple[str | fmt._Text, fmt._Text | ArgumentDefinition]]
+    ] = {
         "positional arguments": [],
-        "options": options_list,
+        "options": list(options_list),
     }
+    matched_groups: set[_GroupKey] = set()
 
     # Iterate over all provided parser specs and collect their arguments.
     from .._arguments import generate_argument_helptext
@@ -126,7 +151,6 @@ def format_help(
         # Populate help window.
         invocation_short, invocation_long = arg.get_invocation_text()
         usage_strings.append(invocation_short)
-        helptext = generate_argument_helptext(arg, arg.lowered, compact=compact_mode)
 
         # How should this argument be grouped?
         arg_group: _GroupKey
@@ -171,13 +195,22 @@ def format_help(
         # Add argument to group.
         if arg_group not in groups:
             groups[arg_group] = []
-        groups[arg_group].append((invocation_long, helptext))
+        groups[arg_group].append((invocation_long, arg))
+        if group_filter is not None and _matches_group_filter(arg_ctx, group_filter):
+            matched_groups.add(arg_group)
+
+    # Only groups that match the filter are formatted. Subcommands and default
+    # subcommand options are omitted from filtered helptext.
+    if group_filter is not None:
+        groups = {k: v for k, v in groups.items() if k in matched_groups}
+        subparser_frontier = {}
+        implicit_args = []
 
     # Compute maximum widths for formatting.
     max_invocation_width = 0
     widths = []
     for g in groups.values():
-        for invocation, helptext in g:
+        for invocation, _ in g:
             max_invocation_width = max(max_invocation_width, len(invocation))
             widths.append(len(invocation))
 
@@ -205,206 +238,286 @@ def format_help(
     # Left-justify with some padding.
     ljust_width = max_invocation_width + 2
 
-    # Put arguments in boxes.
-    group_boxes: list[fmt._Box] = []
-    group_heights: list[int] = []
-    for group_key, g in groups.items():
-        if len(g) == 0:
-            continue
-        subcommands_box_lines: list[str | fmt.Element] = []
-
-        if isinstance(group_key, _MutexGroupConfig):
-            subcommands_box_lines.append(
-                fmt.text(
-                    "Exactly one argument must be passed in. ",
-                    fmt.text["bright_red"]("(required)"),
-                )
-                if group_key.required
-                else "At most one argument can be overridden.",
-            )
-            subcommands_box_lines.append(fmt.hr[_settings.ACCENT_COLOR, "dim"]())
-        elif isinstance(group_key, _CascadedDefaultSubcommandGroupConfig):
-            desc = group_description.get(group_key.label, "")
-            if desc:
-                subcommands_box_lines.append(desc)
-            default_color = (
-                _settings.ACCENT_COLOR if _settings.ACCENT_COLOR != "white" else "cyan"
+    # Populate subcommand metavars for the usage line from the frontier.
+    subcommand_metavars: list[str] = []
+    for subparser_spec in subparser_frontier.values():
+        # For usage line: use full {a,b,c} metavar when there's only one subparser
+        # group in the frontier. Otherwise use shortened CAPS form for cleaner usage.
+        if len(subparser_frontier) == 1:
+            # Single subparser group: use full metavar like {a,checkout-completion}.
+            usage_metavar = "{" + ",".join(subparser_spec.parser_from_name.keys()) + "}"
+        else:
+            # Multiple subparser groups: use shortened form like A, B, etc.
+            usage_metavar = (
+                "SUBCOMMANDS"
+                if subparser_spec.extern_prefix == ""
+                else subparser_spec.extern_prefix.upper()
             )
-            subcommands_box_lines.append(
-                fmt.text[default_color](
-                    "(source subcommand: " + group_key.default_name + ")"
-                )
+        # Wrap in brackets if optional. This includes:
+        # - Subparsers with a default subcommand
+        # - Subparsers marked as not required (e.g., from EXCLUDE_FROM_CALL)
+        if subparser_spec.default_name is not None or not subparser_spec.required:
+            usage_metavar = f"[{usage_metavar}]"
+        subcommand_metavars.append(usage_metavar)
+
+    # Format usage.
+    usage_parts: list[fmt._Text | str] = [fmt.text["bold"]("usage:"), prog, "[-h]"]
+    usage_args = fmt.text(*usage_strings, delimiter=" ")
+    if len(usage_args) > 0:
+        # TODO: needs subcommand name.
+        if len(usage_args) < 80:
+            usage_parts.append(usage_args)
+        else:
+            prog_parts = shlex.split(prog)
+            # Use the first parser spec to determine if this is root.
+            is_root = parser_spec.intern_prefix == ""
+            usage_parts.append(
+                "[OPTIONS]" if is_root else f"[{prog_parts[-1].upper()} OPTIONS]"
             )
-            subcommands_box_lines.append(fmt.hr[_settings.ACCENT_COLOR, "dim"]())
-        elif group_description.get(group_key, "") != "":
-            subcommands_box_lines.append(group_description[group_key])
-            subcommands_box_lines.append(fmt.hr[_settings.ACCENT_COLOR, "dim"]())
-
-        for invocation, helptext in g:
-            # In compact mode, concatenate invocation and helptext directly.
-            if compact_mode:
-                # Check if concatenated text would be too wide for the terminal.
-                # If so, split onto separate lines for better readability.
-                terminal_width = shutil.get_terminal_size().columns
-                # Account for box borders and padding (~10 chars).
-                available_width = terminal_width - 10
-                combined_width = len(invocation) + 1 + len(helptext.as_str_no_ansi())
-
-                if combined_width > available_width:
-                    # Too wide - split onto separate lines.
-                    subcommands_box_lines.append(invocation)
-                    subcommands_box_lines.append(
-                        fmt.text("      ", helptext)  # Indent the helptext.
+    # Add all subcommand metavars from the frontier.
+    for metavar in subcommand_metavars:
+        usage_parts.append(metavar)
+
+    yield from fmt.text(*usage_parts, delimiter=" ").render()
+    # Use the first (root) parser spec for the main description.
+    root_description = parser_spec.description
+    if root_description == "":
+        yield ""
+    else:
+        yield ""
+        yield root_description
+        yield ""
+
+    if group_filter is not None and len(groups) == 0:
+        yield f"No arguments match {group_filter!r}."
+        return
+
+    def _iter_group_boxes() -> Iterator[tuple[fmt._Box, int]]:
+        """Put arguments in boxes. Yields each box with its height."""
+        for group_key, g in groups.items():
+            if len(g) == 0:
+                continue
+            subcommands_box_lines: list[str | fmt.Element] = []
+
+            if isinstance(group_key, _MutexGroupConfig):
+                subcommands_box_lines.append(
+                    fmt.text(
+                        "Exactly one argument must be passed in. ",
+                        fmt.text["bright_red"]("(required)"),
                     )
-                else:
-                    # Fits on one line - simple concatenation.
-                    subcommands_box_lines.append(fmt.text(invocation, " ", helptext))
-            elif len(invocation) <= max_invocation_width:
-                # Invocation and helptext on the same line with column formatting.
+                    if group_key.required
+                    else "At most one argument can be overridden.",
+                )
+                subcommands_box_lines.append(fmt.hr[_settings.ACCENT_COLOR, "dim"]())
+            elif isinstance(group_key, _CascadedDefaultSubcommandGroupConfig):
+                desc = group_description.get(group_key.label, "")
+                if desc:
+                    subcommands_box_lines.append(desc)
+                default_color = (
+                    _settings.ACCENT_COLOR
+                    if _settings.ACCENT_COLOR != "white"
+                    else "cyan"
+                )
                 subcommands_box_lines.append(
-                    fmt.cols((invocation, ljust_width), helptext)
+                    fmt.text[default_color](
+                        "(source subcommand: " + group_key.default_name + ")"
+                    )
                 )
-            else:
-                # Invocation and helptext on separate lines.
-                subcommands_box_lines.append(invocation)
-                subcommands_box_lines.append(fmt.cols(("", ljust_width), helptext))
-        group_boxes.append(
-            fmt.box[_settings.ACCENT_COLOR, "dim"](
-                fmt.text[_settings.ACCENT_COLOR, "dim"](
-                    (
-                        group_key.title
-                        if group_key.title is not None
-                        else "mutually exclusive"
+                subcommands_box_lines.append(fmt.hr[_settings.ACCENT_COLOR, "dim"]())
+            elif group_description.get(group_key, "") != "":
+                subcommands_box_lines.append(group_description[group_key])
+                subcommands_box_lines.append(fmt.hr[_settings.ACCENT_COLOR, "dim"]())
+
+            for invocation, helptext_or_arg in g:
+                helptext = (
+                    helptext_or_arg
+                    if isinstance(helptext_or_arg, fmt._Text)
+                    else generate_argument_helptext(
+                        helptext_or_arg, helptext_or_arg.lowered, compact=compact_mode
                     )
-                    if isinstance(group_key, _MutexGroupConfig)
-                    else group_key.label
-                    if isinstance(group_key, _CascadedDefaultSubcommandGroupConfig)
-                    else group_key
+                )
+                # In compact mode, concatenate invocation and helptext directly.
+                if compact_mode:
+                    # Check if concatenated text would be too wide for the terminal.
+                    # If so, split onto separate lines for better readability.
+                    terminal_width = shutil.get_terminal_size().columns
+                    # Account for box borders and padding (~10 chars).
+                    available_width = terminal_width - 10
+                    combined_width = (
+                        len(invocation) + 1 + len(helptext.as_str_no_ansi())
+                    )
+
+                    if combined_width > available_width:
+                        # Too wide - split onto separate lines.
+                        subcommands_box_lines.append(invocation)
+                        subcommands_box_lines.append(
+                            fmt.text("      ", helptext)  # Indent the helptext.
+                        )
+                    else:
+                        # Fits on one line - simple concatenation.
+                        subcommands_box_lines.append(
+                            fmt.text(invocation, " ", helptext)
+                        )
+                elif len(invocation) <= max_invocation_width:
+                    # Invocation and helptext on the same line with column formatting.
+                    subcommands_box_lines.append(
+                        fmt.cols((invocation, ljust_width), helptext)
+                    )
+                else:
+                    # Invocation and helptext on separate lines.
+                    subcommands_box_lines.append(invocation)
+                    subcommands_box_lines.append(fmt.cols(("", ljust_width), helptext))
+            yield (
+                fmt.box[_settings.ACCENT_COLOR, "dim"](
+                    fmt.text[_settings.ACCENT_COLOR, "dim"](
+                        (
+                            group_key.title
+                            if group_key.title is not None
+                            else "mutually exclusive"
+                        )
+                        if isinstance(group_key, _MutexGroupConfig)
+                        else group_key.label
+                        if isinstance(group_key, _CascadedDefaultSubcommandGroupConfig)
+                        else group_key
+                    ),
+                    fmt.rows(*subcommands_box_lines),
                 ),
-                fmt.rows(*subcommands_box_lines),
+                len(subcommands_box_lines) + 2,
             )
-        )
-        group_heights.append(len(subcommands_box_lines) + 2)
-
-    # Populate subcommand info from frontier.
-    # Create a separate box for each subparser group in the frontier.
-    subcommand_metavars: list[str] = []
-    subcommands_box_lines: list[fmt.Element | str] = []
-    for subparser_spec in subparser_frontier.values():
-        if len(subcommands_box_lines) > 0:
-            subcommands_box_lines.append(fmt.hr[_settings.ACCENT_COLOR, "dim"]())
-
-        default_name = subparser_spec.default_name
-        parser_from_name = subparser_spec.parser_from_name
 
-        metavar = "{" + ",".join(parser_from_name.keys()) + "}"
+        # Populate subcommand info from frontier.
+        # Create a separate box for each subparser group in the frontier.
+        subcommands_box_lines = []
+        for subparser_spec in subparser_frontier.values():
+            if len(subcommands_box_lines) > 0:
+                subcommands_box_lines.append(fmt.hr[_settings.ACCENT_COLOR, "dim"]())
+
+            default_name = subparser_spec.default_name
+            parser_from_name = subparser_spec.parser_from_name
+
+            description = ""
+            if subparser_spec.description is not None:
+                desc = subparser_spec.description
+                # Evaluate lazy description if callable.
+                if callable(desc):
+                    desc = desc()
+                if desc is not None:
+                    description = desc + " "
 
-        description = ""
-        if subparser_spec.description is not None:
-            desc = subparser_spec.description
-            # Evaluate lazy description if callable.
-            if callable(desc):
-                desc = desc()
-            if desc is not None:
-                description = desc + " "
-
-        if default_name is not None:
-            subcommands_box_lines.append(
-                fmt.text(
-                    description,
-                    fmt.text[
-                        "bold",
-                        _settings.ACCENT_COLOR
-                        if _settings.ACCENT_COLOR != "white"
-                        else "cyan",
-                    ]("(default: ", default_name, ")"),
-                )
-            )
-        elif subparser_spec.required:
-            subcommands_box_lines.append(
-                fmt.text(
-                    description,
-                    fmt.text["bright_red"]("(required)"),
-                )
-            )
-
-        for name, child_parser_spec in parser_from_name.items():
-            display_name = subparser_spec.display_name(name)
-            if len(display_name) <= (
-                ljust_width - 4 - 2
-            ):  #  -4 for bullet, -2 for space.
+            if default_name is not None:
                 subcommands_box_lines.append(
-                    fmt.cols(
-                        (fmt.text["dim"]("  • "), 4),
-                        (display_name, ljust_width - 4),
-                        fmt.text["dim"](child_parser_spec.description.strip() or ""),
+                    fmt.text(
+                        description,
+                        fmt.text[
+                            "bold",
+                            _settings.ACCENT_COLOR
+                            if _settings.ACCENT_COLOR != "white"
+                            else "cyan",
+                        ]("(default: ", default_name, ")"),
                     )
                 )
-            else:
+            elif subparser_spec.required:
                 subcommands_box_lines.append(
-                    fmt.cols(
-                        (fmt.text["dim"]("  • "), 4),
-                        display_name.strip(),
+                    fmt.text(
+                        description,
+                        fmt.text["bright_red"]("(required)"),
                     )
                 )
-                desc = child_parser_spec.description.strip()
-                if len(desc):
+
+            for name, child_parser_spec in parser_from_name.items():
+                display_name = subparser_spec.display_name(name)
+                if len(display_name) <= (
+                    ljust_width - 4 - 2
+                ):  #  -4 for bullet, -2 for space.
                     subcommands_box_lines.append(
-                        fmt.cols(("", ljust_width), fmt.text["dim"](desc))
+                        fmt.cols(
+                            (fmt.text["dim"]("  • "), 4),
+                            (display_name, ljust_width - 4),
+                            fmt.text["dim"](
+                                child_parser_spec.description.strip() or ""
+                            ),
+                        )
                     )
+                else:
+                    subcommands_box_lines.append(
+                        fmt.cols(
+                            (fmt.text["dim"]("  • "), 4),
+                            display_name.strip(),
+                        )
+                    )
+                    desc = child_parser_spec.description.strip()
+                    if len(desc):
+                        subcommands_box_lines.append(
+                            fmt.cols(("", ljust_width), fmt.text["dim"](desc))
+                        )
 
-        # For usage line: use full {a,b,c} metavar when there's only one subparser
-        # group in the frontier. Otherwise use shortened CAPS form for cleaner usage.
-        if len(subparser_frontier) == 1:
-            # Single subparser group: use full metavar like {a,checkout-completion}.
-            usage_metavar = metavar
-        else:
-            # Multiple subparser groups: use shortened form like A, B, etc.
-            usage_metavar = (
-                "SUBCOMMANDS"
-                if subparser_spec.extern_prefix == ""
-                else subparser_spec.extern_prefix.upper()
+        if len(subcommands_box_lines) > 0:
+            yield (
+                fmt.box[_settings.ACCENT_COLOR, "dim"](
+                    fmt.text[_settings.ACCENT_COLOR, "dim"]("subcommands"),
+                    fmt.rows(*subcommands_box_lines),
+                ),
+                len(subcommands_box_lines) + 2,
             )
-        # Wrap in brackets if optional. This includes:
-        # - Subparsers with a default subcommand
-        # - Subparsers marked as not required (e.g., from EXCLUDE_FROM_CALL)
-        if default_name is not None or not subparser_spec.required:
-            usage_metavar = f"[{usage_metavar}]"
-        subcommand_metavars.append(usage_metavar)
 
-    if len(subcommands_box_lines) > 0:
-        group_boxes.append(
-            fmt.box[_settings.ACCENT_COLOR, "dim"](
-                fmt.text[_settings.ACCENT_COLOR, "dim"]("subcommands"),
-                fmt.rows(*subcommands_box_lines),
-            )
-        )
-        group_heights.append(len(subcommands_box_lines) + 2)
-
-    # In verbose mode, implicit_args stays empty because args are routed to
-    # implicit_arg_contexts instead.
-    if len(implicit_args) > 0:
-        max_implicit_args = 20
-        if len(implicit_args) > max_implicit_args + 5:
-            implicit_args = implicit_args[:max_implicit_args] + [
-                fmt.text(f"and {len(implicit_args) - max_implicit_args} more")
-            ]
-        group_boxes.append(
-            fmt.box[_settings.ACCENT_COLOR, "dim"](
-                fmt.text[_settings.ACCENT_COLOR, "dim"]("default subcommand options"),
-                fmt.rows(
-                    "Options that can be applied from default subcommands.",
-                    fmt.hr[_settings.ACCENT_COLOR, "dim"](),
-                    *implicit_args,
+        # In verbose mode, implicit_args stays empty because args are routed to
+        # implicit_arg_contexts instead.
+        if len(implicit_args) > 0:
+            max_implicit_args = 20
+            shown_implicit_args = implicit_args
+            if len(implicit_args) > max_implicit_args + 5:
+                shown_implicit_args = implicit_args[:max_implicit_args] + [
+                    fmt.text(f"and {len(implicit_args) - max_implicit_args} more")
+                ]
+            yield (
+                fmt.box[_settings.ACCENT_COLOR, "dim"](
+                    fmt.text[_settings.ACCENT_COLOR, "dim"](
+                        "default subcommand options"
+                    ),
+                    fmt.rows(
+                        "Options that can be applied from default subcommands.",
+                        fmt.hr[_settings.ACCENT_COLOR, "dim"](),
+                        *shown_implicit_args,
+                    ),
                 ),
+                len(shown_implicit_args) + 2,
             )
-        )
-        group_heights.append(len(implicit_args) + 2)
+
+    screen_width = shutil.get_terminal_size().columns
+    if screen_width // 65 <= 1:
+        # Only one column fits on the screen, so we can stream boxes out one
+        # at a time. The only thing we need to wait for is the render width:
+        # this is the width of the widest box, which we know as soon as one
+        # box is at least as wide as the screen.
+        pending_boxes: list[fmt._Box] = []
+        render_width: int | None = None
+        for box, _ in _iter_group_boxes():
+            if render_width is not None:
+                yield from box.render(render_width)
+                continue
+            pending_boxes.append(box)
+            if box.max_width() >= screen_width:
+                render_width = screen_width
+                for pending_box in pending_boxes:
+                    yield from pending_box.render(render_width)
+                pending_boxes.clear()
+        if render_width is None:
+            render_width = min(
+                screen_width,
+                max((box.max_width() for box in pending_boxes), default=0),
+            )
+            for pending_box in pending_boxes:
+                yield from pending_box.render(render_width)
+        return
 
     # Arrange group boxes into columns.
+    group_boxes: list[fmt._Box] = []
+    group_heights: list[int] = []
+    for box, height in _iter_group_boxes():
+        group_boxes.append(box)
+        group_heights.append(height)
     cols: tuple[list[fmt._Box], ...] = ()
     height_breakpoint = 60
-    screen_width = shutil.get_terminal_size().columns
     max_column_count = max(
         1,
         min(
@@ -432,161 +545,19 @@ def format_help(
             break
 
     helptext_cols = fmt.cols(*(fmt.rows(*col_boxes) for col_boxes in cols))
-
-    # Format usage.
-    usage_parts: list[fmt._Text | str] = [fmt.text["bold"]("usage:"), prog, "[-h]"]
-    usage_args = fmt.text(*usage_strings, delimiter=" ")
-    if len(usage_args) > 0:
-        # TODO: needs subcommand name.
-        if len(usage_args) < 80:
-            usage_parts.append(usage_args)
-        else:
-            prog_parts = shlex.split(prog)
-            # Use the first parser spec to determine if this is root.
-            is_root = parser_spec.intern_prefix == ""
-            usage_parts.append(
-                "[OPTIONS]" if is_root else f"[{prog_parts[-1].upper()} OPTIONS]"
-            )
-    # Add all subcommand metavars from the frontier.
-    for metavar in subcommand_metavars:
-        usage_parts.append(metavar)
-
-    out = []
-    out.extend(fmt.text(*usage_parts, delimiter=" ").render())
-    # Use the first (root) parser spec for the main description.
-    root_description = parser_spec.description
-    if root_description == "":
-        out.append("")
-    else:
-        out.append("")
-        out.append(root_description)
-        out.append("")
-    out.extend(
-        helptext_cols.render(
-            min(shutil.get_terminal_size().columns, helptext_cols.max_width())
-        )
+    yield from helptext_cols.render(
+        min(shutil.get_terminal_size().columns, helptext_cols.max_width())
     )
-    return out
 
 
-def recursive_arg_search(
-    args: list[str],
-    parser_spec: ParserSpecification,
-    prog: str,
-    unrecognized_arguments: set[str],
-) -> tuple[list[_ArgumentInfo], bool, bool]:
-    """Recursively search for arguments in a ParserSpecification. Used for error message
-    printing.
-
-    Returns a list of arguments, whether the parser has subcommands or not, and -- if
-    `unrecognized_arguments` is passed in --- whether an unrecognized argument exists
-    under a different subparser.
-
-    Args:
-        args: Arguments being parsed. Used for heuristics on subcommands.
-        parser_spec: Argument parser specification.
-        subcommands: Prog corresponding to parser_spec.
-        unrecognized_arguments: Used for same_exists return value.
-    """
-    # Argument name => subcommands it came from.
-    arguments: list[_ArgumentInfo] = []
-    has_subcommands = False
-    same_exists = False
-
-    def _recursive_arg_search(
-        parser_spec: ParserSpecification,
-        prog: str,
-        subcommand_match_score: float,
-    ) -> None:
-        """Find all possible arguments that could have been passed in."""
-
-        # When tyro.conf.CascadeSubcommandArgs is turned on, arguments will
-        # only appear in the help message for "leaf" subparsers.
-        help_flag = (
-            " (other subcommands) --help"
-            if CascadeSubcommandArgs in parser_spec.markers
-            and len(parser_spec.subparsers_from_intern_prefix) > 0
-            else " --help"
-        )
-        for arg in parser_spec.args:
-            if arg.is_positional() or arg.lowered.is_fixed():
-                # Skip positional arguments.
-                continue
-
-            # Skip suppressed arguments.
-            if conf.Suppress in arg.field.markers or (
-                conf.SuppressFixed in arg.field.markers
-                and conf.Fixed in arg.field.markers
-            ):
-                continue
-
-            option_strings = arg.lowered.name_or_flags
-
-            # Handle actions, eg BooleanOptionalAction will map ("--flag",) to
-            # ("--flag", "--no-flag"). Short flags (like -f) cannot be inverted.
-            if arg.lowered.action == "boolean_optional_action":
-                from .._arguments import flag_to_inverse
-
-                inverted = tuple(
-                    inv
-                    for option in option_strings
-                    if (inv := flag_to_inverse(option)) is not None
-                )
-                option_strings = option_strings + inverted
-
-            # Evaluate lazy help if callable.
-            help_text = arg.lowered.help
-            if callable(help_text):
-                help_text = help_text()
-
-            arguments.append(
-                _ArgumentInfo(
-                    # Currently doesn't handle actions well, eg boolean optional
-                    # arguments.
-                    arg,
-                    option_strings=option_strings,
-                    metavar=arg.lowered.metavar,
-                    usage_hint=prog + help_flag,
-                    help=help_text,
-                    subcommand_match_score=subcommand_match_score,
-                )
-            )
-
-            # An unrecognized argument.
-            nonlocal same_exists
-            if not same_exists and any(
-                map(lambda x: x in unrecognized_arguments, arg.lowered.name_or_flags)
-            ):
-                same_exists = True
-
-        # Check subparsers from the parser spec's frontier.
-        if len(parser_spec.subparsers_from_intern_prefix) > 0:
-            nonlocal has_subcommands
-            has_subcommands = True
-            for subparser_spec in parser_spec.subparsers_from_intern_prefix.values():
-                for (
-                    subparser_name,
-                    child_parser_spec,
-                ) in subparser_spec.parser_from_name.items():
-                    child_spec = child_parser_spec.evaluate()
-                    # Error should have been caught earlier.
-                    assert not isinstance(child_spec, UnsupportedTypeAnnotationError), (
-                        "Unexpected UnsupportedTypeAnnotationError in backend"
-                    )
-                    _recursive_arg_search(
-                        child_spec,
-                        prog + " " + subparser_name,
-                        # Leaky (!!) heuristic for if this subcommand is matched or not.
-                        subcommand_match_score=subcommand_match_score
-                        + (1 if subparser_name in args else -0.001),
-                    )
-
-        for child in parser_spec.child_from_prefix.values():
-            _recursive_arg_search(child, prog, subcommand_match_score)
-
-    _recursive_arg_search(parser_spec, prog, 0)
-
-    return arguments, has_subcommands, same_exists
+def _matches_group_filter(arg_ctx: ArgWithContext, group_filter: str) -> bool:
+    """Check if an argument matches a `--help=PATTERN` filter."""
+    if fnmatch.fnmatchcase(arg_ctx.source_parser.extern_prefix, group_filter):
+        return True
+    return any(
+        fnmatch.fnmatchcase(name.lstrip("-"), group_filter)
+        for name in arg_ctx.arg.lowered.name_or_flags
+    )
 
 
 def unrecognized_args_error(
@@ -595,6 +566,7 @@ def unrecognized_args_error(
     subparser_frontier: dict[str, SubparsersSpecification],
     args: list[str],
     parser_spec: ParserSpecification,
+    *,
     console_outputs: bool,
     add_help: bool,
 ) -> NoReturn:
@@ -651,59 +623,19 @@ def unrecognized_args_error(
         )
 
     # Show similar arguments for keyword options.
+    option_string_index = OptionStringIndex(
+        option_string
+        for arg_info in arguments
+        for option_string in arg_info.option_strings
+    )
     for unrecognized_argument in unrecognized_arguments:
-        # Sort arguments by similarity.
-        scored_arguments: list[tuple[_ArgumentInfo, float]] = []
-        for arg_info in arguments:
-            # Compute a score for each argument.
-            assert unrecognized_argument.startswith("--")
-
-            def get_score(option_string: str) -> float:
-                if option_string.endswith(
-                    unrecognized_argument[2:]
-                ) or option_string.startswith(unrecognized_argument[2:]):
-                    return 0.9
-                elif len(unrecognized_argument) >= 4 and all(
-                    map(
-                        lambda part: part in option_string,
-                        unrecognized_argument[2:].split("."),
-                    )
-                ):
-                    return 0.9
-                else:
-                    return difflib.SequenceMatcher(
-                        a=unrecognized_argument, b=option_string
-                    ).ratio()
-
-            scored_arguments.append(
-                (arg_info, max(map(get_score, arg_info.option_strings)))
-            )
-
         # Add information about similar arguments.
         prev_arg_option_strings: tuple[str, ...] | None = None
         show_arguments: list[_ArgumentInfo] = []
         unique_counter = 0
-        for arg_info, score in (
-            # Sort scores greatest to least.
-            sorted(
-                scored_arguments,
-                key=lambda arg_score: (
-                    # Highest scores first.
-                    -arg_score[1],
-                    # Prefer arguments available in the currently specified
-                    # subcommands.
-                    -arg_score[0].subcommand_match_score,
-                    # Cluster by flag name, metavar, usage hint, help message.
-                    arg_score[0].option_strings[0],
-                    # `or ""` to handle None values in sorting.
-                    arg_score[0].metavar or "",
-                    arg_score[0].usage_hint,
-                    arg_score[0].help or "",
-                ),
-            )
+        for arg_info, score in similar_arguments(
+            unrecognized_argument, arguments, option_string_index
         ):
-            if score < 0.8:
-                break
             if (
                 score < 0.9
                 and unique_counter >= 3
@@ -845,14 +777,3 @@ def error_and_exit(
             flush=True,
         )
     sys.exit(2)
-
-
-@dataclasses.dataclass(frozen=True)
-class _ArgumentInfo:
-    arg: ArgumentDefinition
-    option_strings: tuple[str, ...]
-    metavar: str | None
-    usage_hint: str
-    help: str | None
-    subcommand_match_score: float
-    """Priority value used when an argument is in the current subcommand tree."""
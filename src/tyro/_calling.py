@@ -4,7 +4,9 @@ namespaces."""
 from __future__ import annotations
 
 import dataclasses
+import enum
 import itertools
+import pathlib
 from functools import partial
 from typing import Any, Callable, Generic, TypeVar, Union
 
@@ -31,18 +33,136 @@ class InstantiationError(Exception):
     arg: _arguments.ArgumentDefinition | str
 
 
+def value_from_arg(
+    arg: _arguments.ArgumentDefinition,
+    prefixed_field_name: str,
+    parser_definition: _parsers.ParserSpecification,
+    value_from_prefixed_field_name: dict[str | None, Any],
+    converted_values: dict[str, tuple[Any, Any]] | None = None,
+) -> tuple[Any, bool]:
+    """Get the value for an argument, converting it from strings if it was
+    passed in. See `callable_with_args()` for `converted_values`.
+
+    Returns:
+        - The value.
+        - If the value was passed in. If False, we've just returned the default.
+    """
+    if arg.lowered.is_fixed():
+        assert not _singleton.is_missing(arg.field.default)
+        parsed_value = value_from_prefixed_field_name.get(
+            prefixed_field_name, _singleton.MISSING_NONPROP
+        )
+        if not _singleton.is_missing(parsed_value):
+            raise InstantiationError(
+                f"{'/'.join(arg.lowered.name_or_flags)} was passed in, but"
+                " is a fixed argument that cannot be parsed",
+                arg,
+            )
+        return arg.field.default, False
+
+    if prefixed_field_name not in value_from_prefixed_field_name:
+        # When would the value not be found?
+        # 1. If the argument is suppressed
+        # 2. If we have `tyro.conf.CascadeSubcommandArgs` at parser level
+        # 3. If the argument has the CascadeSubcommandArgs marker
+        assert (
+            arg.is_suppressed()
+            or (_markers.CascadeSubcommandArgs in parser_definition.markers)
+            or (_markers.CascadeSubcommandArgs in arg.field.markers)
+        ), (
+            f"Field value for {arg.lowered.name_or_flags} is unexpectedly missing. This is likely a bug in tyro."
+        )
+        value, value_found = arg.field.default, False
+    else:
+        value, value_found = value_from_prefixed_field_name[prefixed_field_name], True
+    raw_value = value
+    should_cast = False
+    provided = False
+
+    if _singleton.is_missing(value):
+        value = arg.field.default
+
+        # Consider a function with a positional sequence argument:
+        #
+        #     def f(x: tuple[int, ...], /)
+        #
+        # If we run this script with no arguments, we should interpret this
+        # as empty input for x. But the argparse default will be a MISSING
+        # value, and the field default will be inspect.Parameter.empty.
+        if (
+            _singleton.is_missing(value)
+            and arg.is_positional()
+            # nargs="?" is currently only used for optional positional
+            # arguments when the underlying nargs for the primitive
+            # constructor is 1. Logic for this is in _arguments.py.
+            and arg.lowered.nargs == "*"
+        ):
+            value = []
+            should_cast = True
+    elif value_found:
+        # Value was found from the CLI, so we need to cast it with instance_from_str.
+        should_cast = True
+        provided = True
+        if arg.lowered.nargs == "?":
+            # Special case for optional positional arguments: this is the
+            # only time that arguments don't come back as a list.
+            value = [value]
+
+    # Attempt to cast the value to the correct type.
+    cached = (
+        converted_values.get(prefixed_field_name)
+        if converted_values is not None and value_found
+        else None
+    )
+    if should_cast and cached is not None and cached[0] is raw_value:
+        value = cached[1]
+    elif should_cast:
+        try:
+            assert arg.lowered.instance_from_str is not None
+            value = arg.lowered.instance_from_str(value)
+        except (ValueError, TypeError) as e:
+            raise InstantiationError(
+                e.args[0] if e.args else str(e),
+                arg,
+            )
+        # Only immutable values are cached, since cached values are shared
+        # between outputs.
+        if converted_values is not None and value_found and _is_immutable(value):
+            converted_values[prefixed_field_name] = (raw_value, value)
+    return value, provided
+
+
+def _is_immutable(value: Any) -> bool:
+    """Conservative check for whether a converted value can be shared between
+    outputs."""
+    if value is None or isinstance(
+        value, (bool, int, float, complex, str, bytes, enum.Enum, pathlib.PurePath)
+    ):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(map(_is_immutable, value))
+    return False
+
+
 def callable_with_args(
     f: Callable[..., T],
     parser_definition: _parsers.ParserSpecification,
     default_instance: T | _singleton.NonpropagatingMissingType,
     value_from_prefixed_field_name: dict[str | None, Any],
+    *,
     field_name_prefix: str,
+    converted_values: dict[str, tuple[Any, Any]] | None = None,
 ) -> tuple[Callable[[], T], set[str]]:
     """Populate `f` with arguments specified by a dictionary of values from argparse.
 
     Returns a partialed version of `f` with arguments populated, and a set of
     used arguments.
 
+    If `converted_values` is passed in, it is used to cache values converted from
+    strings, keyed by prefixed field name. Cached values are reused when the same
+    string value object is passed in again. Only immutable values are cached.
+    This is used for sweeps, where most values are shared across many calls.
+
     We return a `Callable[[], OutT]` instead of `T` directly for aesthetic
     reasons; it lets use reduce layers in stack traces for errors from
     functions passed to `tyro`.
@@ -56,35 +176,6 @@ def callable_with_args(
     kwargs: dict[str, Any] = {}
     consumed_keywords: set[str] = set()
 
-    def get_value_from_arg(
-        prefixed_field_name: str, arg: _arguments.ArgumentDefinition
-    ) -> tuple[Any, bool]:
-        """Helper for getting values from `value_from_arg` + doing some extra
-        asserts.
-
-        Returns:
-            - The value from `value_from_prefixed_field_name`.
-            - If the value was found. If True, we found the value (and it will
-              be returned as a string or list of strings). If False, we've just
-              returned the default.
-        """
-
-        if prefixed_field_name not in value_from_prefixed_field_name:
-            # When would the value not be found?
-            # 1. If the argument is suppressed
-            # 2. If we have `tyro.conf.CascadeSubcommandArgs` at parser level
-            # 3. If the argument has the CascadeSubcommandArgs marker
-            assert (
-                arg.is_suppressed()
-                or (_markers.CascadeSubcommandArgs in parser_definition.markers)
-                or (_markers.CascadeSubcommandArgs in arg.field.markers)
-            ), (
-                f"Field value for {arg.lowered.name_or_flags} is unexpectedly missing. This is likely a bug in tyro."
-            )
-            return arg.field.default, False
-        else:
-            return value_from_prefixed_field_name[prefixed_field_name], True
-
     arg_from_prefixed_field_name: dict[str, _arguments.ArgumentDefinition] = {}
     for arg in parser_definition.args:
         arg_from_prefixed_field_name[
@@ -106,63 +197,15 @@ def callable_with_args(
 
             # Standard arguments.
             arg = arg_from_prefixed_field_name[prefixed_field_name]
-            name_maybe_prefixed = prefixed_field_name
-            consumed_keywords.add(name_maybe_prefixed)
-            if not arg.lowered.is_fixed():
-                value, value_found = get_value_from_arg(name_maybe_prefixed, arg)
-                should_cast = False
-
-                if _singleton.is_missing(value):
-                    value = arg.field.default
-
-                    # Consider a function with a positional sequence argument:
-                    #
-                    #     def f(x: tuple[int, ...], /)
-                    #
-                    # If we run this script with no arguments, we should interpret this
-                    # as empty input for x. But the argparse default will be a MISSING
-                    # value, and the field default will be inspect.Parameter.empty.
-                    if (
-                        _singleton.is_missing(value)
-                        and arg.is_positional()
-                        # nargs="?" is currently only used for optional positional
-                        # arguments when the underlying nargs for the primitive
-                        # constructor is 1. Logic for this is in _arguments.py.
-                        and arg.lowered.nargs == "*"
-                    ):
-                        value = []
-                        should_cast = True
-                elif value_found:
-                    # Value was found from the CLI, so we need to cast it with instance_from_str.
-                    should_cast = True
-                    any_arguments_provided = True
-                    if arg.lowered.nargs == "?":
-                        # Special case for optional positional arguments: this is the
-                        # only time that arguments don't come back as a list.
-                        value = [value]
-
-                # Attempt to cast the value to the correct type.
-                if should_cast:
-                    try:
-                        assert arg.lowered.instance_from_str is not None
-                        value = arg.lowered.instance_from_str(value)
-                    except (ValueError, TypeError) as e:
-                        raise InstantiationError(
-                            e.args[0] if e.args else str(e),
-                            arg,
-                        )
-            else:
-                assert not _singleton.is_missing(arg.field.default)
-                value = arg.field.default
-                parsed_value = value_from_prefixed_field_name.get(
-                    prefixed_field_name, _singleton.MISSING_NONPROP
-                )
-                if not _singleton.is_missing(parsed_value):
-                    raise InstantiationError(
-                        f"{'/'.join(arg.lowered.name_or_flags)} was passed in, but"
-                        " is a fixed argument that cannot be parsed",
-                        arg,
-                    )
+            consumed_keywords.add(prefixed_field_name)
+            value, provided = value_from_arg(
+                arg,
+                prefixed_field_name,
+                parser_definition,
+                value_from_prefixed_field_name,
+                converted_values,
+            )
+            any_arguments_provided = any_arguments_provided or provided
         elif prefixed_field_name in parser_definition.child_from_prefix:
             # Nested callable.
             if _resolver.unwrap_origin_strip_extras(field_type) is Union:
@@ -173,6 +216,7 @@ def callable_with_args(
                 field.default,
                 value_from_prefixed_field_name,
                 field_name_prefix=prefixed_field_name,
+                converted_values=converted_values,
             )
             value = get_value()
             del get_value
@@ -225,6 +269,7 @@ def callable_with_args(
                     ),
                     value_from_prefixed_field_name,
                     field_name_prefix=prefixed_field_name,
+                    converted_values=converted_values,
                 )
                 value = get_value()
                 del get_value
@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
+import itertools
 import pathlib
 import shutil
 import sys
 import warnings
 from contextlib import nullcontext
-from typing import Callable, Literal, Sequence, Type, TypeVar, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    NoReturn,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+    overload,
+)
 
 from typing_extensions import Annotated, TypeForm, assert_never, deprecated
 
@@ -32,6 +48,9 @@ from ._singleton import (
 from .constructors import ConstructorRegistry
 from .constructors._primitive_spec import UnsupportedTypeAnnotationError
 
+if TYPE_CHECKING:
+    from ._backends._base import ParserBackend
+
 OutT = TypeVar("OutT")
 
 
@@ -325,6 +344,387 @@ def cli(  # pyright: ignore[reportInconsistentOverload]
         return out
 
 
+@overload
+def cli_sweep(
+    f: Type[OutT],
+    *,
+    prog: None | str = None,
+    description: None | str = None,
+    args: None | Sequence[str] = None,
+    default: OutT
+    | NonpropagatingMissingType
+    | PropagatingMissingType = MISSING_NONPROP,
+    use_underscores: bool = False,
+    console_outputs: bool = True,
+    add_help: bool = True,
+    compact_help: bool = False,
+    config: None | Sequence[conf._markers.Marker] = None,
+    registry: None | ConstructorRegistry = None,
+) -> Iterator[OutT]: ...
+
+
+@overload
+def cli_sweep(
+    f: Callable[..., OutT],
+    *,
+    prog: None | str = None,
+    description: None | str = None,
+    args: None | Sequence[str] = None,
+    default: NonpropagatingMissingType | PropagatingMissingType = MISSING_NONPROP,
+    use_underscores: bool = False,
+    console_outputs: bool = True,
+    add_help: bool = True,
+    compact_help: bool = False,
+    config: None | Sequence[conf._markers.Marker] = None,
+    registry: None | ConstructorRegistry = None,
+) -> Iterator[OutT]: ...
+
+
+def cli_sweep(
+    f: Type[OutT] | Callable[..., OutT],
+    *,
+    prog: None | str = None,
+    description: None | str = None,
+    args: None | Sequence[str] = None,
+    default: OutT
+    | NonpropagatingMissingType
+    | PropagatingMissingType = MISSING_NONPROP,
+    use_underscores: bool = False,
+    console_outputs: bool = True,
+    add_help: bool = True,
+    compact_help: bool = False,
+    config: None | Sequence[conf._markers.Marker] = None,
+    registry: None | ConstructorRegistry = None,
+) -> Iterator[OutT]:
+    """Like :func:`tyro.cli()`, but accepts sweeps over values, and returns an
+    iterator over outputs.
+
+    The iterator produces one output for each point in the cartesian product of
+    swept values. Numeric, :py:data:`typing.Literal`, and :class:`enum.Enum`
+    arguments that take a single value can be swept over:
+
+    - ``--lr 1e-3,3e-4`` sweeps over comma-separated values.
+    - ``--seed 0..9`` sweeps over an inclusive range of integers.
+    - ``--seed 0..3,10`` combines both.
+
+    .. code-block:: python
+
+        # Run with `python script.py --lr 1e-3,3e-4 --seed 0..9`.
+        for config in tyro.cli_sweep(Config):
+            submit_job(config)
+
+    The command line is parsed once, and outputs are produced one at a time, so
+    large sweeps can be streamed with constant memory. Every swept value is
+    checked before the first output is produced.
+
+    Args:
+        f: The function or type to populate from command-line arguments.
+        prog: The name of the program, as in :func:`tyro.cli`.
+        description: The description text, as in :func:`tyro.cli`.
+        args: Arguments to parse instead of the command line, as in
+            :func:`tyro.cli`.
+        default: An instance to use for default values, as in :func:`tyro.cli`.
+        use_underscores: If True, uses underscores as word delimiters.
+        console_outputs: If set to False, suppresses parsing errors and help
+            messages.
+        add_help: Add a -h/--help option to the parser.
+        compact_help: If True, use compact help format, as in :func:`tyro.cli`.
+        config: A sequence of configuration marker objects from :mod:`tyro.conf`.
+        registry: A :class:`tyro.constructors.ConstructorRegistry` instance
+            containing custom constructor rules.
+
+    Returns:
+        An iterator over outputs.
+    """
+    return cast(
+        Iterator[OutT],
+        cli(
+            f,
+            prog=prog,
+            description=description,
+            args=args,
+            default=default,
+            use_underscores=use_underscores,
+            console_outputs=console_outputs,
+            add_help=add_help,
+            compact_help=compact_help,
+            config=(*(config or ()), conf._markers._SWEEP_SYNTAX),
+            registry=registry,
+        ),
+    )
+
+
+@overload
+def cli_many(
+    f: Type[OutT],
+    argvs: Iterable[Sequence[str]],
+    *,
+    workers: None | int = None,
+    prog: None | str = None,
+    description: None | str = None,
+    default: OutT
+    | NonpropagatingMissingType
+    | PropagatingMissingType = MISSING_NONPROP,
+    use_underscores: bool = False,
+    add_help: bool = True,
+    config: None | Sequence[conf._markers.Marker] = None,
+    registry: None | ConstructorRegistry = None,
+) -> Iterator[OutT | _errors.ParseErrorEvent]: ...
+
+
+@overload
+def cli_many(
+    f: Callable[..., OutT],
+    argvs: Iterable[Sequence[str]],
+    *,
+    workers: None | int = None,
+    prog: None | str = None,
+    description: None | str = None,
+    default: NonpropagatingMissingType | PropagatingMissingType = MISSING_NONPROP,
+    use_underscores: bool = False,
+    add_help: bool = True,
+    config: None | Sequence[conf._markers.Marker] = None,
+    registry: None | ConstructorRegistry = None,
+) -> Iterator[OutT | _errors.ParseErrorEvent]: ...
+
+
+def cli_many(
+    f: Type[OutT] | Callable[..., OutT],
+    argvs: Iterable[Sequence[str]],
+    *,
+    workers: None | int = None,
+    prog: None | str = None,
+    description: None | str = None,
+    default: OutT
+    | NonpropagatingMissingType
+    | PropagatingMissingType = MISSING_NONPROP,
+    use_underscores: bool = False,
+    add_help: bool = True,
+    config: None | Sequence[conf._markers.Marker] = None,
+    registry: None | ConstructorRegistry = None,
+) -> Iterator[OutT | _errors.ParseErrorEvent]:
+    """Parse many argument lists against the same interface.
+
+    This is equivalent to calling :func:`tyro.cli` once for each element of
+    ``argvs``, but the parser specification is only built once. This is useful
+    for generating large numbers of configurations, for example for
+    hyperparameter sweeps.
+
+    .. code-block:: python
+
+        for config in tyro.cli_many(Config, [["--lr", str(lr)] for lr in lrs]):
+            if isinstance(config, tyro.ParseErrorEvent):
+                continue
+            ...
+
+    Outputs are yielded lazily and in the same order as ``argvs``. Instead of
+    printing an error and raising ``SystemExit``, argument lists that fail to
+    parse yield a :class:`tyro.ParseErrorEvent` describing the failure. The
+    argparse backend doesn't produce structured events, so its failures (and
+    requests for ``--help``) yield a base :class:`tyro.ParseErrorEvent`.
+
+    Args:
+        f: The function or type to populate from each argument list.
+        argvs: Argument lists to parse, each equivalent to the ``args`` argument of
+            :func:`tyro.cli`.
+        workers: If set, parse argument lists in a pool of this many worker
+            processes. Each worker builds the parser specification once. This
+            requires ``f``, ``default``, ``config``, ``registry``, and the
+            outputs to be picklable. Argument lists that fail to parse are
+            re-parsed in the calling process to produce their error events.
+        prog: The name of the program, as in :func:`tyro.cli`.
+        description: The description text, as in :func:`tyro.cli`.
+        default: An instance to use for default values, as in :func:`tyro.cli`.
+        use_underscores: If True, uses underscores as word delimiters.
+        add_help: Add a -h/--help option to the parser.
+        config: A sequence of configuration marker objects from :mod:`tyro.conf`.
+        registry: A :class:`tyro.constructors.ConstructorRegistry` instance
+            containing custom constructor rules.
+
+    Returns:
+        An iterator over outputs, or :class:`tyro.ParseErrorEvent`
+        instances for argument lists that failed to parse.
+    """
+    settings = _BatchSettings(
+        f=f,
+        prog=prog,
+        description=description,
+        default=default,
+        use_underscores=use_underscores,
+        add_help=add_help,
+        config=tuple(config or ()),
+        registry=registry,
+    )
+    if workers is None:
+        batch = _CompiledBatch(settings)
+        for argv in argvs:
+            yield batch.parse(argv)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Argument lists are submitted in bounded chunks, so `argvs` is consumed
+    # lazily. The next chunk is queued while the current one is being yielded.
+    argv_iter = iter(argvs)
+    local_batch: _CompiledBatch | None = None
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_batch_worker,
+        initargs=(settings, dict(_settings._experimental_options)),
+    ) as executor:
+
+        def submit_chunk() -> tuple[list[list[str]], Iterator[tuple[bool, Any]]]:
+            chunk = [
+                list(argv)
+                for argv in itertools.islice(argv_iter, _BATCH_CHUNK_SIZE * workers)
+            ]
+            return chunk, executor.map(
+                _parse_in_batch_worker,
+                chunk,
+                chunksize=max(1, min(64, len(chunk) // (workers * 4))),
+            )
+
+        pending = submit_chunk()
+        while len(pending[0]) > 0:
+            chunk, results = pending
+            pending = submit_chunk()
+            for argv, (ok, out) in zip(chunk, results):
+                if ok:
+                    yield out
+                else:
+                    # Failures are re-parsed locally, which lets us produce the
+                    # (unpicklable) error event and fire the caller's hooks.
+                    if local_batch is None:
+                        local_batch = _CompiledBatch(settings)
+                    yield local_batch.parse(argv)
+
+
+_BATCH_CHUNK_SIZE = 256
+"""Number of argument lists submitted at a time per worker in
+:func:`cli_many()`."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _BatchSettings:
+    """Inputs to :func:`cli_many()` that are shared across argument lists."""
+
+    f: Any
+    prog: None | str
+    description: None | str
+    default: Any
+    use_underscores: bool
+    add_help: bool
+    config: tuple[Any, ...]
+    registry: None | ConstructorRegistry
+
+
+class _BatchItemFailed(Exception):
+    def __init__(self, event: _errors.ParseErrorEvent):
+        self.event = event
+        super().__init__()
+
+
+class _CompiledBatch:
+    """Parser specification built once, and used for parsing many argument
+    lists."""
+
+    def __init__(self, settings: _BatchSettings) -> None:
+        self.settings = settings
+        self.prog = settings.prog if settings.prog is not None else sys.argv[0]
+        self.backend_name = _settings._experimental_options["backend"]
+
+        config = settings.config + _settings.get_global_markers()
+        f = settings.f
+        if len(config) > 0:
+            f = Annotated[(f, *config)]  # type: ignore
+        self.use_arg_files = _uses_arg_files(f)
+        self.f = _resolver.TypeParamResolver.resolve_params_and_aliases(f)
+
+        _unsafe_cache.clear_cache()
+        with self._context():
+            self.parser_spec = _make_parser_spec(
+                self.f, settings.description, settings.default
+            )
+            self.backend = _make_backend(self.backend_name)
+        _unsafe_cache.clear_cache()
+
+    @contextlib.contextmanager
+    def _context(self) -> Iterator[None]:
+        registry = self.settings.registry
+        with _strings.delimiter_context("_" if self.settings.use_underscores else "-"):
+            with registry if registry is not None else nullcontext():
+                yield
+
+    def parse(self, argv: Sequence[str]) -> Any:
+        """Parse one argument list. Returns the output, or the error event if
+        parsing fails."""
+        outer_hook = _errors._parse_error_hook.get()
+
+        def hook(event: _errors.ParseErrorEvent) -> None:
+            if outer_hook is not None:
+                outer_hook(event)
+            raise _BatchItemFailed(event)
+
+        try:
+            with self._context(), _errors.on_parse_error(hook):
+                args, _ = _prepare_args(
+                    list(argv),
+                    backend_name=self.backend_name,
+                    use_arg_files=self.use_arg_files,
+                    prog=self.prog,
+                    return_unknown_args=False,
+                    console_outputs=False,
+                    add_help=self.settings.add_help,
+                )
+                get_out, _ = _parse_and_bind(
+                    self.f,
+                    self.parser_spec,
+                    self.backend,
+                    self.settings.default,
+                    args,
+                    backend_name=self.backend_name,
+                    use_sweeps=False,
+                    prog=self.prog,
+                    return_unknown_args=False,
+                    console_outputs=False,
+                    add_help=self.settings.add_help,
+                    compact_help=False,
+                )
+        except _BatchItemFailed as e:
+            return e.event
+        except SystemExit:
+            # Failures that don't produce a structured event.
+            event = _errors.ParseErrorEvent(prog=self.prog)
+            _errors._fire(event)
+            return event
+        finally:
+            _unsafe_cache.clear_cache()
+
+        out = get_out()
+        while isinstance(out, _calling.DummyWrapper):
+            out = out.__tyro_dummy_inner__
+        return out
+
+
+_batch_worker: _CompiledBatch | None = None
+
+
+def _init_batch_worker(
+    settings: _BatchSettings, experimental_options: dict[str, Any]
+) -> None:
+    global _batch_worker
+    _settings._experimental_options.update(experimental_options)  # type: ignore
+    _batch_worker = _CompiledBatch(settings)
+
+
+def _parse_in_batch_worker(argv: list[str]) -> tuple[bool, Any]:
+    assert _batch_worker is not None
+    out = _batch_worker.parse(argv)
+    if isinstance(out, _errors.ParseErrorEvent):
+        return False, None
+    return True, out
+
+
 @overload
 @deprecated("get_parser() is deprecated and will be removed in a future version.")
 def get_parser(
@@ -441,6 +841,7 @@ def _cli_impl(
     compact_help: bool,
     config: None | Sequence[conf._markers.Marker],
     registry: None | ConstructorRegistry = None,
+    parser_spec: None | _parsers.ParserSpecification = None,
     **deprecated_kwargs,
 ) -> (
     OutT
@@ -450,7 +851,9 @@ def _cli_impl(
         list[str],
     ]
 ):
-    """Helper for stitching the `tyro` pipeline together."""
+    """Helper for stitching the `tyro` pipeline together. If `parser_spec` is
+    set, it's used instead of building a specification for `f`; it should have
+    been built from the same inputs."""
 
     # Combine markers passed via `config=` with any applied globally through the
     # `global_markers` experimental option (PYTHON_TYRO_GLOBAL_MARKERS).
@@ -487,36 +890,17 @@ def _cli_impl(
     # --field-name, correct for them.
     args = list(sys.argv[1:]) if args is None else list(args)
 
-    # Fix arguments. This will modify all option-style arguments replacing
-    # underscores with hyphens, or vice versa if use_underscores=True.
-    # If two options are ambiguous, e.g., --a_b and --a-b, raise a runtime error.
-    #
-    # This is only done for the argparse backend; the tyro backend handles
-    # conversion internally.
-    modified_args: dict[str, str] | None = None
     backend_name = _settings._experimental_options["backend"]
-    if backend_name == "argparse":
-        modified_args = {}
-        for index, arg in enumerate(args):
-            if not arg.startswith("--"):
-                continue
-
-            if "=" in arg:
-                argname, _, val = arg.partition("=")
-                fixed = "--" + _strings.swap_delimiters(argname[2:]) + "=" + val
-                del argname, val
-            else:
-                fixed = "--" + _strings.swap_delimiters(arg[2:])
-            if (
-                return_unknown_args
-                and fixed in modified_args
-                and modified_args[fixed] != arg
-            ):
-                raise RuntimeError(
-                    "Ambiguous arguments: " + modified_args[fixed] + " and " + arg
-                )
-            modified_args[fixed] = arg
-            args[index] = fixed
+    use_arg_files = _uses_arg_files(f)
+    args, modified_args = _prepare_args(
+        args,
+        backend_name=backend_name,
+        use_arg_files=use_arg_files,
+        prog=prog,
+        return_unknown_args=return_unknown_args,
+        console_outputs=console_outputs,
+        add_help=add_help,
+    )
 
     # If we pass in the --tyro-print-completion or --tyro-write-completion flags: turn
     # formatting tags, and get the shell we want to generate a completion script for
@@ -548,32 +932,9 @@ def _cli_impl(
 
     registry_context = registry if registry is not None else nullcontext()
     with registry_context:
-        # Map a callable to the relevant CLI arguments + subparsers.
-        with _settings.timing_context("Generate parser specification"):
-            parser_spec = _parsers.ParserSpecification.from_callable_or_type(
-                f,
-                markers=set(),
-                description=description,
-                parent_classes=set(),  # Used for recursive calls.
-                default_instance=default_instance,  # Overrides for default values.
-                intern_prefix="",  # Used for recursive calls.
-                extern_prefix="",  # Used for recursive calls.
-                subcommand_prefix="",
-                support_single_arg_types=False,
-                prog_suffix="",
-            )
-
-        # Initialize backend.
-        if backend_name == "argparse":
-            from ._backends._argparse_backend import ArgparseBackend
-
-            backend = ArgparseBackend()
-        elif backend_name == "tyro":
-            from ._backends._tyro_backend import TyroBackend
-
-            backend = TyroBackend()
-        else:
-            assert_never(backend_name)
+        if parser_spec is None:
+            parser_spec = _make_parser_spec(f, description, default_instance)
+        backend = _make_backend(backend_name)
 
         # Handle shell completion.
         if print_completion or write_completion:
@@ -626,62 +987,21 @@ def _cli_impl(
         if prog is None:
             prog = sys.argv[0]
 
-        with _settings.timing_context("Parsing arguments"):
-            value_from_prefixed_field_name, unknown_args = backend.parse_args(
-                parser_spec=parser_spec,
-                args=args,
-                prog=prog,
-                return_unknown_args=return_unknown_args,
-                console_outputs=console_outputs,
-                add_help=add_help,
-                compact_help=compact_help,
-            )
-
-        try:
-            # Attempt to call `f` using whatever was passed in.
-            get_out, consumed_keywords = _calling.callable_with_args(
-                f,
-                parser_spec,
-                default_instance,
-                value_from_prefixed_field_name,
-                field_name_prefix="",
-            )
-        except _calling.InstantiationError as e:
-            # Print prettier errors.
-            # This doesn't catch errors raised directly by get_out(), since that's
-            # called later! This is intentional, because we do less error handling
-            # for the root callable. Relevant: the `field_name_prefix == ""`
-            # condition in `callable_with_args()`!
-
-            # From the user's perspective, a failure constructing the output
-            # object from parsed values is just another way their input was
-            # rejected -- so it goes through the same parse-error hook.
-            #
-            # Unlike the backend failure sites, this one does NOT route through
-            # _errors._fire_and_exit: it draws a bespoke box (non-bold "Value
-            # error" title, "For full helptext, see ..." footer) that differs
-            # from the standard error_and_exit box, and it fires post-parse from
-            # here rather than mid-parse in the backend. Rendering lives with the
-            # other error renderers in `_errors` so this site only constructs the
-            # event; see `fire_and_exit_instantiation_failure`.
-            _errors.fire_and_exit_instantiation_failure(
-                _errors.InstantiationFailure(
-                    prog=prog,
-                    message=e.message,
-                    argument=(
-                        e.arg
-                        if isinstance(e.arg, _arguments.ArgumentDefinition)
-                        else None
-                    ),
-                ),
-                arg_fallback=e.arg,
-                add_help=add_help,
-            )
-
-        assert len(value_from_prefixed_field_name.keys() - consumed_keywords) == 0, (
-            f"Parsed {value_from_prefixed_field_name.keys()}, but only consumed"
-            f" {consumed_keywords}"
+        get_out, unknown_args = _parse_and_bind(
+            f,
+            parser_spec,
+            backend,
+            default_instance,
+            args,
+            backend_name=backend_name,
+            use_sweeps=conf._markers._SWEEP_SYNTAX in config,
+            prog=prog,
+            return_unknown_args=return_unknown_args,
+            console_outputs=console_outputs,
+            add_help=add_help,
+            compact_help=compact_help,
         )
+
         if return_unknown_args:
             assert unknown_args is not None, (
                 "Should have parsed with `parse_known_args()`"
@@ -694,3 +1014,229 @@ def _cli_impl(
         else:
             assert unknown_args is None, "Should have parsed with `parse_args()`"
             return get_out  # type: ignore
+
+
+def _uses_arg_files(f: Any) -> bool:
+    """Whether `tyro.conf.UseArgFiles` is applied to the root type or function,
+    directly or via `config=`."""
+    return (
+        conf._markers.UseArgFiles
+        in _resolver.unwrap_annotated(f, conf._markers._Marker)[1]
+    )
+
+
+def _prepare_args(
+    args: list[str],
+    *,
+    backend_name: Literal["argparse", "tyro"],
+    use_arg_files: bool,
+    prog: None | str,
+    return_unknown_args: bool,
+    console_outputs: bool,
+    add_help: bool,
+) -> tuple[list[str], dict[str, str] | None]:
+    """Expand argument files and fix delimiters before parsing. Returns the
+    fixed arguments, and for the argparse backend, a mapping from fixed
+    arguments to the original ones."""
+
+    # Expand @path argument files.
+    if use_arg_files:
+        from ._backends._arg_files import expand_arg_files
+
+        args = expand_arg_files(
+            args,
+            prog=prog if prog is not None else sys.argv[0],
+            console_outputs=console_outputs,
+            add_help=add_help,
+        )
+
+    # Fix arguments. This will modify all option-style arguments replacing
+    # underscores with hyphens, or vice versa if use_underscores=True.
+    # If two options are ambiguous, e.g., --a_b and --a-b, raise a runtime error.
+    #
+    # This is only done for the argparse backend; the tyro backend handles
+    # conversion internally.
+    modified_args: dict[str, str] | None = None
+    if backend_name == "argparse":
+        modified_args = {}
+        for index, arg in enumerate(args):
+            if not arg.startswith("--"):
+                continue
+
+            if "=" in arg:
+                argname, _, val = arg.partition("=")
+                fixed = "--" + _strings.swap_delimiters(argname[2:]) + "=" + val
+                del argname, val
+            else:
+                fixed = "--" + _strings.swap_delimiters(arg[2:])
+            if (
+                return_unknown_args
+                and fixed in modified_args
+                and modified_args[fixed] != arg
+            ):
+                raise RuntimeError(
+                    "Ambiguous arguments: " + modified_args[fixed] + " and " + arg
+                )
+            modified_args[fixed] = arg
+            args[index] = fixed
+    return args, modified_args
+
+
+def _make_parser_spec(
+    f: Any,
+    description: None | str,
+    default_instance: Any,
+) -> _parsers.ParserSpecification:
+    # Map a callable to the relevant CLI arguments + subparsers.
+    with _settings.timing_context("Generate parser specification"):
+        return _parsers.ParserSpecification.from_callable_or_type(
+            f,
+            markers=set(),
+            description=description,
+            parent_classes=set(),  # Used for recursive calls.
+            default_instance=default_instance,  # Overrides for default values.
+            intern_prefix="",  # Used for recursive calls.
+            extern_prefix="",  # Used for recursive calls.
+            subcommand_prefix="",
+            support_single_arg_types=False,
+            prog_suffix="",
+        )
+
+
+def _make_backend(backend_name: Literal["argparse", "tyro"]) -> ParserBackend:
+    if backend_name == "argparse":
+        from ._backends._argparse_backend import ArgparseBackend
+
+        return ArgparseBackend()
+    elif backend_name == "tyro":
+        from ._backends._tyro_backend import TyroBackend
+
+        return TyroBackend()
+    else:
+        assert_never(backend_name)
+
+
+def _parse_and_bind(
+    f: Any,
+    parser_spec: _parsers.ParserSpecification,
+    backend: ParserBackend,
+    default_instance: Any,
+    args: list[str],
+    *,
+    backend_name: Literal["argparse", "tyro"],
+    use_sweeps: bool,
+    prog: str,
+    return_unknown_args: bool,
+    console_outputs: bool,
+    add_help: bool,
+    compact_help: bool,
+) -> tuple[Callable[[], Any], list[str] | None]:
+    """Parse `args` against a parser specification. Returns a function for
+    calling `f` with the parsed values, and the unknown arguments if
+    `return_unknown_args` is set. If `use_sweeps` is set, the function returns an
+    iterator over outputs instead."""
+    with _settings.timing_context("Parsing arguments"):
+        value_from_prefixed_field_name, unknown_args = backend.parse_args(
+            parser_spec=parser_spec,
+            args=args,
+            prog=prog,
+            return_unknown_args=return_unknown_args,
+            console_outputs=console_outputs,
+            add_help=add_help,
+            compact_help=compact_help,
+        )
+
+    if use_sweeps:
+        from . import _sweeps
+
+        try:
+            get_outputs = _sweeps.sweep_callable(
+                f, parser_spec, default_instance, value_from_prefixed_field_name
+            )
+        except _calling.InstantiationError as e:
+            _exit_with_instantiation_error(e, prog=prog, add_help=add_help)
+
+        # Outputs are produced after `cli()` has returned, so the delimiter and
+        # constructor registries are restored while producing each one.
+        delimiter = _strings.get_delimiter()
+        registries = list(ConstructorRegistry._active_registries)
+
+        def get_sweep_outputs() -> Iterator[Any]:
+            outputs = get_outputs()
+            while True:
+                with _parse_context(delimiter, registries):
+                    try:
+                        out = next(outputs)
+                    except StopIteration:
+                        return
+                    except _calling.InstantiationError as e:
+                        _exit_with_instantiation_error(e, prog=prog, add_help=add_help)
+                yield out
+
+        return get_sweep_outputs, unknown_args
+
+    try:
+        # Attempt to call `f` using whatever was passed in.
+        get_out, consumed_keywords = _calling.callable_with_args(
+            f,
+            parser_spec,
+            default_instance,
+            value_from_prefixed_field_name,
+            field_name_prefix="",
+        )
+    except _calling.InstantiationError as e:
+        # Print prettier errors.
+        # This doesn't catch errors raised directly by get_out(), since that's
+        # called later! This is intentional, because we do less error handling
+        # for the root callable. Relevant: the `field_name_prefix == ""`
+        # condition in `callable_with_args()`!
+        _exit_with_instantiation_error(e, prog=prog, add_help=add_help)
+
+    assert len(value_from_prefixed_field_name.keys() - consumed_keywords) == 0, (
+        f"Parsed {value_from_prefixed_field_name.keys()}, but only consumed"
+        f" {consumed_keywords}"
+    )
+    return get_out, unknown_args
+
+
+@contextlib.contextmanager
+def _parse_context(
+    delimiter: Literal["-", "_"], registries: list[ConstructorRegistry]
+) -> Iterator[None]:
+    """Context for resuming work that was started by :func:`cli()`, with the
+    delimiter and active constructor registries it used."""
+    active = ConstructorRegistry._active_registries
+    restore = active[:]
+    active[:] = registries
+    try:
+        with _strings.delimiter_context(delimiter):
+            yield
+    finally:
+        active[:] = restore
+
+
+def _exit_with_instantiation_error(
+    e: _calling.InstantiationError, *, prog: str, add_help: bool
+) -> NoReturn:
+    # From the user's perspective, a failure constructing the output object from
+    # parsed values is just another way their input was rejected -- so it goes
+    # through the same parse-error hook.
+    #
+    # Unlike the backend failure sites, this one does NOT route through
+    # _errors._fire_and_exit: it draws a bespoke box (non-bold "Value error"
+    # title, "For full helptext, see ..." footer) that differs from the standard
+    # error_and_exit box, and it fires post-parse from here rather than mid-parse
+    # in the backend. Rendering lives with the other error renderers in `_errors`
+    # so this site only constructs the event; see
+    # `fire_and_exit_instantiation_failure`.
+    _errors.fire_and_exit_instantiation_failure(
+        _errors.InstantiationFailure(
+            prog=prog,
+            message=e.message,
+            argument=(
+                e.arg if isinstance(e.arg, _arguments.ArgumentDefinition) else None
+            ),
+        ),
+        arg_fallback=e.arg,
+        add_help=add_help,
+    )
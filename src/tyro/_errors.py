@@ -85,6 +85,7 @@ from __future__ import annotations
 
 import contextlib
 import dataclasses
+import difflib
 from contextvars import ContextVar
 from typing import (
     TYPE_CHECKING,
@@ -405,6 +406,29 @@ def _fire(event: ParseErrorEvent) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _describe_choices(
+    choices: tuple[str, ...], value: str, *, as_tuple: bool = False
+) -> tuple[str, list[str]]:
+    """Format choices for an invalid-choice error, as `'a', 'b', 'c'`, or as
+    `('a', 'b', 'c')` if `as_tuple` is set. Like `{a,b,c}` metavars, large
+    choice sets are truncated; close matches to `value` are returned for them
+    instead."""
+    from .constructors._primitive_spec import _MAX_METAVAR_CHOICES
+
+    if len(choices) <= _MAX_METAVAR_CHOICES:
+        if as_tuple:
+            return str(tuple(choices)), []
+        return ", ".join(map(repr, choices)), []
+    shown = 8
+    text = (
+        ", ".join(map(repr, choices[:shown])) + f", … and {len(choices) - shown} more"
+    )
+    return (
+        f"({text})" if as_tuple else text,
+        difflib.get_close_matches(value, choices, n=3),
+    )
+
+
 def _render(event: ParseErrorEvent) -> tuple[str, list[Any]]:
     """Return ``(title, contents)`` for an event, matching tyro's historical
     message text byte-for-byte. The help footer's program path(s) come from
@@ -490,6 +514,9 @@ def _render(event: ParseErrorEvent) -> tuple[str, list[Any]]:
 
     if isinstance(event, InvalidChoice):
         arg = event.argument
+        choices_text, close_matches = _describe_choices(
+            event.choices, event.value, as_tuple=True
+        )
         return (
             "Invalid choice",
             [
@@ -499,10 +526,21 @@ def _render(event: ParseErrorEvent) -> tuple[str, list[Any]]:
                     " for argument ",
                     fmt.text["bold"](f"'{arg.display_name()}'"),
                     ". Expected one of ",
-                    fmt.text["cyan"](str(arg.lowered.choices)),
+                    fmt.text["cyan"](choices_text),
                     ".",
                 )
-            ],
+            ]
+            + (
+                [
+                    fmt.text(
+                        "Did you mean ",
+                        ", ".join(f"'{match}'" for match in close_matches),
+                        "?",
+                    )
+                ]
+                if close_matches
+                else []
+            ),
         )
 
     if isinstance(event, MissingMutexGroup):
@@ -141,16 +141,18 @@ class FieldDefinition:
             if argconf.help is not None:
                 helptext = argconf.help
 
-        # Get markers.
-        markers = tuple(x for x in metadata if isinstance(x, _markers._Marker))
+        # Get markers, including markers set via context manager. Markers on
+        # the field itself are the innermost.
+        markers: set[Any] = set()
+        for context_markers in global_context_markers:
+            markers = _resolver.merge_markers(markers, context_markers)
+        markers = _resolver.merge_markers(
+            markers, (x for x in metadata if isinstance(x, _markers._Marker))
+        )
         mutually_exclusive_groups = tuple(
             x for x in metadata if isinstance(x, _MutexGroupConfig)
         )
 
-        # Include markers set via context manager.
-        for context_markers in global_context_markers:
-            markers += context_markers
-
         # Only use argconf default if field default is missing.
         if default is MISSING_NONPROP and len(argconfs) > 0:
             default = argconf.default
@@ -163,7 +165,7 @@ class FieldDefinition:
             type_stripped=type_stripped,
             default=default,
             helptext=helptext,
-            markers=set(markers),
+            markers=markers,
             custom_constructor=argconf.constructor_factory is not None,
             argconf=argconf,
             mutex_group=mutually_exclusive_groups[0]
@@ -176,7 +178,11 @@ class FieldDefinition:
         )
 
         # Be forgiving about default instances.
-        type_stripped = _resolver.narrow_collection_types(type_stripped, default)
+        type_stripped = _resolver.narrow_collection_types(
+            type_stripped,
+            default,
+            exhaustive=_resolver.inspects_all_elements(markers),
+        )
         if not check_default_instances():
             type_stripped = _resolver.expand_union_types(type_stripped, default)
 
@@ -216,16 +222,22 @@ def is_struct_type(
     if type(typ) is type and typ in (int, str, float, bool, bytes, type(None)):
         return False
 
-    list_or_error = field_list_from_type_or_callable(
-        typ,
-        default_instance,
-        support_single_arg_types=False,
-        in_union_context=in_union_context,
-    )
-    return not isinstance(
-        list_or_error,
-        (UnsupportedStructTypeMessage, InvalidDefaultInstanceError),
-    )
+    if len(_resolver.unwrap_annotated(typ, PrimitiveConstructorSpec)[1]) > 0:
+        return False
+
+    # Struct rules can usually classify types without building fields. Fields
+    # are only built when no rule applies and `typ` is treated as a callable.
+    type_info = StructTypeInfo.make(typ, default_instance, in_union_context)
+    is_struct = ConstructorRegistry._is_struct_type(type_info)
+    if is_struct is not None:
+        return is_struct
+
+    with type_info._typevar_context:
+        with FieldDefinition.marker_context(type_info.markers):
+            list_or_error = _field_list_from_callable(
+                typ, type_info, default_instance, support_single_arg_types=False
+            )
+    return not isinstance(list_or_error, UnsupportedStructTypeMessage)
 
 
 def field_list_from_type_or_callable(
@@ -287,27 +299,39 @@ def field_list_from_type_or_callable(
                     FieldDefinition.from_field_spec(f) for f in spec.fields
                 ]
 
-            is_primitive = ConstructorRegistry._is_primitive_type(type_orig, set())
-            if is_primitive and support_single_arg_types:
-                with FieldDefinition.marker_context((_markers.Positional,)):
-                    return (
-                        lambda x: x,
-                        [
-                            FieldDefinition.make(
-                                name="value",
-                                typ=type_orig,
-                                default=default_instance,
-                                helptext="",
-                                call_mode="positional",
-                            )
-                        ],
+            return _field_list_from_callable(
+                type_orig, type_info, default_instance, support_single_arg_types
+            )
+
+
+def _field_list_from_callable(
+    type_orig: Callable | Type[Any],
+    type_info: StructTypeInfo,
+    default_instance: Any,
+    support_single_arg_types: bool,
+) -> UnsupportedStructTypeMessage | tuple[Callable, list[FieldDefinition]]:
+    """Generate field lists for types that no struct rule applies to."""
+    is_primitive = ConstructorRegistry._is_primitive_type(type_orig, set())
+    if is_primitive and support_single_arg_types:
+        with FieldDefinition.marker_context((_markers.Positional,)):
+            return (
+                lambda x: x,
+                [
+                    FieldDefinition.make(
+                        name="value",
+                        typ=type_orig,
+                        default=default_instance,
+                        helptext="",
+                        call_mode="positional",
                     )
-            elif not is_primitive and callable(type_info.type):
-                return _field_list_from_function(
-                    type_info.type,  # This will have typing.Annotated metadata stripped.
-                    default_instance,
-                    markers=type_info.markers,
-                )
+                ],
+            )
+    elif not is_primitive and callable(type_info.type):
+        return _field_list_from_function(
+            type_info.type,  # This will have typing.Annotated metadata stripped.
+            default_instance,
+            markers=type_info.markers,
+        )
 
     return UnsupportedStructTypeMessage(f"{type_orig} is not a valid struct type!")
 
@@ -0,0 +1,275 @@
+"""Deterministic fingerprints of CLI schemas. Unlike the keys used for in-process
+caches, fingerprints never depend on `id()` or hash randomization, so they can
+be used as on-disk or cross-process cache keys."""
+
+from __future__ import annotations
+
+import contextlib
+import datetime
+import decimal
+import enum
+import fractions
+import functools
+import hashlib
+import pathlib
+import re
+import types
+import uuid
+from typing import Any, Callable, Sequence, TypeVar
+
+from typing_extensions import Annotated, get_args, get_origin
+
+from . import _parsers, _resolver, _settings, _singleton, _strings, _unsafe_cache
+from .conf import _markers
+from .constructors import ConstructorRegistry
+
+T = TypeVar("T")
+
+_MAX_DEPTH = 32
+_ADDRESS_PATTERN = re.compile(r" at 0x[0-9a-fA-F]+")
+_STABLE_REPR_TYPES = (
+    pathlib.PurePath,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    decimal.Decimal,
+    fractions.Fraction,
+    uuid.UUID,
+)
+
+
+def schema_fingerprint(
+    f: Callable[..., T],
+    *,
+    default: T
+    | _singleton.NonpropagatingMissingType
+    | _singleton.PropagatingMissingType = _singleton.MISSING_NONPROP,
+    use_underscores: bool = False,
+    config: Sequence[Any] | None = None,
+    registry: ConstructorRegistry | None = None,
+) -> str:
+    """Compute a fingerprint for the CLI that :func:`tyro.cli()` would generate
+    for the same inputs.
+
+    The fingerprint is a hash of the CLI's structure: field names, types,
+    markers, defaults, argument counts, subcommands, and the active constructor
+    rules. Helptext is not included. Fingerprints are deterministic across
+    processes, so they can be used as keys for on-disk caches.
+
+    Values are fingerprinted by their contents when they are primitives,
+    containers, dataclasses, msgspec structs, paths, or date and time values.
+    Other values, for example instances of arbitrary classes used as defaults,
+    have no stable encoding, and :class:`UnstableFingerprintError` is raised.
+
+    Args:
+        f: The function or type to fingerprint the CLI of.
+        default: An instance to use for default values.
+        use_underscores: If True, use underscores as a word delimiter instead of
+            hyphens.
+        config: Sequence of config marker objects, from `tyro.conf`.
+        registry: A :class:`tyro.constructors.ConstructorRegistry` instance
+            containing custom constructor rules.
+
+    Returns:
+        A hexadecimal SHA-256 digest.
+
+    Raises:
+        UnstableFingerprintError: If the CLI contains values that can't be
+            fingerprinted deterministically.
+    """
+    # Like in `tyro.cli()`, caches keyed by memory addresses are only valid
+    # within a single call.
+    _unsafe_cache.clear_cache()
+    try:
+        with _strings.delimiter_context("_" if use_underscores else "-"):
+            with registry if registry is not None else contextlib.nullcontext():
+                return root_fingerprint(build_parser_spec(f, default, config))
+    finally:
+        _unsafe_cache.clear_cache()
+
+
+def build_parser_spec(
+    f: Callable[..., Any],
+    default: Any,
+    config: Sequence[Any] | None,
+    *,
+    description: str | None = None,
+) -> _parsers.ParserSpecification:
+    """Build the root parser specification for `f`, with markers from
+    `config=` and global markers applied like in `tyro.cli()`."""
+    from ._cli import _make_parser_spec
+
+    markers = tuple(config or ()) + _settings.get_global_markers()
+    if len(markers) > 0:
+        f = Annotated[(f, *markers)]  # type: ignore
+    f = _resolver.TypeParamResolver.resolve_params_and_aliases(f)
+    return _make_parser_spec(f, description, default)
+
+
+def root_fingerprint(parser_spec: _parsers.ParserSpecification) -> str:
+    """Fingerprint for a root parser specification. This should be called in
+    the same registry and delimiter context that the specification was built
+    in."""
+    import tyro
+
+    h = hashlib.sha256()
+    for part in (
+        tyro.__version__,
+        _strings.get_delimiter(),
+        *(
+            stable_repr(rule)
+            for registry in ConstructorRegistry._active_registries
+            for rules in (
+                registry._primitive_rules,
+                registry._struct_rules,
+                registry._struct_rule_matchers,
+            )
+            for rule in rules
+        ),
+        parser_spec.fingerprint,
+    ):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def spec_fingerprint(parser_spec: _parsers.ParserSpecification) -> str:
+    """Fingerprint for a parser specification and its children. Names are
+    relative to the specification's prefix, so specifications for the same
+    struct type at different locations share fingerprints.
+
+    This is cached via `ParserSpecification.fingerprint`, which should be used
+    instead of calling this function directly."""
+    h = hashlib.sha256()
+
+    def update(*parts: str) -> None:
+        for part in parts:
+            h.update(part.encode())
+            h.update(b"\0")
+
+    def relative(prefix: str) -> str:
+        if parser_spec.intern_prefix == "":
+            return prefix
+        return prefix[len(parser_spec.intern_prefix) + 1 :]
+
+    update(stable_repr(parser_spec.f), _stable_set_repr(parser_spec.markers))
+    for arg in parser_spec.args:
+        field = arg.field
+        lowered = arg._lowered_from_field
+        update(
+            "arg",
+            field.intern_name,
+            field.extern_name,
+            stable_repr(field.type),
+            stable_repr(field.default),
+            _stable_set_repr(field.markers),
+            stable_repr(field.argconf),
+            field.call_mode,
+            stable_repr(lowered.nargs),
+            stable_repr(lowered.action),
+            stable_repr(lowered.choices),
+        )
+    for prefix, child in parser_spec.child_from_prefix.items():
+        update("child", relative(prefix), child.fingerprint)
+    for prefix, subparsers in parser_spec.subparsers_from_intern_prefix.items():
+        update(
+            "subparsers",
+            relative(prefix),
+            stable_repr(subparsers.default_name),
+            stable_repr(subparsers._required),
+        )
+        for name, lazy_parser in subparsers.parser_from_name.items():
+            subparser = lazy_parser.evaluate()
+            update(
+                name,
+                stable_repr(subparsers.aliases_from_name.get(name, ())),
+                subparser.fingerprint
+                if isinstance(subparser, _parsers.ParserSpecification)
+                else stable_repr(subparser),
+            )
+    return h.hexdigest()
+
+
+class UnstableFingerprintError(ValueError):
+    """Raised when a CLI can't be fingerprinted deterministically, for example
+    because a default value has no stable encoding."""
+
+
+def stable_repr(value: Any, depth: int = 0) -> str:
+    """Like `repr()`, but the same for equivalent values in different processes.
+
+    Raises `UnstableFingerprintError` for values that can't be encoded this way.
+    """
+    typ = type(value)
+    if value is None or typ in (bool, int, float, complex, str, bytes):
+        return repr(value)
+    if isinstance(value, enum.Enum):
+        return f"{_qualified_name(typ)}.{value.name}"
+    if isinstance(value, (type, types.FunctionType, types.BuiltinFunctionType)):
+        return _qualified_name(value)
+    if isinstance(value, _singleton.Singleton):
+        return _qualified_name(typ)
+    if isinstance(value, _markers._Marker):
+        return f"tyro.conf.{value!r}"
+    if isinstance(value, _STABLE_REPR_TYPES):
+        # These types have reprs that are derived from their contents.
+        return _qualified_name(typ) + ":" + repr(value)
+    if depth < _MAX_DEPTH:
+        if isinstance(value, types.MethodType):
+            return f"{stable_repr(value.__self__, depth + 1)}.{value.__name__}"
+        if typ is functools.partial:
+            return (
+                f"functools.partial({stable_repr(value.func, depth + 1)},"
+                f" {stable_repr(value.args, depth + 1)},"
+                f" {stable_repr(value.keywords, depth + 1)})"
+            )
+        if typ in (set, frozenset):
+            return f"{typ.__name__}({_stable_set_repr(value, depth + 1)})"
+        if isinstance(value, (list, tuple)):
+            # Includes subclasses, like named tuples.
+            return (
+                _qualified_name(typ)
+                + "("
+                + ", ".join(stable_repr(v, depth + 1) for v in value)
+                + ")"
+            )
+        origin = get_origin(value)
+        if origin is not None:
+            # Type annotations, like `List[int]` or `Annotated[int, ...]`.
+            return (
+                stable_repr(origin, depth + 1)
+                + "["
+                + ", ".join(stable_repr(arg, depth + 1) for arg in get_args(value))
+                + "]"
+            )
+        parts = _parsers._default_parts(value)
+        if parts is not None:
+            return (
+                _qualified_name(typ)
+                + "("
+                + ", ".join(
+                    f"{stable_repr(k, depth + 1)}: {stable_repr(v, depth + 1)}"
+                    for k, v in parts.items()
+                )
+                + ")"
+            )
+    if typ.__module__ in ("typing", "typing_extensions"):
+        # Special forms like `Union`, type variables, and forward references.
+        return repr(value)
+    raise UnstableFingerprintError(
+        f"Values of type {_qualified_name(typ)} can't be fingerprinted: {value!r}"
+    )
+
+
+def _stable_set_repr(values: Any, depth: int = 0) -> str:
+    # Sets are sorted by the repr of each item, since their iteration order
+    # depends on hash randomization.
+    return "{" + ", ".join(sorted(stable_repr(v, depth) for v in values)) + "}"
+
+
+def _qualified_name(obj: Any) -> str:
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if not isinstance(qualname, str):
+        return _ADDRESS_PATTERN.sub("", repr(obj))
+    return qualname if module is None else f"{module}.{qualname}"
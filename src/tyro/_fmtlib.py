@@ -71,17 +71,53 @@ def _should_use_utf8_drawing_chars() -> bool:
     )
 
 
+def _should_use_ansi_codes() -> bool:
+    """Check if ANSI codes should be included in rendered text."""
+    from . import _settings
+
+    return _settings._experimental_options["ansi_codes"] and (
+        _FORCE_ANSI
+        or (sys.stdout.isatty() and os.environ.get("TERM") not in (None, "dumb"))
+    )
+
+
 # Base classes.
 
 
 class Element(abc.ABC):
     _styles: tuple[AnsiAttribute, ...] = ()
 
+    # Layout caches. Elements are not modified after construction, so these are
+    # populated on first use and never invalidated. This matters for large
+    # helptext, where `max_width()` is recursive and the same subtree can be
+    # rendered more than once.
+    _max_width_cache: int | None = None
+    _render_cache: dict[tuple[int | None, bool, bool], list[str]] | None = None
+
+    def max_width(self) -> int:
+        if self._max_width_cache is None:
+            self._max_width_cache = self._compute_max_width()
+        return self._max_width_cache
+
+    def render(self, width: int) -> list[str]:
+        return self._render_memoized(width)
+
+    def _render_memoized(self, width: int | None) -> list[str]:
+        # Rendered lines also depend on global ANSI and box drawing settings.
+        key = (width, _should_use_ansi_codes(), _should_use_utf8_drawing_chars())
+        if self._render_cache is None:
+            self._render_cache = {}
+        out = self._render_cache.get(key)
+        if out is None:
+            out = self._render_cache[key] = self._render(width)
+        # Copy, since callers are free to modify the returned list.
+        return list(out)
+
     @abc.abstractmethod
-    def max_width(self) -> int: ...
+    def _compute_max_width(self) -> int: ...
 
     @abc.abstractmethod
-    def render(self, width: int) -> list[str]: ...
+    def _render(self, width: int | None) -> list[str]: ...
 
     def __repr__(self) -> str:
         return "\n".join(
@@ -117,10 +153,10 @@ class _Text(Element):
         return "\033[0m"
 
     def __len__(self) -> int:
-        return sum(map(len, self._segments))
+        return self.max_width()
 
-    def max_width(self) -> int:
-        return len(self)
+    def _compute_max_width(self) -> int:
+        return sum(map(len, self._segments))
 
     def as_str_no_ansi(self) -> str:
         """Return the text without any ANSI codes."""
@@ -130,6 +166,9 @@ class _Text(Element):
         )
 
     def render(self, width: int | None = None) -> list[str]:
+        return self._render_memoized(width)
+
+    def _render(self, width: int | None) -> list[str]:
         # Render out wrappable text. We'll do this in three stages:
         # 1) Flatten segments.
         # 2) Generate list[list[tuple[str, tuple[AnsiAttribute, ...]]]], this will tell us which part / segment goes on which line.
@@ -150,6 +189,74 @@ class _Text(Element):
         # Stage 2: break into lines. This is actually kind of complicated.
         # Outer list is lines, inner list is segments, tuple is (text, style).
         stage2_out: list[list[tuple[str, tuple[AnsiAttribute, ...]]]] = [[]]
+        enable_ansi = _should_use_ansi_codes()
+        if width is None or all(
+            len(line) <= width
+            for line in "".join(text for text, _ in stage1_out).split("\n")
+        ):
+            # Fast path: no wrapping is needed, so we only need to split at
+            # newlines. When ANSI codes are enabled, we still split into the
+            # same space-delimited parts as `_wrap()`, since each part gets its
+            # own escape sequences.
+            for text, styles in stage1_out:
+                for line_index, line in enumerate(text.split("\n")):
+                    if line_index > 0:
+                        stage2_out.append([])
+                    if enable_ansi:
+                        stage2_out[-1].extend(
+                            (part if i == 0 else f" {part}", styles)
+                            for i, part in enumerate(line.split(" "))
+                        )
+                    else:
+                        stage2_out[-1].append((line, styles))
+        else:
+            self._wrap(stage1_out, stage2_out, width)
+
+        # Stage 3: create strings including ANSI codes.
+        if not enable_ansi:
+            # Fast path: no escape sequences to insert.
+            if width is None:
+                return ["".join(part for part, _ in line) for line in stage2_out]
+            out = []
+            for stage2_line in stage2_out:
+                line_str = "".join(part for part, _ in stage2_line)
+                out.append(line_str + " " * (width - len(line_str)))
+            return out
+
+        ansi_reset = _Text.get_reset()
+        ansi_code_from_styles: dict[tuple[AnsiAttribute, ...], str] = {}
+        stage3_out: list[list[str]] = []
+        for stage1_line in stage2_out:
+            active_segment: int | None = None
+            need_reset = False
+            stage3_out.append([])
+            used_line_length = 0
+            for part, styles in stage1_line:
+                ansi_part = ansi_code_from_styles.get(styles)
+                if ansi_part is None:
+                    ansi_part = ansi_code_from_styles[styles] = _Text.get_code(styles)
+                if styles != active_segment:
+                    # Apply formatting for new segment.
+                    if need_reset:
+                        stage3_out[-1].append(ansi_reset)
+                    stage3_out[-1].append(ansi_part)
+                    need_reset = True
+                stage3_out[-1].append(part)
+                used_line_length += len(part)
+            if width is not None:
+                stage3_out[-1].append(" " * (width - used_line_length))
+            if need_reset:
+                stage3_out[-1].append(ansi_reset)
+        return ["".join(parts) for parts in stage3_out]
+
+    @staticmethod
+    def _wrap(
+        stage1_out: list[tuple[str, tuple[AnsiAttribute, ...]]],
+        stage2_out: list[list[tuple[str, tuple[AnsiAttribute, ...]]]],
+        width: int,
+    ) -> None:
+        """Break flattened segments into lines of at most `width` characters.
+        Lines are appended to `stage2_out`."""
         stage2_current_line_counter = 0
         for text, styles in stage1_out:
             # First: break into lines.
@@ -176,10 +283,7 @@ class _Text(Element):
                     part = parts_deque.popleft()
                     if len(stage2_out[-1]) == 0:
                         part = part.lstrip()
-                    if (
-                        width is None
-                        or len(part) <= width - stage2_current_line_counter
-                    ):
+                    if len(part) <= width - stage2_current_line_counter:
                         stage2_out[-1].append((part, styles))
                         stage2_current_line_counter += len(part)
                     elif part.find(",") not in (-1, len(part) - 1):
@@ -195,49 +299,14 @@ class _Text(Element):
                         stage2_current_line_counter = 0
                         parts_deque.appendleft(part)
 
-        # Stage 3: create strings including ANSI codes.
-        ansi_reset = _Text.get_reset()
-        stage3_out: list[list[str]] = []
-
-        # Check experimental options for ansi_codes setting.
-        from . import _settings
-
-        enable_ansi = _settings._experimental_options["ansi_codes"] and (
-            _FORCE_ANSI
-            or (sys.stdout.isatty() and os.environ.get("TERM") not in (None, "dumb"))
-        )
-
-        for stage1_line in stage2_out:
-            active_segment: int | None = None
-            need_reset = False
-            stage3_out.append([])
-            used_line_length = 0
-            for part, styles in stage1_line:
-                ansi_part = _Text.get_code(styles)
-                if styles != active_segment:
-                    # Apply formatting for new segment.
-                    if enable_ansi and need_reset:
-                        stage3_out[-1].append(ansi_reset)
-                    if enable_ansi and ansi_part is not None:
-                        stage3_out[-1].append(ansi_part)
-                        need_reset = True
-                    else:
-                        need_reset = False
-                stage3_out[-1].append(part)
-                used_line_length += len(part)
-            if width is not None:
-                stage3_out[-1].append(" " * (width - used_line_length))
-            if enable_ansi and need_reset:
-                stage3_out[-1].append(ansi_reset)
-        return ["".join(parts) for parts in stage3_out]
-
 
 @final
 class _HorizontalRule(Element):
-    def max_width(self) -> int:
+    def _compute_max_width(self) -> int:
         return 1
 
-    def render(self, width: int) -> list[str]:
+    def _render(self, width: int | None) -> list[str]:
+        assert width is not None
         char = "─" if _should_use_utf8_drawing_chars() else "-"
         return text[self._styles](char * width).render(width)
 
@@ -253,10 +322,11 @@ class _Rows(Element):
     def __init__(self, *contents: Element | str) -> None:
         self._contents = tuple(_cast_element(x) for x in contents)
 
-    def max_width(self) -> int:
+    def _compute_max_width(self) -> int:
         return max(0, *(x.max_width() for x in self._contents))
 
-    def render(self, width: int) -> list[str]:
+    def _render(self, width: int | None) -> list[str]:
+        assert width is not None
         out = []
         for elem in self._contents:
             out.extend(elem.render(width))
@@ -279,7 +349,7 @@ class _Cols(Element):
             for c in contents
         )
 
-    def max_width(self) -> int:
+    def _compute_max_width(self) -> int:
         return sum(
             (
                 width if isinstance(width, int) else elem.max_width()
@@ -288,7 +358,8 @@ class _Cols(Element):
             0,
         )
 
-    def render(self, width: int) -> list[str]:
+    def _render(self, width: int | None) -> list[str]:
+        assert width is not None
         if len(self._contents) == 0:
             return []
 
@@ -364,10 +435,11 @@ class _Box(Element):
         self._title = title
         self._contents = contents
 
-    def max_width(self) -> int:
+    def _compute_max_width(self) -> int:
         return self._contents.max_width() + 4
 
-    def render(self, width: int) -> list[str]:
+    def _render(self, width: int | None) -> list[str]:
+        assert width is not None
         out: list[str] = []
         border = text[self._styles]
 
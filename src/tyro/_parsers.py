@@ -3,9 +3,24 @@
 from __future__ import annotations
 
 import dataclasses
+import enum
+import functools
 import numbers
+import types
 import warnings
-from typing import Any, Callable, Dict, List, Set, Tuple, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import Annotated, get_args, get_origin
 
@@ -23,6 +38,7 @@ from . import (
     _singleton,
     _strings,
     _subcommand_matching,
+    _unsafe_cache,
 )
 from . import _fmtlib as fmt
 from ._typing_compat import is_typing_union
@@ -88,6 +104,21 @@ class ParserSpecification:
     has_required_args: bool
     subparser_parent: ParserSpecification | None
     prog_suffix: str
+    template: ParserSpecification | None = dataclasses.field(
+        default=None, compare=False, repr=False
+    )
+    """Specification that this one was relocated from, if any."""
+
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """Deterministic hash of this specification's structure. Relocated
+        specifications share the fingerprint of their template."""
+        if self.template is not None:
+            return self.template.fingerprint
+
+        from ._fingerprint import spec_fingerprint
+
+        return spec_fingerprint(self)
 
     @staticmethod
     def from_callable_or_type(
@@ -108,7 +139,7 @@ class ParserSpecification:
 
         # Consolidate subcommand types.
         f_unwrapped, new_markers = _resolver.unwrap_annotated(f, _markers._Marker)
-        markers = markers | set(new_markers)
+        markers = _resolver.merge_markers(markers, new_markers)
 
         # Cycle detection.
         #
@@ -268,22 +299,10 @@ class ParserSpecification:
                         + str(field.default)
                     )
 
-        # Evaluate lazy description if callable.
-        desc = (
-            description
-            if description is not None
-            else _docstrings.get_callable_description(f)
-        )
-        if callable(desc):
-            desc = desc()
-        # If still None after evaluation, use empty string.
-        if desc is None:
-            desc = ""
-
         parser_spec = ParserSpecification(
             f=f,
             markers=markers,
-            description=_strings.remove_single_line_breaks(desc),
+            description=_evaluate_description(description, f),
             args=args,
             field_list=field_list,
             child_from_prefix=child_from_prefix,
@@ -298,6 +317,101 @@ class ParserSpecification:
 
         return parser_spec
 
+    def relocated(
+        self,
+        *,
+        template_default: Any,
+        default_instance: Any,
+        description: str | Callable[[], str | None] | None,
+        intern_prefix: str,
+        extern_prefix: str,
+        subcommand_prefix: str,
+        prog_suffix: str,
+    ) -> ParserSpecification:
+        """Copy this specification to a new location in the parser tree, without
+        rebuilding field lists or argument lowering.
+
+        `template_default` is the default instance that this specification was
+        created with. `default_instance` should have the same fingerprint; its
+        values replace the template's field defaults.
+        """
+        # Map the template's (mutable) default values to their counterparts in
+        # the new default instance.
+        new_default_from_id: Dict[int, Any] = {}
+        if default_instance is not template_default:
+            template_parts = _default_parts(template_default)
+            new_parts = _default_parts(default_instance)
+            if template_parts is not None and new_parts is not None:
+                for key, value in template_parts.items():
+                    if not _is_shareable(value):
+                        new_default_from_id[id(value)] = new_parts[key]
+
+        def relocate_field(field: _fields.FieldDefinition) -> _fields.FieldDefinition:
+            new_default = new_default_from_id.get(id(field.default), field.default)
+            if new_default is field.default:
+                return field
+            return dataclasses.replace(field, default=new_default)
+
+        args: list[_arguments.ArgumentDefinition] = []
+        field_list: list[_fields.FieldDefinition] = []
+        child_from_prefix: Dict[str, ParserSpecification] = {}
+        helptext_from_intern_prefixed_field_name: Dict[
+            str, str | Callable[[], str | None] | None
+        ] = {}
+        template_args = iter(self.args)
+        for field in self.field_list:
+            new_field = relocate_field(field)
+            field_list.append(new_field)
+
+            template_field_name = _strings.make_field_name(
+                [self.intern_prefix, field.intern_name]
+            )
+            child = self.child_from_prefix.get(template_field_name)
+            if child is None:
+                template_arg = next(template_args)
+                assert template_arg.field.intern_name == field.intern_name
+                args.append(
+                    _arguments.ArgumentDefinition(
+                        intern_prefix=intern_prefix,
+                        extern_prefix=extern_prefix,
+                        subcommand_prefix=subcommand_prefix,
+                        field=relocate_field(template_arg.field),
+                        template=template_arg,
+                    )
+                )
+                continue
+
+            field_name = _strings.make_field_name([intern_prefix, field.intern_name])
+            child_from_prefix[field_name] = child.relocated(
+                template_default=field.default,
+                default_instance=new_field.default,
+                description=new_field.helptext,
+                intern_prefix=field_name,
+                extern_prefix=_nested_extern_prefix(field, extern_prefix),
+                subcommand_prefix=subcommand_prefix,
+                prog_suffix=prog_suffix,
+            )
+            helptext_from_intern_prefixed_field_name[field_name] = (
+                self.helptext_from_intern_prefixed_field_name[template_field_name]
+            )
+
+        return ParserSpecification(
+            f=self.f,
+            markers=self.markers,
+            description=_evaluate_description(description, self.f),
+            args=args,
+            field_list=field_list,
+            child_from_prefix=child_from_prefix,
+            helptext_from_intern_prefixed_field_name=helptext_from_intern_prefixed_field_name,
+            subparsers_from_intern_prefix={},
+            intern_prefix=intern_prefix,
+            extern_prefix=extern_prefix,
+            has_required_args=self.has_required_args,
+            subparser_parent=None,
+            prog_suffix=prog_suffix,
+            template=self,
+        )
+
     def get_args_including_children(
         self,
         local_root: ParserSpecification | None = None,
@@ -331,15 +445,22 @@ def handle_field(
     # Check that the default value matches the final resolved type.
     # There's some similar Union-specific logic for this in narrow_union_type(). We
     # may be able to consolidate this.
+    #
+    # The type check runs last, since it's the most expensive condition. How
+    # thorough it is can be configured via `tyro.conf.DefaultValidation*`.
     if (
-        not _resolver.is_instance(field.type_stripped, field.default)
         # If a custom constructor is set, static_type may not be
         # matched to the annotated type.
-        and field.argconf.constructor_factory is None
+        field.argconf.constructor_factory is None
         and not _singleton.is_sentinel(field.default)
         # The numeric tower in Python is wacky. This logic is non-critical, so
         # we'll just skip it (+the complexity) for numbers.
         and not isinstance(field.default, numbers.Number)
+        and not _resolver.is_default_instance(
+            field.type_stripped,
+            field.default,
+            _resolver.default_validation_policy(field.markers),
+        )
     ):
         # If the default value doesn't match the resolved type, we expand the
         # type. This is inspired by https://github.com/brentyi/tyro/issues/88.
@@ -350,8 +471,15 @@ def handle_field(
             f"We'll try to handle this gracefully, but it may cause unexpected behavior."
         )
         warnings.warn(message)
+        default_type: Any = type(field.default)
+        if _resolver.inspects_all_elements(field.markers):
+            # When every element is inspected, a bare container type can't be
+            # matched against a large default, so we narrow it first.
+            default_type = _resolver.narrow_collection_types(
+                default_type, field.default, exhaustive=True
+            )
         field = field.with_new_type_stripped(
-            Union[field.type_stripped, type(field.default)]  # type: ignore
+            Union[field.type_stripped, default_type]  # type: ignore
         )
 
     # Force primitive if (1) the field is annotated with a primitive constructor spec, or (2) if
@@ -383,10 +511,26 @@ def handle_field(
             if subparsers_attempt is not None:
                 return subparsers_attempt
 
-        # (2) Handle nested callables.
+        # (2) Handle nested callables. Struct types that were already built
+        # elsewhere in the tree are relocated from a template, which saves us from
+        # rebuilding their field lists and arguments.
+        template_key = _spec_template_key(field)
+        if template_key is not None and template_key in _spec_template_from_key:
+            template, template_default = _spec_template_from_key[template_key]
+            return template.relocated(
+                template_default=template_default,
+                default_instance=field.default,
+                description=field.helptext,
+                intern_prefix=_strings.make_field_name(
+                    [intern_prefix, field.intern_name]
+                ),
+                extern_prefix=_nested_extern_prefix(field, extern_prefix),
+                subcommand_prefix=subcommand_prefix,
+                prog_suffix=prog_suffix,
+            )
         if _fields.is_struct_type(field.type, field.default, in_union_context=False):
             # Keep description lazy - don't evaluate yet.
-            return ParserSpecification.from_callable_or_type(
+            parser_spec = ParserSpecification.from_callable_or_type(
                 field.type_stripped,
                 markers=field.markers,
                 description=field.helptext,
@@ -395,15 +539,14 @@ def handle_field(
                 intern_prefix=_strings.make_field_name(
                     [intern_prefix, field.intern_name]
                 ),
-                extern_prefix=(
-                    _strings.make_field_name([extern_prefix, field.extern_name])
-                    if field.argconf.prefix_name in (True, None)
-                    else field.extern_name
-                ),
+                extern_prefix=_nested_extern_prefix(field, extern_prefix),
                 subcommand_prefix=subcommand_prefix,
                 support_single_arg_types=False,
                 prog_suffix=prog_suffix,
             )
+            if template_key is not None and _is_relocatable(parser_spec, field.default):
+                _spec_template_from_key[template_key] = (parser_spec, field.default)
+            return parser_spec
 
     # (3) Handle primitive or fixed types. These produce a single argument!
     arg = _arguments.ArgumentDefinition(
@@ -430,6 +573,161 @@ def handle_field(
     return arg
 
 
+def _nested_extern_prefix(field: _fields.FieldDefinition, extern_prefix: str) -> str:
+    """Get the extern prefix for the fields of a nested struct."""
+    if field.argconf.prefix_name in (True, None):
+        return _strings.make_field_name([extern_prefix, field.extern_name])
+    else:
+        return field.extern_name
+
+
+def _evaluate_description(
+    description: str | Callable[[], str | None] | None, f: Callable
+) -> str:
+    """Evaluate the (possibly lazy) description of a parser."""
+    desc = (
+        description
+        if description is not None
+        else _docstrings.get_callable_description(f)
+    )
+    if callable(desc):
+        desc = desc()
+    # If still None after evaluation, use empty string.
+    if desc is None:
+        desc = ""
+    return _strings.remove_single_line_breaks(desc)
+
+
+_spec_template_from_key: Dict[Hashable, Tuple[ParserSpecification, Any]] = (
+    _unsafe_cache.cleared_dict()
+)
+"""Parser specifications for nested struct types, which can be relocated to
+other prefixes. Each is stored with the default instance it was built with."""
+
+_MAX_FINGERPRINT_DEPTH = 8
+_MAX_FINGERPRINT_ITEMS = 64
+
+
+def _spec_template_key(field: _fields.FieldDefinition) -> Hashable | None:
+    """Key for looking up a template for a nested struct field. Returns None if
+    the field can't be keyed."""
+    key = (
+        field.type,
+        frozenset(field.markers),
+        _default_fingerprint(field.default, depth=0),
+        tuple(_fields.global_context_markers),
+        tuple(ConstructorRegistry._active_registries),
+        _strings.get_delimiter(),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _is_shareable(value: Any) -> bool:
+    """Returns True for (immutable) default values that relocated specifications
+    can share with their template."""
+    if (
+        value is None
+        or type(value) in (bool, int, float, complex, str, bytes)
+        or _singleton.is_sentinel(value)
+        or isinstance(
+            value,
+            (type, enum.Enum, types.FunctionType, types.BuiltinFunctionType),
+        )
+    ):
+        return True
+    if type(value) in (tuple, frozenset) and len(value) <= _MAX_FINGERPRINT_ITEMS:
+        return all(map(_is_shareable, value))
+    return False
+
+
+def _default_parts(value: Any) -> Dict[Any, Any] | None:
+    """Get the values contained in a dataclass, msgspec struct, dictionary, list,
+    or tuple default. Returns None for other values."""
+    typ = type(value)
+    if typ is dict:
+        return value
+    if typ in (list, tuple):
+        return dict(enumerate(value))
+    struct_fields = getattr(typ, "__struct_fields__", None)
+    if isinstance(struct_fields, tuple):
+        # msgspec structs.
+        return {name: getattr(value, name) for name in struct_fields}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        try:
+            return {
+                field.name: getattr(value, field.name)
+                for field in dataclasses.fields(value)
+            }
+        except AttributeError:
+            return None
+    return None
+
+
+def _default_fingerprint(value: Any, depth: int) -> Hashable:
+    """Fingerprint for a default value. Values with equal fingerprints produce
+    equivalent parser specifications.
+
+    Primitives, containers, dataclasses, and msgspec structs are fingerprinted by
+    value. All other values, as well as very large or deeply nested ones, are
+    fingerprinted by identity.
+    """
+    typ = type(value)
+    if value is None or typ in (bool, int, str, bytes):
+        return (typ, value)
+    if typ in (float, complex):
+        # `repr()` distinguishes values like -0.0 and 0.0.
+        return (typ, repr(value))
+    if isinstance(value, enum.Enum):
+        return (typ, value.name)
+    if depth < _MAX_FINGERPRINT_DEPTH:
+        if typ in (set, frozenset) and len(value) <= _MAX_FINGERPRINT_ITEMS:
+            return (
+                typ,
+                frozenset(_default_fingerprint(v, depth + 1) for v in value),
+            )
+        parts = _default_parts(value)
+        if parts is not None and len(parts) <= _MAX_FINGERPRINT_ITEMS:
+            return (
+                typ,
+                tuple(
+                    (k, _default_fingerprint(v, depth + 1)) for k, v in parts.items()
+                ),
+            )
+    return (typ, id(value))
+
+
+def _is_relocatable(parser_spec: ParserSpecification, default_instance: Any) -> bool:
+    """Check that a parser specification can be used as a template. Mutable field
+    defaults need to come from the default instance, so they can be swapped out
+    when the specification is relocated."""
+    if len(parser_spec.subparsers_from_intern_prefix) > 0:
+        return False
+
+    parts = _default_parts(default_instance)
+    part_ids = [
+        id(v) for v in ({} if parts is None else parts).values() if not _is_shareable(v)
+    ]
+    part_id_set = set(part_ids)
+    if len(part_id_set) != len(part_ids):
+        return False
+
+    for field in parser_spec.field_list + [arg.field for arg in parser_spec.args]:
+        if not _is_shareable(field.default) and id(field.default) not in part_id_set:
+            return False
+
+    for field in parser_spec.field_list:
+        child = parser_spec.child_from_prefix.get(
+            _strings.make_field_name([parser_spec.intern_prefix, field.intern_name])
+        )
+        if child is not None and not _is_relocatable(child, field.default):
+            return False
+    return True
+
+
 def _validated_aliases(
     aliases_from_name: Dict[str, Tuple[str, ...]],
     parser_from_name: Dict[str, Any],
@@ -471,10 +769,12 @@ class SubparsersSpecification:
     description: str | Callable[[], str | None] | None
     parser_from_name: Dict[str, LazyParserSpecification]
     default_name: str | None
-    default_parser: ParserSpecification | None
     intern_prefix: str
     extern_prefix: str
-    required: bool
+    _required: bool | None
+    """Whether a subcommand must be selected. `None` means that this depends on
+    the default subcommand, which is only evaluated when needed; see
+    `required`."""
     default_instance: Any
     options: Tuple[Union[Type[Any], Callable], ...]
     prog_suffix: str
@@ -482,6 +782,54 @@ class SubparsersSpecification:
         default_factory=dict
     )
 
+    @property
+    def required(self) -> bool:
+        """Whether a subcommand must be selected."""
+        if self._required is not None:
+            return self._required
+        return self._resolve_default()[0]
+
+    @property
+    def default_parser(self) -> ParserSpecification | None:
+        """Parser for the default subcommand, if it can be used without any
+        further arguments."""
+        if self.default_name is None:
+            return None
+        return self._resolve_default()[1]
+
+    def _resolve_default(self) -> Tuple[bool, ParserSpecification | None]:
+        """Evaluate the default subcommand to check for required
+        args/subparsers. This is deferred so that selecting a different
+        subcommand, or printing its helptext, never evaluates the default
+        subcommand's subtree. Cached on the spec instance."""
+        cached = self.__dict__.get("_resolved_default")
+        if cached is not None:
+            return cached
+
+        assert self.default_name is not None
+        default_parser = self.parser_from_name[self.default_name].evaluate()
+        # Error should have been caught earlier.
+        assert not isinstance(default_parser, UnsupportedTypeAnnotationError), (
+            "Unexpected UnsupportedTypeAnnotationError in backend"
+        )
+
+        out: Tuple[bool, ParserSpecification | None]
+        if any(map(lambda arg: arg.lowered.required, default_parser.args)):
+            # If there are any required arguments.
+            out = (True, None)
+        elif any(
+            subparser_spec.required
+            for subparser_spec in default_parser.subparsers_from_intern_prefix.values()
+        ):
+            # If there are any required subparsers.
+            out = (True, None)
+        else:
+            out = (False, default_parser)
+
+        # Frozen dataclass: bypass __setattr__ to memoize.
+        object.__setattr__(self, "_resolved_default", out)
+        return out
+
     def display_name(self, canonical: str) -> str:
         """Render a subcommand name with its aliases for help output:
         ``"add (sum, +)"`` when aliases exist, otherwise just ``"add"``."""
@@ -783,6 +1131,7 @@ class SubparsersSpecification:
 
             # Create lazy parser: defer expensive parsing until actually needed.
             def parser_factory(
+                *,
                 option_captured: Any = option,
                 markers_captured: Set[_markers._Marker] = field.markers,
                 subcommand_config_captured: _confstruct._SubcommandConfig = subcommand_config,
@@ -830,8 +1179,9 @@ class SubparsersSpecification:
             default_name = None
 
         # Required if a default is passed in, but the default value has missing
-        # parameters.
-        default_parser = None
+        # parameters. When there is a default, this is resolved lazily; see
+        # `SubparsersSpecification.required`.
+        required: bool | None
         if default_name is None:
             # Special case for DisallowNone: if the default would be None but we
             # suppressed the None subcommand due to DisallowNone, keep it optional.
@@ -843,29 +1193,7 @@ class SubparsersSpecification:
                 # is selected, the field will be excluded from the result (see _calling.py).
                 required = field.default is not _singleton.EXCLUDE_FROM_CALL
         else:
-            required = False
-            # Evaluate the lazy parser to check for required args/subparsers.
-            default_parser_evaluated = parser_from_name[default_name].evaluate()
-            # Error should have been caught earlier.
-            assert not isinstance(
-                default_parser_evaluated, UnsupportedTypeAnnotationError
-            ), "Unexpected UnsupportedTypeAnnotationError in backend"
-
-            # If there are any required arguments.
-            if any(
-                map(lambda arg: arg.lowered.required, default_parser_evaluated.args)
-            ):
-                required = True
-                default_parser = None
-            # If there are any required subparsers.
-            elif any(
-                subparser_spec.required
-                for subparser_spec in default_parser_evaluated.subparsers_from_intern_prefix.values()
-            ):
-                required = True
-                default_parser = None
-            else:
-                default_parser = default_parser_evaluated
+            required = None
 
         return SubparsersSpecification(
             # If we wanted, we could add information about the default instance
@@ -875,10 +1203,9 @@ class SubparsersSpecification:
             description=field.helptext,
             parser_from_name=parser_from_name,
             default_name=default_name,
-            default_parser=default_parser,
             intern_prefix=intern_prefix,
             extern_prefix=extern_prefix,
-            required=required,
+            _required=required,
             default_instance=field.default,
             options=tuple(options),
             prog_suffix=prog_suffix,
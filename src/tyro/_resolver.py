@@ -6,6 +6,7 @@ import collections.abc
 import copy
 import dataclasses
 import inspect
+import itertools
 import sys
 import types
 import warnings
@@ -13,6 +14,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -32,6 +34,7 @@ from typing_extensions import (
     NoDefault,
     Self,
     TypeAliasType,
+    assert_never,
     get_args,
     get_origin,
     get_original_bases,
@@ -45,6 +48,7 @@ from ._typing_compat import (
     is_typing_classvar,
     is_typing_final,
     is_typing_generic,
+    is_typing_literal,
     is_typing_protocol,
     is_typing_readonly,
     is_typing_typealiastype,
@@ -233,10 +237,32 @@ def swap_type_using_confstruct(typ: TypeOrCallable) -> TypeOrCallable:
     return typ
 
 
+SAMPLED_ELEMENT_COUNT = 32
+"""Number of elements inspected by the sampled fast path for large containers."""
+
+
+def sample_elements(values: collections.abc.Collection[Any]) -> Sequence[Any]:
+    """Bounded sample of a container's elements. For sequences, the sample
+    includes both the first and last elements, and the rest are evenly spaced.
+    For other containers, the sample is the first elements."""
+    count = len(values)
+    if count <= SAMPLED_ELEMENT_COUNT:
+        return list(values)
+    if isinstance(values, collections.abc.Sequence):
+        return [
+            values[i * (count - 1) // (SAMPLED_ELEMENT_COUNT - 1)]
+            for i in range(SAMPLED_ELEMENT_COUNT)
+        ]
+    return list(itertools.islice(values, SAMPLED_ELEMENT_COUNT))
+
+
 def narrow_collection_types(
-    typ: TypeOrCallable, default_instance: Any
+    typ: TypeOrCallable, default_instance: Any, exhaustive: bool = False
 ) -> TypeOrCallable:
-    """Type narrowing for containers. Infers types of container contents."""
+    """Type narrowing for containers. Infers types of container contents.
+
+    Unless `exhaustive` is set, element types of large containers are inferred
+    using a fast path; see `tyro.conf.DefaultValidationFull`."""
 
     # Can't narrow if we don't have a default value!
     if is_missing(default_instance):
@@ -244,7 +270,28 @@ def narrow_collection_types(
 
     # We'll recursively narrow contained types too!
     def _get_type(val: Any) -> Type:
-        return narrow_collection_types(type(val), val)
+        return narrow_collection_types(type(val), val, exhaustive)
+
+    def _get_element_types(vals: collections.abc.Collection[Any]) -> tuple[Type, ...]:
+        """Narrowed element types, deduplicated in order of first appearance."""
+        # Narrowing only changes the types of list, set, and tuple elements.
+        # For everything else, we can skip recursing into each element.
+        element_types = tuple(dict.fromkeys(map(type, vals)))
+        if all(t not in (list, set, tuple) for t in element_types):
+            return element_types
+
+        # Nested containers are expensive to narrow. If all elements share a
+        # container type and a sample of them narrows uniformly, we assume that
+        # the rest of the elements do too.
+        if (
+            not exhaustive
+            and len(element_types) == 1
+            and len(vals) > SAMPLED_ELEMENT_COUNT
+        ):
+            sampled_types = tuple(dict.fromkeys(map(_get_type, sample_elements(vals))))
+            if len(sampled_types) == 1:
+                return sampled_types
+        return tuple(dict.fromkeys(map(_get_type, vals)))
 
     args = get_args(typ)
     origin = get_origin(typ)
@@ -259,23 +306,23 @@ def narrow_collection_types(
     ):
         if len(default_instance) == 0:
             return typ
-        typ = List[Union[tuple(map(_get_type, default_instance))]]  # type: ignore
+        typ = List[Union[_get_element_types(default_instance)]]  # type: ignore
     elif typ in (set, Sequence, collections.abc.Sequence) and isinstance(
         default_instance, set
     ):
         if len(default_instance) == 0:
             return typ
-        typ = Set[Union[tuple(map(_get_type, default_instance))]]  # type: ignore
+        typ = Set[Union[_get_element_types(default_instance)]]  # type: ignore
     elif typ in (tuple, Sequence, collections.abc.Sequence) and isinstance(
         default_instance, tuple
     ):
         if len(default_instance) == 0:
             return typ
-        default_types = tuple(map(_get_type, default_instance))
-        if len(set(default_types)) == 1:
+        default_types = _get_element_types(default_instance)
+        if len(default_types) == 1:
             typ = Tuple[default_types[0], Ellipsis]  # type: ignore
         else:
-            typ = Tuple[default_types]  # type: ignore
+            typ = Tuple[tuple(map(_get_type, default_instance))]  # type: ignore
     elif (
         origin is tuple
         and isinstance(default_instance, tuple)
@@ -522,6 +569,11 @@ class TypeParamResolver:
             origin = get_origin(typ)
             callable_was_flattened = False
 
+            # `Literal[...]` arguments are values, not types. Skipping them
+            # matters for very large choice sets.
+            if is_typing_literal(origin):
+                return typ
+
             # Filter args based on type.
             #
             # For Annotated types, we only process the first arg (the actual type),
@@ -1066,3 +1118,134 @@ def is_instance(typ: Any, value: Any) -> bool:
         return True
     except (typeguard.TypeCheckError, TypeError):
         return False
+
+
+DefaultValidationPolicy = Literal["full", "sampled", "shallow", "off"]
+
+
+def merge_markers(outer: Iterable[Any], inner: Iterable[Any]) -> set[Any]:
+    """Combine markers from an outer scope, like a parent struct or `config=`,
+    with markers from an inner one. The innermost `tyro.conf.DefaultValidation*`
+    marker overrides the others."""
+    policy_markers = (
+        conf.DefaultValidationFull,
+        conf.DefaultValidationSampled,
+        conf.DefaultValidationShallow,
+        conf.DefaultValidationOff,
+    )
+    inner = tuple(inner)
+    inner_policies = [m for m in inner if m in policy_markers]
+    if len(inner_policies) == 0:
+        return set(outer) | set(inner)
+    return {m for m in itertools.chain(outer, inner) if m not in policy_markers} | {
+        inner_policies[-1]
+    }
+
+
+def default_validation_policy(markers: Any) -> DefaultValidationPolicy:
+    """Policy selected by the `tyro.conf.DefaultValidation*` markers, which are
+    combined with `merge_markers()`. If several are present, the most thorough
+    one is used."""
+    if conf.DefaultValidationFull in markers:
+        return "full"
+    elif conf.DefaultValidationSampled in markers:
+        return "sampled"
+    elif conf.DefaultValidationShallow in markers:
+        return "shallow"
+    elif conf.DefaultValidationOff in markers:
+        return "off"
+    return "sampled"
+
+
+def inspects_all_elements(markers: Any) -> bool:
+    """Whether every element of container defaults should be inspected when
+    inferring and matching types, instead of a sample."""
+    return default_validation_policy(markers) == "full"
+
+
+def is_default_instance(typ: Any, value: Any, policy: DefaultValidationPolicy) -> bool:
+    """Check that a default value matches its annotated type. The amount of
+    work done is bounded by `policy`."""
+    if policy == "off":
+        return True
+    elif policy == "shallow":
+        return _is_instance_shallow(typ, value)
+    elif policy == "sampled":
+        return _is_instance_sampled(typ, value)
+    elif policy == "full":
+        import typeguard
+
+        try:
+            typeguard.check_type(
+                value,
+                typ,
+                collection_check_strategy=typeguard.CollectionCheckStrategy.ALL_ITEMS,
+            )
+            return True
+        except (typeguard.TypeCheckError, TypeError):
+            return False
+    else:
+        assert_never(policy)
+
+
+def _is_instance_shallow(typ: Any, value: Any) -> bool:
+    """Check only the top-level type of a value."""
+    origin = get_origin(typ)
+    if is_typing_union(origin):
+        return any(_is_instance_shallow(arg, value) for arg in get_args(typ))
+    if is_typing_annotated(origin):
+        return _is_instance_shallow(get_args(typ)[0], value)
+    if isinstance(origin, type):
+        return isinstance(value, origin)
+    return is_instance(typ, value)
+
+
+_SAMPLED_SEQUENCE_ORIGINS = (
+    list,
+    set,
+    frozenset,
+    collections.deque,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+)
+
+
+def _is_instance_sampled(typ: Any, value: Any) -> bool:
+    """Check a value, inspecting a bounded sample of container elements."""
+    # Sentinels like `tyro.MISSING` can be nested in defaults; they're
+    # accepted as instances of any type.
+    if is_sentinel(value):
+        return True
+    origin = get_origin(typ)
+    args = get_args(typ)
+    if is_typing_union(origin):
+        return any(_is_instance_sampled(arg, value) for arg in args)
+    if is_typing_annotated(origin):
+        return _is_instance_sampled(args[0], value)
+
+    if origin in _SAMPLED_SEQUENCE_ORIGINS and len(args) == 1:
+        return isinstance(value, origin) and all(
+            _is_instance_sampled(args[0], v) for v in sample_elements(value)
+        )
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        return isinstance(value, tuple) and all(
+            _is_instance_sampled(args[0], v) for v in sample_elements(value)
+        )
+    if origin in (dict, collections.abc.Mapping, collections.abc.MutableMapping) and (
+        len(args) == 2
+    ):
+        return isinstance(value, origin) and all(
+            _is_instance_sampled(args[0], k) and _is_instance_sampled(args[1], v)
+            for k, v in sample_elements(value.items())
+        )
+
+    if origin is tuple and len(args) > 0 and args != ((),):
+        return (
+            isinstance(value, tuple)
+            and len(value) == len(args)
+            and all(_is_instance_sampled(a, v) for a, v in zip(args, value))
+        )
+
+    return is_instance(typ, value)
@@ -22,8 +22,10 @@ def delimiter_context(delimiter: Literal["-", "_"]):
     global DELIMITER
     delimiter_restore = DELIMITER
     DELIMITER = delimiter
-    yield
-    DELIMITER = delimiter_restore
+    try:
+        yield
+    finally:
+        DELIMITER = delimiter_restore
 
 
 def get_delimiter() -> Literal["-", "_"]:
@@ -55,6 +57,14 @@ def make_field_name(parts: Sequence[str]) -> str:
     ('parents', '1', '_child_node') => 'parents.1._child-node'
     ('parents', '1', 'middle._child_node') => 'parents.1.middle._child-node'
     """
+    return _make_field_name(tuple(parts), DELIMITER)
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_field_name(parts: Tuple[str, ...], delimiter: str) -> str:
+    # The delimiter is part of the cache key, since it determines the output of
+    # `swap_delimiters()`.
+    del delimiter
     out = ".".join(parts)
     return ".".join(swap_delimiters(part) for part in out.split(".") if len(part) > 0)
 
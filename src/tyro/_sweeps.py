@@ -0,0 +1,142 @@
+"""Expansion of sweep syntax, like `--lr 1e-3,3e-4 --seed 0..9`, into a lazy
+cartesian product of outputs. Used by :func:`tyro.cli_sweep()`."""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any, Callable, Iterator, Mapping
+
+from . import _arguments, _calling, _errors, _parsers, _singleton, _strings
+
+
+def parse_sweep_values(token: str) -> list[str]:
+    """Split a sweep token into the values it sweeps over.
+
+    Values are separated by commas. Each comma-separated part can also be an
+    inclusive integer range, written as `start..stop`. Tokens that contain
+    neither are returned as-is.
+    """
+    out: list[str] = []
+    for part in token.split(","):
+        start, sep, stop = part.partition("..")
+        if sep != "":
+            try:
+                start_int, stop_int = int(start), int(stop)
+            except ValueError:
+                pass
+            else:
+                step = 1 if stop_int >= start_int else -1
+                out.extend(str(i) for i in range(start_int, stop_int + step, step))
+                continue
+        out.append(part)
+    return out
+
+
+def _sweepable_args(
+    parser_spec: _parsers.ParserSpecification,
+    values: Mapping[str | None, Any],
+) -> Iterator[tuple[str, _arguments.ArgumentDefinition]]:
+    """Yield the arguments, keyed by prefixed field name, that sweep syntax can
+    be used with. These are single-value numeric, `Literal`, and enum
+    arguments."""
+    for arg in parser_spec.args:
+        if arg.lowered.sweepable:
+            yield (
+                _strings.make_field_name([arg.intern_prefix, arg.field.intern_name]),
+                arg,
+            )
+    for child in parser_spec.child_from_prefix.values():
+        yield from _sweepable_args(child, values)
+    for intern_prefix, subparsers in parser_spec.subparsers_from_intern_prefix.items():
+        # Only the selected subcommand has values to sweep over.
+        name = values.get(_strings.make_subparser_dest(intern_prefix))
+        if name is None:
+            continue
+        name = subparsers.canonical_from_alias().get(name, name)
+        evaluated = subparsers.parser_from_name[name].evaluate()
+        if isinstance(evaluated, _parsers.ParserSpecification):
+            yield from _sweepable_args(evaluated, values)
+
+
+def sweep_callable(
+    f: Callable[..., Any],
+    parser_spec: _parsers.ParserSpecification,
+    default_instance: Any,
+    values: dict[str | None, Any],
+) -> Callable[[], Iterator[Any]]:
+    """Returns a function that lazily produces one output for each point in the
+    cartesian product of swept values.
+
+    The parsed values are shared across points. Values that are not swept are
+    converted from strings once and then reused if they are immutable.
+
+    Raises `_calling.InstantiationError` if any swept value is invalid.
+    """
+    axes: list[tuple[str, list[Any]]] = []
+    for prefixed_field_name, arg in _sweepable_args(parser_spec, values):
+        value = values.get(prefixed_field_name, _singleton.MISSING_NONPROP)
+        if _singleton.is_missing(value):
+            continue
+        token = value if arg.lowered.nargs == "?" else value[0]
+        choices = arg.lowered.sweep_choices
+        options = (
+            [token]
+            if choices is not None and token in choices
+            else parse_sweep_values(token)
+        )
+
+        # Check every value before producing any outputs. The backend doesn't
+        # check choices for sweepable arguments, so this includes values that
+        # aren't swept.
+        for option in options:
+            if choices is not None and option not in choices:
+                choices_text, close_matches = _errors._describe_choices(
+                    tuple(choices), option
+                )
+                message = f"invalid choice: {option!r} (choose from {choices_text})"
+                if close_matches:
+                    message += f"; did you mean {', '.join(map(repr, close_matches))}?"
+                raise _calling.InstantiationError(message, arg)
+            assert arg.lowered.instance_from_str is not None
+            try:
+                arg.lowered.instance_from_str([option])
+            except (ValueError, TypeError) as e:
+                raise _calling.InstantiationError(e.args[0] if e.args else str(e), arg)
+        if options == [token]:
+            continue
+
+        # Each option is wrapped once, so that identical options are recognized
+        # by the conversion cache in `callable_with_args()`.
+        axes.append(
+            (
+                prefixed_field_name,
+                [
+                    option if arg.lowered.nargs == "?" else [option]
+                    for option in options
+                ],
+            )
+        )
+
+    converted_values: dict[str, tuple[Any, Any]] = {}
+    keys = [prefixed_field_name for prefixed_field_name, _ in axes]
+
+    def get_outputs() -> Iterator[Any]:
+        # Swept values are written into a single copy of the parsed values, so
+        # each point only costs as much as the number of swept arguments.
+        point_values = dict(values)
+        for point in itertools.product(*(options for _, options in axes)):
+            point_values.update(zip(keys, point))
+            get_out, _ = _calling.callable_with_args(
+                f,
+                parser_spec,
+                default_instance,
+                point_values,
+                field_name_prefix="",
+                converted_values=converted_values,
+            )
+            out = get_out()
+            while isinstance(out, _calling.DummyWrapper):
+                out = out.__tyro_dummy_inner__
+            yield out
+
+    return get_outputs
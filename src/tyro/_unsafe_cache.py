@@ -13,6 +13,12 @@ def clear_cache() -> None:
         c.clear()
 
 
+def cleared_dict() -> Dict[Any, Any]:
+    """Returns a dictionary that will be emptied by `clear_cache()`."""
+    _cache_list.append({})
+    return _cache_list[-1]
+
+
 def unsafe_cache(maxsize: int) -> Callable[[CallableType], CallableType]:
     """Cache decorator that relies object IDs when arguments are unhashable. Makes the
     very strong assumption of not only immutability, but that unhashable types don't go
@@ -24,6 +24,10 @@ from ._confstruct import subcommand as subcommand
 from ._markers import AvoidSubcommands as AvoidSubcommands
 from ._markers import CascadeSubcommandArgs as CascadeSubcommandArgs
 from ._markers import ConsolidateSubcommandArgs as ConsolidateSubcommandArgs
+from ._markers import DefaultValidationFull as DefaultValidationFull
+from ._markers import DefaultValidationOff as DefaultValidationOff
+from ._markers import DefaultValidationSampled as DefaultValidationSampled
+from ._markers import DefaultValidationShallow as DefaultValidationShallow
 from ._markers import DisallowNone as DisallowNone
 from ._markers import EnumChoicesFromValues as EnumChoicesFromValues
 from ._markers import Fixed as Fixed
@@ -35,11 +39,14 @@ from ._markers import OmitArgPrefixes as OmitArgPrefixes
 from ._markers import OmitSubcommandPrefixes as OmitSubcommandPrefixes
 from ._markers import Positional as Positional
 from ._markers import PositionalRequiredArgs as PositionalRequiredArgs
+from ._markers import PydanticValidationOff as PydanticValidationOff
 from ._markers import ShowSourcePath as ShowSourcePath
 from ._markers import Suppress as Suppress
 from ._markers import SuppressFixed as SuppressFixed
 from ._markers import UseAppendAction as UseAppendAction
+from ._markers import UseArgFiles as UseArgFiles
 from ._markers import UseCounterAction as UseCounterAction
+from ._markers import UseMsgspecConvert as UseMsgspecConvert
 from ._markers import (
     UsePythonSyntaxForLiteralCollections as UsePythonSyntaxForLiteralCollections,
 )
@@ -46,6 +46,9 @@ Example::
 # Private marker.
 _OPTIONAL_GROUP = Annotated[T, None]
 
+# Private marker, applied by `tyro.cli_sweep()`.
+_SWEEP_SYNTAX = Annotated[T, None]
+
 # TODO: the verb tenses here are inconsistent, naming could be revisited.
 # Perhaps Suppress should be Suppressed? But SuppressedFixed would be weird.
 
@@ -473,6 +476,88 @@ sure that original subcommand defaults are preserved.
 Tip: consider also applying :data:`CascadeSubcommandArgs`.
 """
 
+DefaultValidationFull = Annotated[T, None]
+"""Inspect every element of container defaults, when validating them against
+their annotations and when inferring their element types. This can be slow for
+large defaults, but is useful in tests and CI.
+
+Example::
+
+    tyro.cli(Config, config=(tyro.conf.DefaultValidationFull,) if in_ci else ())
+
+The other policies are :data:`DefaultValidationSampled` (the default),
+:data:`DefaultValidationShallow`, and :data:`DefaultValidationOff`. Except with
+this marker, large containers are inspected using an evenly spaced sample of
+their elements. When several policies apply to a field, the innermost one is
+used: a field's own annotation overrides its parent struct, which overrides
+``config=``.
+"""
+
+DefaultValidationSampled = Annotated[T, None]
+"""Validate default values against their annotated types, checking the first,
+last, and a bounded number of evenly spaced container elements. This is the
+default behavior. See :data:`DefaultValidationFull`."""
+
+DefaultValidationShallow = Annotated[T, None]
+"""Validate only the top-level type of default values. See
+:data:`DefaultValidationFull`."""
+
+DefaultValidationOff = Annotated[T, None]
+"""Skip validation of default values against their annotated types. See
+:data:`DefaultValidationFull`."""
+
+UseArgFiles = Annotated[T, None]
+"""Expand ``@path`` arguments into the contents of the file at ``path``.
+
+Each line of an argument file is read as a single argument, matching the
+convention used by :class:`argparse.ArgumentParser`'s ``fromfile_prefix_chars``.
+Argument files can reference other argument files, and ``@-`` reads arguments
+from standard input. Files are expanded before parsing.
+
+This marker only has an effect when passed to :func:`tyro.cli` via ``config=``,
+or when applied to the type or function passed to :func:`tyro.cli`. It is off
+by default, since values that begin with ``@`` would otherwise be treated as
+file paths.
+
+Example::
+
+    # Run with `python script.py @args.txt`.
+    tyro.cli(Config, config=(tyro.conf.UseArgFiles,))
+    tyro.cli(tyro.conf.UseArgFiles[Config])
+"""
+
+PydanticValidationOff = Annotated[T, None]
+"""Build Pydantic models without validating the values parsed by tyro.
+
+tyro converts each argument to its annotated type before a model is
+instantiated, so validating these values again in Pydantic is usually redundant.
+With this marker, models are built with ``model_construct()`` (or ``construct()``
+for Pydantic v1) instead. Models are still validated if they define validators,
+field constraints, or an ``__init__()`` override, or if their config sets options
+that transform values, like ``str_to_upper`` or ``use_enum_values``.
+
+Default factories of fields that are parsed from a single argument are also
+deferred: instead of being called when the CLI is built, they are called by
+Pydantic only if the field is left unset.
+
+Example::
+
+    tyro.cli(Settings, config=(tyro.conf.PydanticValidationOff,))
+"""
+
+UseMsgspecConvert = Annotated[T, None]
+"""Build :class:`msgspec.Struct` types with :func:`msgspec.convert`.
+
+By default, structs are instantiated by calling the struct type with the values
+parsed by tyro, which skips msgspec's validation. With this marker, structs are
+built by msgspec's compiled converter instead, which validates values against
+their annotations, including :class:`msgspec.Meta` constraints.
+
+Example::
+
+    tyro.cli(Config, config=(tyro.conf.UseMsgspecConvert,))
+"""
+
 
 CallableType = TypeVar("CallableType", bound=Callable)
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from ._primitive_spec import PrimitiveConstructorSpec
@@ -72,6 +72,12 @@ def parse_with_backtracking(
         # empty tuple's instantiator.)
         return [] if len(args) == 0 else None
 
+    if all(isinstance(spec.nargs, int) for spec in specs):
+        # Fixed arity: there is only one way to split the arguments, so we can
+        # skip the search. This is the common case, e.g. `List[int]` or
+        # `Dict[str, int]`.
+        return _parse_fixed_arity(args, specs, is_repeating)
+
     # Use iterative approach with explicit stack to avoid recursion limit.
     stack: list[BacktrackState] = [BacktrackState(0, 0, None, None, 0, 0)]
 
@@ -192,3 +198,57 @@ def parse_with_backtracking(
 
     # No valid parse found.
     return None
+
+
+def _parse_fixed_arity(
+    args: list[str],
+    specs: tuple[PrimitiveConstructorSpec[Any], ...],
+    is_repeating: bool,
+) -> list[Any] | None:
+    """Equivalent to `parse_with_backtracking()` for specs that all have
+    integer nargs. Arguments are converted chunk by chunk, without allocating
+    any search state."""
+    nargs_per_spec = tuple(cast(int, spec.nargs) for spec in specs)
+    cycle_length = sum(nargs_per_spec)
+    if is_repeating:
+        if cycle_length == 0:
+            # A cycle that consumes zero arguments can never consume the
+            # remaining ones.
+            return [] if len(args) == 0 else None
+        if len(args) % cycle_length != 0:
+            return None
+        if len(specs) > 1 and nargs_per_spec[-1] == 0 and len(args) > 0:
+            # Match the known limitation for trailing zero-width specs in
+            # `parse_with_backtracking()`.
+            return None
+        cycle_count = len(args) // cycle_length
+    else:
+        if len(args) != cycle_length:
+            return None
+        cycle_count = 1
+
+    try:
+        if len(specs) == 1 and cycle_length == 1:
+            # One argument per value, e.g. `List[int]`.
+            (spec,) = specs
+            if spec.choices is not None and any(
+                arg not in spec.choices for arg in args
+            ):
+                return None
+            instance_from_str = spec.instance_from_str
+            return [instance_from_str([arg]) for arg in args]
+
+        out: list[Any] = []
+        arg_idx = 0
+        for _ in range(cycle_count):
+            for spec, nargs in zip(specs, nargs_per_spec):
+                chunk = args[arg_idx : arg_idx + nargs]
+                if spec.choices is not None and any(
+                    arg not in spec.choices for arg in chunk
+                ):
+                    return None
+                out.append(spec.instance_from_str(chunk))
+                arg_idx += nargs
+        return out
+    except ValueError:
+        return None
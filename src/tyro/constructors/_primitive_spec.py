@@ -17,6 +17,8 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Literal,
     Sequence,
@@ -36,7 +38,7 @@ if TYPE_CHECKING:
     from ._registry import ConstructorRegistry
 
 from .. import _fmtlib as fmt
-from .. import _resolver, _strings
+from .. import _resolver, _singleton, _strings
 from ..conf import _markers
 from ._backtracking import parse_with_backtracking
 
@@ -124,6 +126,59 @@ def _format_timedelta(td: datetime.timedelta) -> str:
 T = TypeVar("T")
 
 
+class _IndexedTuple(tuple):
+    """Tuple with a lazily-built hash index for membership checks.
+
+    Choice sets generated from large `Literal` types or enums can contain tens
+    of thousands of values; a plain tuple makes every `x in choices` check
+    linear. Subclassing `tuple` keeps ordering, equality, and formatting
+    unchanged for all existing consumers of `PrimitiveConstructorSpec.choices`."""
+
+    def __contains__(self, item: object) -> bool:
+        # The index is built lazily: many specs are only created to classify
+        # a type, and never used for membership checks.
+        index = self.__dict__.get("_index")
+        if index is None:
+            index = frozenset(x for x in self if _is_hashable(x))
+            self.__dict__["_index"] = index
+        try:
+            if item in index:
+                return True
+        except TypeError:
+            pass
+        # Unhashable items (and hashable items that compare equal to an
+        # unhashable member) fall back to a linear scan.
+        if len(index) == len(self) and _is_hashable(item):
+            return False
+        return tuple.__contains__(self, item)
+
+
+def _is_hashable(x: object) -> bool:
+    try:
+        hash(x)
+    except TypeError:
+        return False
+    return True
+
+
+_MAX_METAVAR_CHOICES = 64
+"""Choice sets larger than this are elided in metavars."""
+
+
+_MAX_ARRAY_DEFAULT_VALUES = 8
+"""Array defaults with more values than this are abbreviated in helptext."""
+
+
+def _choices_metavar(choices: Sequence[str]) -> str:
+    """Format a `{a,b,c}` metavar. For very large choice sets, only the first
+    few choices are shown; users who want the full list can still pass
+    `tyro.conf.arg(metavar=...)`."""
+    if len(choices) <= _MAX_METAVAR_CHOICES:
+        return "{" + ",".join(choices) + "}"
+    shown = 8
+    return "{" + ",".join(choices[:shown]) + f",...({len(choices) - shown} more)" + "}"
+
+
 @dataclasses.dataclass(frozen=True)
 class PrimitiveTypeInfo:
     """Information used to generate constructors for primitive types."""
@@ -138,12 +193,18 @@ class PrimitiveTypeInfo:
     """Set of tyro markers used to configure this field."""
     _primitive_spec: PrimitiveConstructorSpec | None
     """Primitive constructor spec that was scraped from runtime annotations."""
+    default: Any = _singleton.MISSING_NONPROP
+    """The default value of the field, or a member of
+    :data:`tyro.constructors.MISSING_AND_MISSING_NONPROP` if not present or not
+    known. Rules can use this to refine specs that the annotation leaves open,
+    like the dtype of a bare ``np.ndarray``."""
 
     @staticmethod
     def make(
         raw_annotation: Type | Callable,
         parent_markers: set[_markers.Marker],
         exclude_markers: set[_markers.Marker] | None = None,
+        default: Any = _singleton.MISSING_NONPROP,
     ) -> PrimitiveTypeInfo:
         _, primitive_specs = _resolver.unwrap_annotated(
             raw_annotation, search_type=PrimitiveConstructorSpec
@@ -153,7 +214,7 @@ class PrimitiveTypeInfo:
         typ, extra_markers = _resolver.unwrap_annotated(
             raw_annotation, search_type=_markers._Marker
         )
-        markers = parent_markers | set(extra_markers)
+        markers = _resolver.merge_markers(parent_markers, extra_markers)
         if exclude_markers is not None:
             markers = markers - exclude_markers
         return PrimitiveTypeInfo(
@@ -161,6 +222,7 @@ class PrimitiveTypeInfo:
             type_origin=get_origin(typ),
             markers=markers,
             _primitive_spec=primitive_spec,
+            default=default,
         )
 
 
@@ -204,6 +266,14 @@ class PrimitiveConstructorSpec(Generic[T]):
     _action: Literal["append"] | None = None
     """Internal action to use. Not part of the public API."""
 
+    _str_from_instance_lazy: Callable[[T], tuple[int, Iterator[list[str]]]] | None = (
+        None
+    )
+    """Lazy variant of `str_from_instance()` for containers. Returns the number of
+    elements in an instance and an iterator over the string arguments of each
+    element, which lets helptext bound the cost of rendering large defaults.
+    Not part of the public API."""
+
 
 def _compute_total_nargs(
     specs: Sequence[PrimitiveConstructorSpec],
@@ -310,6 +380,101 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
                 str_from_instance=lambda instance: [str(instance)],
             )
 
+    if "numpy" in sys.modules.keys():
+        import numpy as np
+
+        @registry.primitive_rule
+        def ndarray_rule(
+            type_info: PrimitiveTypeInfo,
+        ) -> PrimitiveConstructorSpec | UnsupportedTypeAnnotationError | None:
+            if not (
+                type_info.type is np.ndarray or type_info.type_origin is np.ndarray
+            ):
+                return None
+
+            # `npt.NDArray[np.float32]` is `np.ndarray[tuple[Any, ...],
+            # np.dtype[np.float32]]`. Bare `np.ndarray` and unparameterized
+            # dtypes use the dtype of a numeric or boolean default, and
+            # otherwise fall back to float64.
+            type_args = get_args(type_info.type)
+            dtype = np.dtype(np.float64)
+            if (
+                isinstance(type_info.default, np.ndarray)
+                and type_info.default.dtype.kind in "biufc"
+            ):
+                dtype = type_info.default.dtype
+            if len(type_args) == 2:
+                (scalar_type,) = get_args(type_args[1]) or (Any,)
+                if isinstance(scalar_type, type) and scalar_type is not np.generic:
+                    dtype = np.dtype(scalar_type)
+
+            # Shapes can be annotated with literal dimensions, for example
+            # `np.ndarray[Tuple[Literal[3], Literal[4]], np.dtype[np.float32]]`.
+            # Values are always passed in as a flat sequence, so at most one
+            # dimension can be left unknown.
+            shape: tuple[int, ...] = (-1,)
+            if len(type_args) == 2 and type_args[0] is not Any:
+                dims = get_args(type_args[0])
+                if len(dims) > 0 and dims[-1] is not Ellipsis:
+                    shape = tuple(
+                        get_args(dim)[0]
+                        if is_typing_literal(get_origin(dim))
+                        and len(get_args(dim)) == 1
+                        and isinstance(get_args(dim)[0], int)
+                        else -1
+                        for dim in dims
+                    )
+            if shape.count(-1) > 1:
+                return UnsupportedTypeAnnotationError(
+                    (
+                        fmt.text(
+                            "Array shape ",
+                            fmt.text["cyan"](str(type_args[0])),
+                            " has more than one unknown dimension.",
+                        ),
+                    )
+                )
+
+            is_bool = dtype == np.bool_
+            single_metavar = "{True,False}" if is_bool else dtype.name.upper()
+            if -1 in shape:
+                nargs: int | Literal["*"] = "*"
+                metavar = _strings.multi_metavar_from_single(single_metavar)
+            else:
+                nargs = 1
+                for dim in shape:
+                    nargs *= dim
+                metavar = " ".join([single_metavar] * nargs)
+
+            def instance_from_str(args: list[str]) -> Any:
+                # A single vectorized conversion; numpy raises ValueError for
+                # malformed values. Booleans are special-cased because numpy
+                # treats any non-empty string as True.
+                if is_bool:
+                    out = np.array(args) == "True"
+                else:
+                    out = np.array(args, dtype=dtype)
+                return out.reshape(shape)
+
+            def str_from_instance(instance: Any) -> list[str]:
+                # Only format the values that are displayed: stringifying every
+                # element of a large default is slow and makes help unreadable.
+                flat = np.asarray(instance).reshape(-1)
+                if flat.size <= _MAX_ARRAY_DEFAULT_VALUES:
+                    return [str(x) for x in flat]
+                return (
+                    [str(x) for x in flat[:3]] + ["..."] + [str(x) for x in flat[-3:]]
+                )
+
+            return PrimitiveConstructorSpec(
+                nargs=nargs,
+                metavar=metavar,
+                instance_from_str=instance_from_str,
+                is_instance=lambda x: isinstance(x, np.ndarray),
+                str_from_instance=str_from_instance,
+                choices=("True", "False") if is_bool else None,
+            )
+
     @registry.primitive_rule
     def bool_rule(type_info: PrimitiveTypeInfo) -> PrimitiveConstructorSpec | None:
         if type_info.type is not bool:
@@ -410,20 +575,20 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
             return None
         cast_type = cast(Type[enum.Enum], type_info.type)
         if _markers.EnumChoicesFromValues in type_info.markers:
-            choices = tuple(str(m.value) for m in cast_type)
+            # Index members by their stringified value. Iterating over the
+            # enum skips aliases, and the first member wins for duplicates.
+            member_from_str: dict[str, enum.Enum] = {}
+            for member in cast_type:
+                member_from_str.setdefault(str(member.value), member)
+            choices = _IndexedTuple(member_from_str.keys())
         else:
-            choices = tuple(type_info.type.__members__.keys())
+            member_from_str = cast_type.__members__  # type: ignore
+            choices = _IndexedTuple(member_from_str.keys())
 
         return PrimitiveConstructorSpec(
             nargs=1,
-            metavar="{" + ",".join(choices) + "}",
-            instance_from_str=lambda args: (
-                next(
-                    iter(member for member in cast_type if str(member.value) == args[0])
-                )
-                if _markers.EnumChoicesFromValues in type_info.markers
-                else cast_type[args[0]]
-            ),
+            metavar=_choices_metavar(choices),
+            instance_from_str=lambda args: member_from_str[args[0]],
             is_instance=lambda x: isinstance(x, cast_type),
             str_from_instance=lambda instance: [
                 str(instance.value)
@@ -481,6 +646,10 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
             Sequence,
             set,
             Set,
+            collections.abc.Iterable,
+            Iterable,
+            collections.abc.Iterator,
+            Iterator,
         ):
             return None
         typ = type_info.type
@@ -492,6 +661,10 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
             typ = List[str]
         elif typ in (set, Set):
             typ = Set[str]
+        elif typ in (collections.abc.Iterable, Iterable):
+            typ = Iterable[str]
+        elif typ in (collections.abc.Iterator, Iterator):
+            typ = Iterator[str]
 
         return ConstructorRegistry.get_primitive_spec(
             PrimitiveTypeInfo.make(
@@ -580,6 +753,19 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
                 out.extend(inner_spec.str_from_instance(i))
             return out
 
+        def str_from_instance_lazy(
+            instance: Sequence,
+        ) -> tuple[int, Iterator[list[str]]]:
+            return len(instance), (inner_spec.str_from_instance(i) for i in instance)
+
+        # Large defaults are matched against the inner type using a sample of
+        # their elements.
+        elements_to_check = (
+            (lambda x: x)
+            if _resolver.inspects_all_elements(type_info.markers)
+            else _resolver.sample_elements
+        )
+
         if _markers.UseAppendAction in type_info.markers:
             return PrimitiveConstructorSpec(
                 nargs=inner_spec.nargs,
@@ -587,11 +773,12 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
                 instance_from_str=inner_spec.instance_from_str,
                 is_instance=lambda x: (
                     isinstance(x, container_type)
-                    and all(inner_spec.is_instance(i) for i in x)
+                    and all(inner_spec.is_instance(i) for i in elements_to_check(x))
                 ),
                 str_from_instance=str_from_instance,
                 choices=inner_spec.choices,
                 _action="append",
+                _str_from_instance_lazy=str_from_instance_lazy,
             )
         else:
             return PrimitiveConstructorSpec(
@@ -600,12 +787,108 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
                 instance_from_str=instance_from_str,
                 is_instance=lambda x: (
                     isinstance(x, container_type)
-                    and all(inner_spec.is_instance(i) for i in x)
+                    and all(inner_spec.is_instance(i) for i in elements_to_check(x))
                 ),
                 str_from_instance=str_from_instance,
                 choices=inner_spec.choices,
+                _str_from_instance_lazy=str_from_instance_lazy,
             )
 
+    @registry.primitive_rule
+    def iterator_rule(
+        type_info: PrimitiveTypeInfo,
+    ) -> PrimitiveConstructorSpec | UnsupportedTypeAnnotationError | None:
+        """Iterator, iterable, and generator arguments.
+
+        Values are converted eagerly, while parsing, so that invalid values are
+        reported as CLI errors instead of being raised from user code when the
+        iterator is consumed. The converted values are therefore held in memory:
+        `Iterable` arguments are a list, and `Iterator` and `Generator`
+        arguments iterate over one."""
+        if type_info.type_origin not in (
+            collections.abc.Iterable,
+            collections.abc.Iterator,
+            collections.abc.Generator,
+        ):
+            return None
+        args = get_args(type_info.type)
+        contained_type = args[0] if len(args) > 0 else Any
+
+        inner_spec = ConstructorRegistry.get_primitive_spec(
+            PrimitiveTypeInfo.make(
+                raw_annotation=contained_type,
+                parent_markers=type_info.markers - {_markers.UseAppendAction},
+            )
+        )
+        if isinstance(inner_spec, UnsupportedTypeAnnotationError):
+            return UnsupportedTypeAnnotationError(
+                (
+                    fmt.text(
+                        "Could not create iterator primitive spec from ",
+                        fmt.text["cyan"](f"`{type_info.type}`"),
+                        " due to unsupported inner type",
+                    ),
+                    *inner_spec.message,
+                )
+            )
+
+        def instance_from_str(args: list[str]) -> Any:
+            result = parse_with_backtracking(
+                args=args,
+                specs=(inner_spec,),
+                is_repeating=True,
+            )
+            if result is None:
+                raise ValueError(f"Could not find valid parse for arguments: {args}")
+            if type_info.type_origin is collections.abc.Iterable:
+                return result
+            elif type_info.type_origin is collections.abc.Generator:
+                return (x for x in result)
+            return iter(result)
+
+        def is_one_shot(instance: Any) -> bool:
+            # Rendering or checking the elements of an iterator would consume it.
+            return isinstance(instance, collections.abc.Iterator)
+
+        def str_from_instance(instance: Any) -> list[str]:
+            if is_one_shot(instance):
+                return ["..."]
+            out = []
+            for i in instance:
+                out.extend(inner_spec.str_from_instance(i))
+            return out
+
+        def str_from_instance_lazy(instance: Any) -> tuple[int, Iterator[list[str]]]:
+            if is_one_shot(instance) or not isinstance(instance, collections.abc.Sized):
+                return 1, iter([str_from_instance(instance)])
+            return len(instance), (inner_spec.str_from_instance(i) for i in instance)
+
+        def is_instance(instance: Any) -> bool:
+            if not isinstance(instance, cast(type, type_info.type_origin)):
+                return False
+            if is_one_shot(instance) or not isinstance(
+                instance, collections.abc.Collection
+            ):
+                return True
+            return all(
+                inner_spec.is_instance(i)
+                for i in (
+                    instance
+                    if _resolver.inspects_all_elements(type_info.markers)
+                    else _resolver.sample_elements(instance)
+                )
+            )
+
+        return PrimitiveConstructorSpec(
+            nargs="*",
+            metavar=_strings.multi_metavar_from_single(inner_spec.metavar),
+            instance_from_str=instance_from_str,
+            is_instance=is_instance,
+            str_from_instance=str_from_instance,
+            choices=inner_spec.choices,
+            _str_from_instance_lazy=str_from_instance_lazy,
+        )
+
     @registry.primitive_rule
     def tuple_rule(
         type_info: PrimitiveTypeInfo,
@@ -803,6 +1086,21 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
                 out.extend(val_spec.str_from_instance(value))
             return out
 
+        def str_from_instance_lazy(
+            instance: dict,
+        ) -> tuple[int, Iterator[list[str]]]:
+            return len(instance), (
+                key_spec.str_from_instance(key) + val_spec.str_from_instance(value)
+                for key, value in instance.items()
+            )
+
+        # Large defaults are matched using a sample of their items.
+        items_to_check = (
+            (lambda x: x)
+            if _resolver.inspects_all_elements(type_info.markers)
+            else _resolver.sample_elements
+        )
+
         if _markers.UseAppendAction in type_info.markers:
             # Compute all possible total argument counts for dict key-value pairs.
             nargs = _compute_total_nargs([key_spec, val_spec])
@@ -815,11 +1113,12 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
                     isinstance(x, dict)
                     and all(
                         key_spec.is_instance(k) and val_spec.is_instance(v)
-                        for k, v in x.items()
+                        for k, v in items_to_check(x.items())
                     )
                 ),
                 str_from_instance=str_from_instance,
                 _action="append",
+                _str_from_instance_lazy=str_from_instance_lazy,
             )
         else:
             return PrimitiveConstructorSpec(
@@ -830,18 +1129,19 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
                     isinstance(x, dict)
                     and all(
                         key_spec.is_instance(k) and val_spec.is_instance(v)
-                        for k, v in x.items()
+                        for k, v in items_to_check(x.items())
                     )
                 ),
                 str_from_instance=str_from_instance,
+                _str_from_instance_lazy=str_from_instance_lazy,
             )
 
     @registry.primitive_rule
     def literal_rule(type_info: PrimitiveTypeInfo) -> PrimitiveConstructorSpec | None:
         if not is_typing_literal(type_info.type_origin):
             return None
-        choices = get_args(type_info.type)
-        str_choices = tuple(
+        choices = _IndexedTuple(get_args(type_info.type))
+        str_choices = _IndexedTuple(
             (
                 (
                     x.value
@@ -853,10 +1153,20 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
             )
             for x in choices
         )
+        choice_from_str: dict[str, Any] = {}
+
+        def instance_from_str(args: list[str]) -> Any:
+            if len(choice_from_str) == 0:
+                # Map each string to the first choice that produces it, matching
+                # the semantics of `str_choices.index()`.
+                for str_choice, choice in zip(str_choices, choices):
+                    choice_from_str.setdefault(str_choice, choice)
+            return choice_from_str[args[0]]
+
         return PrimitiveConstructorSpec(
             nargs=1,
-            metavar="{" + ",".join(str_choices) + "}",
-            instance_from_str=lambda args: choices[str_choices.index(args[0])],
+            metavar=_choices_metavar(str_choices),
+            instance_from_str=instance_from_str,
             is_instance=lambda x: x in choices,
             str_from_instance=lambda instance: [str(instance)],
             choices=str_choices,
@@ -995,23 +1305,34 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
                 f" {strings}.\n\nGot errors:  \n- " + "\n- ".join(errors)
             )
 
-        def str_from_instance(instance: Any) -> list[str]:
+        def matching_spec(instance: Any) -> PrimitiveConstructorSpec:
             fuzzy_match = None
             for option_spec in option_specs.values():
                 is_instance = option_spec.is_instance(instance)
                 if is_instance is True:
-                    return option_spec.str_from_instance(instance)
+                    return option_spec
                 elif is_instance == "~":
                     fuzzy_match = option_spec
 
             # If we get here, we have a fuzzy match.
             if fuzzy_match is not None:
-                return fuzzy_match.str_from_instance(instance)
+                return fuzzy_match
 
             assert False, (
                 f"could not match default value {instance} with any types in union {options}"
             )
 
+        def str_from_instance(instance: Any) -> list[str]:
+            return matching_spec(instance).str_from_instance(instance)
+
+        def str_from_instance_lazy(
+            instance: Any,
+        ) -> tuple[int, Iterator[list[str]]]:
+            spec = matching_spec(instance)
+            if spec._str_from_instance_lazy is not None:
+                return spec._str_from_instance_lazy(instance)
+            return 1, iter([spec.str_from_instance(instance)])
+
         return PrimitiveConstructorSpec(
             nargs=nargs,
             metavar=metavar,
@@ -1020,7 +1341,8 @@ def apply_default_primitive_rules(registry: ConstructorRegistry) -> None:
                 spec.is_instance(x) for spec in option_specs.values()
             ),
             str_from_instance=str_from_instance,
-            choices=None if choices is None else tuple(set(choices)),
+            choices=None if choices is None else _IndexedTuple(dict.fromkeys(choices)),
+            _str_from_instance_lazy=str_from_instance_lazy,
         )
 
     @registry.primitive_rule
@@ -6,7 +6,7 @@ from typing import Any, Callable, ClassVar, Union
 from tyro._singleton import is_sentinel
 
 from .. import _fmtlib as fmt
-from .. import _resolver
+from .. import _resolver, _unsafe_cache
 from ._primitive_spec import (
     PrimitiveConstructorSpec,
     PrimitiveTypeInfo,
@@ -27,6 +27,13 @@ PrimitiveSpecRule = Callable[
     Union[PrimitiveConstructorSpec, UnsupportedTypeAnnotationError, None],
 ]
 StructSpecRule = Callable[[StructTypeInfo], Union[StructConstructorSpec, None]]
+StructRuleMatcher = Callable[[StructTypeInfo], bool]
+
+# Struct specs that were built while classifying types. These are reused when
+# the same type is later expanded into fields.
+_struct_spec_from_key: dict[Any, tuple[Any, StructConstructorSpec]] = (
+    _unsafe_cache.cleared_dict()
+)
 
 _check_default_instances_flag: bool = False
 
@@ -86,7 +93,9 @@ class ConstructorRegistry:
 
     where `None` is returned if the rule doesn't apply. Each struct rule
     defines behavior for a type that can be instantiated from multiple
-    command-line arguments.
+    command-line arguments. Struct rules can optionally be registered with a
+    cheap `matches` predicate, which lets tyro check whether a type is a struct
+    without building its fields.
 
 
     To activate a registry, pass it directly to :func:`tyro.cli`:
@@ -112,6 +121,7 @@ class ConstructorRegistry:
     def __init__(self) -> None:
         self._primitive_rules: list[PrimitiveSpecRule] = []
         self._struct_rules: list[StructSpecRule] = []
+        self._struct_rule_matchers: list[StructRuleMatcher | None] = []
 
     def primitive_rule(self, rule: PrimitiveSpecRule) -> PrimitiveSpecRule:
         """Define a rule for constructing a primitive type from a string. The
@@ -124,11 +134,19 @@ class ConstructorRegistry:
         self._primitive_rules.append(rule)
         return rule
 
-    def struct_rule(self, rule: StructSpecRule) -> StructSpecRule:
-        """Define a rule for constructing a primitive type from a string. The
-        most recently added rule will be applied first."""
+    def struct_rule(
+        self, rule: StructSpecRule, *, matches: StructRuleMatcher | None = None
+    ) -> StructSpecRule:
+        """Define a rule for constructing a struct type from multiple
+        command-line arguments. The most recently added rule will be applied
+        first.
+
+        `matches` is an optional predicate that should return `True` if and
+        only if `rule` returns a spec for a type. It should be cheap: it's used
+        to classify types as structs without building their fields."""
 
         self._struct_rules.append(rule)
+        self._struct_rule_matchers.append(matches)
         return rule
 
     @classmethod
@@ -185,6 +203,72 @@ class ConstructorRegistry:
 
         cls._ensure_defaults_initialized()
 
+        invalid_default_error = cls._get_invalid_default_error(type_info)
+        if invalid_default_error is not None:
+            return invalid_default_error
+
+        with type_info._typevar_context:
+            key = _struct_spec_key(type_info)
+            if key is not None and key in _struct_spec_from_key:
+                return _struct_spec_from_key[key][1]
+
+            for registry in cls._active_registries[::-1]:
+                for spec_factory in registry._struct_rules[::-1]:
+                    maybe_spec = spec_factory(type_info)
+                    if maybe_spec is not None:
+                        return maybe_spec
+
+        return None
+
+    @classmethod
+    def _is_struct_type(cls, type_info: StructTypeInfo) -> bool | None:
+        """Check whether a struct rule applies to a type, without building
+        fields when possible.
+
+        Returns:
+            - True if the type can be handled as a struct.
+            - False if a struct rule applies, but the default instance is incompatible with the type.
+            - None if no struct rule applies.
+        """
+
+        cls._ensure_defaults_initialized()
+
+        # Mirrors `get_struct_spec()`: a type whose default instance is invalid
+        # is never a struct, whether or not a rule applies to it.
+        default_is_valid = cls._get_invalid_default_error(type_info) is None
+
+        with type_info._typevar_context:
+            for registry in cls._active_registries[::-1]:
+                for spec_factory, matches in zip(
+                    registry._struct_rules[::-1], registry._struct_rule_matchers[::-1]
+                ):
+                    if matches is not None:
+                        if not matches(type_info):
+                            continue
+                        return default_is_valid
+
+                    if not default_is_valid:
+                        return False
+                    maybe_spec = spec_factory(type_info)
+                    if maybe_spec is None:
+                        continue
+                    if not isinstance(maybe_spec, StructConstructorSpec):
+                        return False
+
+                    # Keep the spec around for when the fields are needed.
+                    key = _struct_spec_key(type_info)
+                    if key is not None:
+                        _struct_spec_from_key[key] = (type_info.default, maybe_spec)
+                    return True
+
+        return None if default_is_valid else False
+
+    @classmethod
+    def _get_invalid_default_error(
+        cls, type_info: StructTypeInfo
+    ) -> InvalidDefaultInstanceError | None:
+        """Get an error if the default instance doesn't match the type, and
+        we're being strict about default instances."""
         if (
             check_default_instances()
             and not is_sentinel(type_info.default)
@@ -202,14 +286,6 @@ class ConstructorRegistry:
                     ),
                 )
             )
-
-        with type_info._typevar_context:
-            for registry in cls._active_registries[::-1]:
-                for spec_factory in registry._struct_rules[::-1]:
-                    maybe_spec = spec_factory(type_info)
-                    if maybe_spec is not None:
-                        return maybe_spec
-
         return None
 
     def __enter__(self) -> None:
@@ -233,3 +309,31 @@ class ConstructorRegistry:
             apply_default_struct_rules(registry)
 
             cls._active_registries.append(registry)
+
+
+def _struct_spec_key(type_info: StructTypeInfo) -> Any:
+    """Key for struct specs built from `type_info`, or `None` if the type
+    can't be hashed. Should be called with the type's type parameter
+    assignments active."""
+    key = (
+        type_info.type,
+        type_info.markers,
+        # Defaults are compared by identity. They're kept alive by the cache
+        # values, so ids can't be reused while they're cached.
+        id(type_info.default),
+        type_info.in_union_context,
+        check_default_instances(),
+        # Registries hash by identity, and are kept alive by the key itself.
+        tuple(ConstructorRegistry._active_registries),
+        # Assignments are compared by value: the dicts themselves are
+        # short-lived, so their ids can be reused.
+        tuple(
+            tuple(assignments.items())
+            for assignments in _resolver.TypeParamResolver.param_assignments
+        ),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
@@ -21,6 +21,7 @@ from .._singleton import (
     MISSING,
     MISSING_NONPROP,
     is_missing,
+    is_sentinel,
 )
 from ..conf import _confstruct, _markers
 
@@ -136,7 +137,11 @@ class StructTypeInfo:
         typevar_context = _resolver.TypeParamResolver.get_assignment_context(f)
         f = typevar_context.origin_type
         f = _resolver.narrow_subtypes(f, default)
-        f = _resolver.narrow_collection_types(f, default)
+        f = _resolver.narrow_collection_types(
+            f,
+            default,
+            exhaustive=_resolver.inspects_all_elements(parent_markers),
+        )
 
         return StructTypeInfo(
             cast(Type, f),
@@ -147,6 +152,17 @@ class StructTypeInfo:
         )
 
 
+def _has_context_marker(info: StructTypeInfo, marker: Any) -> bool:
+    """Check whether a marker applies to a struct type. Markers passed via
+    `config=` are only available from the field context for nested structs, so
+    both are checked."""
+    from .._fields import global_context_markers
+
+    return marker in info.markers or any(
+        marker in markers for markers in global_context_markers
+    )
+
+
 def apply_default_struct_rules(registry: ConstructorRegistry) -> None:
     """Apply default struct rules to the registry.
 
@@ -161,23 +177,30 @@ def apply_default_struct_rules(registry: ConstructorRegistry) -> None:
     - Pydantic models
     """
     from .._fields import is_struct_type
-    from ._struct_spec_attrs import attrs_rule
-    from ._struct_spec_dataclass import dataclass_rule
-    from ._struct_spec_ml_collections import ml_collections_rule
-    from ._struct_spec_msgspec import msgspec_rule
-    from ._struct_spec_pydantic import pydantic_rule
-
-    # Register imported rules.
-    registry.struct_rule(attrs_rule)
-    registry.struct_rule(dataclass_rule)
-    registry.struct_rule(ml_collections_rule)
-    registry.struct_rule(msgspec_rule)
-    registry.struct_rule(pydantic_rule)
+    from ._struct_spec_attrs import attrs_rule, attrs_rule_matches
+    from ._struct_spec_dataclass import dataclass_rule, dataclass_rule_matches
+    from ._struct_spec_ml_collections import (
+        ml_collections_rule,
+        ml_collections_rule_matches,
+    )
+    from ._struct_spec_msgspec import msgspec_rule, msgspec_rule_matches
+    from ._struct_spec_pydantic import pydantic_rule, pydantic_rule_matches
+
+    # Register imported rules. Rules that always apply to the types they match
+    # are registered with a `matches` predicate, which is used to classify
+    # types without building fields.
+    registry.struct_rule(attrs_rule, matches=attrs_rule_matches)
+    registry.struct_rule(dataclass_rule, matches=dataclass_rule_matches)
+    registry.struct_rule(ml_collections_rule, matches=ml_collections_rule_matches)
+    registry.struct_rule(msgspec_rule, matches=msgspec_rule_matches)
+    registry.struct_rule(pydantic_rule, matches=pydantic_rule_matches)
+
+    def typeddict_rule_matches(info: StructTypeInfo) -> bool:
+        return is_typeddict(info.type)
 
-    @registry.struct_rule
     def typeddict_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
         # Is this a TypedDict?
-        if not is_typeddict(info.type):
+        if not typeddict_rule_matches(info):
             return None
 
         cls = cast(type, info.type)
@@ -249,6 +272,8 @@ def apply_default_struct_rules(registry: ConstructorRegistry) -> None:
             )
         return StructConstructorSpec(instantiate=info.type, fields=tuple(field_list))
 
+    registry.struct_rule(typeddict_rule, matches=typeddict_rule_matches)
+
     @registry.struct_rule
     def dict_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
         origin = get_origin(info.type)
@@ -269,7 +294,7 @@ def apply_default_struct_rules(registry: ConstructorRegistry) -> None:
             return None
 
         # Check if we have a dict with struct values but no default.
-        has_default = not is_missing(info.default)
+        has_default = not is_sentinel(info.default)
         has_empty_default = has_default and len(info.default) == 0
 
         # No default provided or empty default.
@@ -315,9 +340,11 @@ def apply_default_struct_rules(registry: ConstructorRegistry) -> None:
             )
         return StructConstructorSpec(instantiate=dict, fields=tuple(field_list))
 
-    @registry.struct_rule
+    def namedtuple_rule_matches(info: StructTypeInfo) -> bool:
+        return _resolver.is_namedtuple(info.type)
+
     def namedtuple_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
-        if not _resolver.is_namedtuple(info.type):
+        if not namedtuple_rule_matches(info):
             return None
 
         field_list = []
@@ -350,6 +377,8 @@ def apply_default_struct_rules(registry: ConstructorRegistry) -> None:
 
         return StructConstructorSpec(instantiate=info.type, fields=tuple(field_list))
 
+    registry.struct_rule(namedtuple_rule, matches=namedtuple_rule_matches)
+
     @registry.struct_rule
     def variable_length_sequence_rule(
         info: StructTypeInfo,
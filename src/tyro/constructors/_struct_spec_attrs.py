@@ -8,22 +8,29 @@ from .._singleton import MISSING_NONPROP, is_missing
 from ._struct_spec import StructConstructorSpec, StructFieldSpec, StructTypeInfo
 
 
-def attrs_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
-    """Rule for handling attrs classes."""
+def attrs_rule_matches(info: StructTypeInfo) -> bool:
+    """Check whether :func:`attrs_rule` applies to a type."""
     # attr will already be imported if it's used.
     if "attr" not in sys.modules.keys():  # pragma: no cover
-        return None
+        return False
 
     try:
         import attr
     except ImportError:
         # This is needed for the mock import test in
         # test_missing_optional_packages.py to pass.
-        return None
+        return False
+
+    return attr.has(info.type)
 
-    if not attr.has(info.type):
+
+def attrs_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
+    """Rule for handling attrs classes."""
+    if not attrs_rule_matches(info):
         return None
 
+    import attr
+
     # We'll use our own type resolution system instead of attr's. This is
     # primarily to improve generics support.
     our_hints = _resolver.get_type_hints_resolve_type_params(
@@ -72,9 +72,14 @@ def _get_dataclass_field_default(
     return MISSING_NONPROP
 
 
+def dataclass_rule_matches(info: StructTypeInfo) -> bool:
+    """Check whether :func:`dataclass_rule` applies to a type."""
+    return dataclasses.is_dataclass(info.type)
+
+
 def dataclass_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
     """Rule for handling dataclass types."""
-    if not dataclasses.is_dataclass(info.type):
+    if not dataclass_rule_matches(info):
         return None
 
     # Check if this is a flax module and get fields to skip
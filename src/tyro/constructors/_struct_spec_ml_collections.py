@@ -6,7 +6,7 @@ from typing import Any
 
 from typing_extensions import Annotated
 
-from .._resolver import narrow_collection_types
+from .._resolver import inspects_all_elements, narrow_collection_types
 from .._singleton import EXCLUDE_FROM_CALL
 from ..conf import _confstruct
 from ._struct_spec import StructConstructorSpec, StructFieldSpec, StructTypeInfo
@@ -14,11 +14,12 @@ from ._struct_spec import StructConstructorSpec, StructFieldSpec, StructTypeInfo
 _NotRootConfigDict = None  # type: ignore
 
 
-def ml_collections_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
+def ml_collections_rule_matches(info: StructTypeInfo) -> bool:
+    """Check whether :func:`ml_collections_rule` applies to a type."""
     if "ml_collections" not in sys.modules.keys():  # pragma: no cover
-        return None
+        return False
 
-    from ml_collections import FieldReference, config_dict
+    from ml_collections import config_dict
 
     # Lazy class definition.
     global _NotRootConfigDict
@@ -26,13 +27,19 @@ def ml_collections_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
 
         class _NotRootConfigDict(config_dict.ConfigDict): ...
 
-    if info.type not in (
+    return info.type in (
         config_dict.ConfigDict,
         config_dict.FrozenConfigDict,
         _NotRootConfigDict,
-    ):
+    )
+
+
+def ml_collections_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
+    if not ml_collections_rule_matches(info):
         return None
 
+    from ml_collections import FieldReference, config_dict
+
     # Handling ml_collections.ConfigDict is mostly very easy. The one
     # complication is the FieldReference type.
     #
@@ -54,21 +61,25 @@ def ml_collections_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
     def _instantiate(**kwargs):
         if info.type is config_dict.ConfigDict:
             # Root. `.update()` should track all of the field references.
-            config = copy.deepcopy(info.default)
+            config = _copy_structure(info.default)
             config.update(kwargs)
             return config
         elif info.type is config_dict.FrozenConfigDict:
             # Make mutable, update, then freeze.
-            config = copy.deepcopy(config_dict.ConfigDict(info.default))
+            config = _copy_structure(config_dict.ConfigDict(info.default))
             config.update(kwargs)
             return config_dict.FrozenConfigDict(config)
         else:
             # Not root. Just return the kwargs.
             return config_dict.ConfigDict(kwargs)
 
+    exhaustive = inspects_all_elements(info.markers)
+
     # For creating individual fields, we're going to do two things...
     def _make_field_spec(k: str, v: Any) -> StructFieldSpec:
-        val_type = narrow_collection_types(info.default.get_type(k), v)
+        val_type = narrow_collection_types(
+            info.default.get_type(k), v, exhaustive=exhaustive
+        )
         # (1) Convert all ConfigDict types to NotRootConfigDict.
         if val_type in (config_dict.ConfigDict, config_dict.FrozenConfigDict):
             val_type = _NotRootConfigDict
@@ -78,7 +89,7 @@ def ml_collections_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
         # passed in.
         elif isinstance(v, FieldReference):
             v = v.get()
-            val_type = narrow_collection_types(type(v), v)
+            val_type = narrow_collection_types(type(v), v, exhaustive=exhaustive)
             val_type = Annotated[
                 val_type,
                 _confstruct.arg(
@@ -97,3 +108,30 @@ def ml_collections_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
             for k, v in info.default.items(preserve_field_references=True)
         ),
     )
+
+
+def _copy_structure(config: Any) -> Any:
+    """Copy the nested ConfigDicts and FieldReferences of a ConfigDict, but
+    share all other values with the original.
+
+    This is used instead of `copy.deepcopy()` before applying parsed values
+    with `.update()`. Each value that isn't a FieldReference is replaced by
+    `.update()` with the parsed value, which is the original object when it
+    wasn't overridden. Copying these values (which can be large arrays or
+    tables) would be wasted work. FieldReferences are still copied, so links
+    between fields are preserved in the copy without touching the original.
+    """
+    from ml_collections import FieldReference, config_dict
+
+    # Pre-populating the memo makes `copy.deepcopy()` return these values as-is.
+    memo: dict[int, Any] = {}
+
+    def _share_values(config: config_dict.ConfigDict) -> None:
+        for v in config.values(preserve_field_references=True):
+            if isinstance(v, config_dict.ConfigDict):
+                _share_values(v)
+            elif not isinstance(v, FieldReference):
+                memo[id(v)] = v
+
+    _share_values(config)
+    return copy.deepcopy(config, memo)
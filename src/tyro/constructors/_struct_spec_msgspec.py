@@ -1,36 +1,51 @@
 from __future__ import annotations
 
+import enum
 import functools
 import sys
+from typing import Any, Callable
+
+from typing_extensions import get_args
 
 from .._docstrings import get_field_docstring
 from .._resolver import get_type_hints_resolve_type_params
 from .._singleton import MISSING, MISSING_NONPROP
-from ._struct_spec import StructConstructorSpec, StructFieldSpec, StructTypeInfo
+from ..conf import _markers
+from ._struct_spec import (
+    StructConstructorSpec,
+    StructFieldSpec,
+    StructTypeInfo,
+    _has_context_marker,
+)
 
 
-def msgspec_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
+def msgspec_rule_matches(info: StructTypeInfo) -> bool:
+    """Check whether :func:`msgspec_rule` applies to a type."""
     if "msgspec" not in sys.modules.keys():  # pragma: no cover
-        return None
+        return False
 
     import msgspec
 
     try:
-        if not issubclass(info.type, msgspec.Struct):
-            return None
+        return issubclass(info.type, msgspec.Struct)
     except TypeError:  # issubclass failed
+        return False
+
+
+def msgspec_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
+    if not msgspec_rule_matches(info):
         return None
 
+    import msgspec
+
     # Handle msgspec struct objects.
     field_list = []
-    struct_type = msgspec.inspect.type_info(info.type)
-    assert isinstance(struct_type, msgspec.inspect.StructType)
 
     # We need to use the original type hints, because `field.type` returns
     # a msgspec-specified type descriptor.
     annotations = get_type_hints_resolve_type_params(info.type, include_extras=True)
 
-    for field in struct_type.fields:
+    for field in _get_struct_fields(info.type):
         if info.default not in (
             MISSING,
             MISSING_NONPROP,
@@ -54,4 +69,77 @@ def msgspec_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
             )
         )
 
-    return StructConstructorSpec(instantiate=info.type, fields=tuple(field_list))
+    if _has_context_marker(info, _markers.UseMsgspecConvert):
+        instantiate = _get_converter(info.type)
+    else:
+        instantiate = info.type
+    return StructConstructorSpec(instantiate=instantiate, fields=tuple(field_list))
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_struct_fields(cls: type) -> tuple[Any, ...]:
+    """Get the fields of a struct type. Cached, since msgspec resolves type
+    hints for each call."""
+    import msgspec
+
+    return msgspec.structs.fields(cls)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_converter(cls: type) -> Callable[..., Any]:
+    """Get a function that builds a struct type from keyword arguments using
+    `msgspec.convert()`."""
+    import msgspec
+
+    fields = _get_struct_fields(cls)
+
+    # Fields are converted from their encoded names, which can differ from the
+    # attribute names when a struct is configured with `rename=`.
+    encode_name_from_name = {
+        field.name: field.encode_name
+        for field in fields
+        if field.encode_name != field.name
+    }
+
+    # msgspec converts enums from their values, while tyro parses them into
+    # enum members.
+    enum_field_names = frozenset(
+        field.name for field in fields if _contains_enum(field.type)
+    )
+
+    def convert(**kwargs: Any) -> Any:
+        return msgspec.convert(
+            {
+                encode_name_from_name.get(k, k): (
+                    _enum_to_value(v) if k in enum_field_names else v
+                )
+                for k, v in kwargs.items()
+            },
+            type=cls,
+        )
+
+    # Helptext extraction reads `instantiate.__doc__` downstream.
+    convert.__doc__ = cls.__doc__
+    convert.__name__ = cls.__name__
+    convert.__qualname__ = cls.__qualname__
+    return convert
+
+
+def _contains_enum(typ: Any) -> bool:
+    """Check whether a type annotation refers to an enum type."""
+    if isinstance(typ, enum.Enum) or (
+        isinstance(typ, type) and issubclass(typ, enum.Enum)
+    ):
+        return True
+    return any(_contains_enum(arg) for arg in get_args(typ))
+
+
+def _enum_to_value(value: Any) -> Any:
+    """Replace enum members in a value with their values."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return type(value)(_enum_to_value(v) for v in value)
+    if isinstance(value, dict):
+        return {_enum_to_value(k): _enum_to_value(v) for k, v in value.items()}
+    return value
@@ -7,8 +7,14 @@ from typing import TYPE_CHECKING, Any, Dict
 from typing_extensions import cast
 
 from .. import _docstrings, _resolver
-from .._singleton import MISSING_NONPROP, is_missing
-from ._struct_spec import StructConstructorSpec, StructFieldSpec, StructTypeInfo
+from .._singleton import EXCLUDE_FROM_CALL, MISSING_NONPROP, is_missing
+from ..conf import _markers
+from ._struct_spec import (
+    StructConstructorSpec,
+    StructFieldSpec,
+    StructTypeInfo,
+    _has_context_marker,
+)
 
 if TYPE_CHECKING:
     import pydantic as pydantic
@@ -19,8 +25,11 @@ def _get_pydantic_v1_field_default(
     name: str,
     field: pydantic_v1_fields.ModelField,
     parent_default_instance: Any,
+    deferred_default: Any,
 ) -> Any:
-    """Helper for getting the default instance for a Pydantic field."""
+    """Helper for getting the default instance for a Pydantic field. If
+    `deferred_default` is not `None`, it's used in place of calling the field's
+    default factory."""
 
     # Try grabbing default from parent instance.
     if not is_missing(parent_default_instance) and parent_default_instance is not None:
@@ -29,6 +38,8 @@ def _get_pydantic_v1_field_default(
             return getattr(parent_default_instance, name)
 
     if not field.required:
+        if deferred_default is not None and field.default_factory is not None:
+            return deferred_default
         return field.get_default()
 
     # Otherwise, no default.
@@ -39,8 +50,11 @@ def _get_pydantic_v2_field_default(
     name: str,
     field: pydantic.fields.FieldInfo,
     parent_default_instance: Any,
+    deferred_default: Any,
 ) -> Any:
-    """Helper for getting the default instance for a Pydantic field."""
+    """Helper for getting the default instance for a Pydantic field. If
+    `deferred_default` is not `None`, it's used in place of calling the field's
+    default factory."""
 
     # Try grabbing default from parent instance.
     if not is_missing(parent_default_instance) and parent_default_instance is not None:
@@ -49,25 +63,40 @@ def _get_pydantic_v2_field_default(
             return getattr(parent_default_instance, name)
 
     if not field.is_required():
+        if deferred_default is not None and field.default_factory is not None:
+            return deferred_default
         return field.get_default(call_default_factory=True)
 
     # Otherwise, no default.
     return MISSING_NONPROP
 
 
-def pydantic_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
-    """Rule for handling Pydantic models."""
+def pydantic_rule_matches(info: StructTypeInfo) -> bool:
+    """Check whether :func:`pydantic_rule` applies to a type."""
     # Check if pydantic is imported
     if "pydantic" not in sys.modules.keys():  # pragma: no cover
-        return None
+        return False
 
     try:
         import pydantic
     except ImportError:
         # Needed for the mock import test in
         # test_missing_optional_packages.py to pass.
-        return None
+        return False
 
+    pydantic_v1 = _get_pydantic_v1()
+
+    # Check if the type is a Pydantic model
+    try:
+        return issubclass(info.type, pydantic.BaseModel) or (
+            pydantic_v1 is not None and issubclass(info.type, pydantic_v1.BaseModel)
+        )
+    except TypeError:
+        # issubclass failed!
+        return False
+
+
+def _get_pydantic_v1() -> Any:
     try:
         if "pydantic.v1" in sys.modules.keys():
             from pydantic import v1 as pydantic_v1
@@ -75,20 +104,18 @@ def pydantic_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
             pydantic_v1 = None  # type: ignore
     except ImportError:
         pydantic_v1 = None  # type: ignore
+    return pydantic_v1
 
-    # Check if the type is a Pydantic model
-    try:
-        if not (
-            issubclass(info.type, pydantic.BaseModel)
-            or (
-                pydantic_v1 is not None and issubclass(info.type, pydantic_v1.BaseModel)
-            )
-        ):
-            return None
-    except TypeError:
-        # issubclass failed!
+
+def pydantic_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
+    """Rule for handling Pydantic models."""
+    if not pydantic_rule_matches(info):
         return None
 
+    import pydantic
+
+    pydantic_v1 = _get_pydantic_v1()
+
     field_list = []
     # Pydantic validates input by alias (not field name) unless the model is
     # configured with populate_by_name. We key our fields/flags by the Python
@@ -97,10 +124,12 @@ def pydantic_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
     # AliasPath are left alone and fall back to the field name.)
     alias_from_name: Dict[str, str] = {}
     pydantic_version = int(getattr(pydantic, "__version__", "1.0.0").partition(".")[0])
-
-    if pydantic_version < 2 or (
+    is_v1_model = pydantic_version < 2 or (
         pydantic_v1 is not None and issubclass(info.type, pydantic_v1.BaseModel)
-    ):
+    )
+    validation_off = _has_context_marker(info, _markers.PydanticValidationOff)
+
+    if is_v1_model:
         # Pydantic 1.xx
         cls_cast = info.type
         hints = _resolver.get_type_hints_resolve_type_params(
@@ -117,7 +146,14 @@ def pydantic_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
                 )
 
             default = _get_pydantic_v1_field_default(
-                pd1_field.name, pd1_field, info.default
+                pd1_field.name,
+                pd1_field,
+                info.default,
+                deferred_default=_get_deferred_default(
+                    hints[pd1_field.name], pd1_field.default_factory, info
+                )
+                if validation_off
+                else None,
             )
             pd1_alias = getattr(pd1_field, "alias", None)
             if isinstance(pd1_alias, str) and pd1_alias != pd1_field.name:
@@ -142,7 +178,16 @@ def pydantic_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
                     _docstrings.get_field_docstring, info.type, name, info.markers
                 )
 
-            default = _get_pydantic_v2_field_default(name, pd2_field, info.default)
+            default = _get_pydantic_v2_field_default(
+                name,
+                pd2_field,
+                info.default,
+                deferred_default=_get_deferred_default(
+                    hints[name], pd2_field.default_factory, info
+                )
+                if validation_off
+                else None,
+            )
             # The name pydantic accepts on input is the validation alias when
             # set (for a plain `alias=`, pydantic auto-populates validation_alias
             # with it). A non-string validation_alias (AliasChoices/AliasPath)
@@ -168,26 +213,126 @@ def pydantic_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
             )
 
     instantiate: Any
-    if alias_from_name:
-        model_cls = info.type
+    model_cls = info.type
+    if validation_off and not _has_validation_logic(model_cls, is_v1_model):
+        # tyro has already converted each value to its annotated type, and the
+        # model doesn't define validators or constraints that could reject
+        # them. Skip Pydantic's validation. Fields are passed by name, which
+        # `construct()` accepts in addition to aliases.
+        construct = model_cls.construct if is_v1_model else model_cls.model_construct
+
+        def instantiate_without_validation(**kwargs: Any) -> Any:
+            return construct(**kwargs)
+
+        instantiate = _with_model_metadata(instantiate_without_validation, model_cls)
+    elif alias_from_name:
 
         def instantiate_with_aliases(**kwargs: Any) -> Any:
             return model_cls(
                 **{alias_from_name.get(k, k): v for k, v in kwargs.items()}
             )
 
-        # Helptext extraction reads `instantiate.__doc__` downstream; carry the
-        # model's docstring (and name) over so that models with aliased fields
-        # keep their description in `--help`.
-        instantiate_with_aliases.__doc__ = model_cls.__doc__
-        instantiate_with_aliases.__name__ = getattr(
-            model_cls, "__name__", instantiate_with_aliases.__name__
-        )
-        instantiate_with_aliases.__qualname__ = getattr(
-            model_cls, "__qualname__", instantiate_with_aliases.__qualname__
-        )
-        instantiate = instantiate_with_aliases
+        instantiate = _with_model_metadata(instantiate_with_aliases, model_cls)
     else:
         instantiate = info.type
 
     return StructConstructorSpec(instantiate=instantiate, fields=tuple(field_list))
+
+
+def _with_model_metadata(instantiate: Any, model_cls: Any) -> Any:
+    """Helptext extraction reads `instantiate.__doc__` downstream; carry the
+    model's docstring (and name) over to functions that wrap a model, so that
+    they keep the model's description in `--help`."""
+    instantiate.__doc__ = model_cls.__doc__
+    instantiate.__name__ = getattr(model_cls, "__name__", instantiate.__name__)
+    instantiate.__qualname__ = getattr(
+        model_cls, "__qualname__", instantiate.__qualname__
+    )
+    return instantiate
+
+
+def _get_deferred_default(typ: Any, default_factory: Any, info: StructTypeInfo) -> Any:
+    """Get a default that avoids calling a field's default factory, or `None`
+    if the factory needs to be called.
+
+    Fields that are parsed from a single argument are excluded from the call
+    when they aren't passed in, so Pydantic only calls the factory for unset
+    fields. Nested models with the model class as their factory are built from
+    the model's own defaults, like `field: Model` without a default.
+    """
+    from ._registry import ConstructorRegistry
+
+    if default_factory is None:
+        return None
+    if default_factory is _resolver.unwrap_annotated(typ):
+        return MISSING_NONPROP
+    if ConstructorRegistry._is_primitive_type(typ, set(info.markers)):
+        return EXCLUDE_FROM_CALL
+    return None
+
+
+_TRANSFORMING_CONFIG_DEFAULTS_V1 = {
+    "anystr_strip_whitespace": False,
+    "anystr_upper": False,
+    "anystr_lower": False,
+    "min_anystr_length": 0,
+    "max_anystr_length": None,
+    "use_enum_values": False,
+    "allow_inf_nan": True,
+}
+"""Pydantic v1 config options that can transform or reject values, mapped to
+their default values."""
+
+_TRANSFORMING_CONFIG_DEFAULTS = {
+    "str_strip_whitespace": False,
+    "str_to_upper": False,
+    "str_to_lower": False,
+    "str_min_length": 0,
+    "str_max_length": None,
+    "use_enum_values": False,
+    "coerce_numbers_to_str": False,
+    "allow_inf_nan": True,
+    "revalidate_instances": "never",
+}
+"""Pydantic v2 config options that can transform or reject values, mapped to
+their default values."""
+
+
+def _has_validation_logic(model_cls: Any, is_v1_model: bool) -> bool:
+    """Check whether a model defines validators, field constraints, config
+    options, or an `__init__()` that could transform or reject values that tyro
+    has already converted."""
+    # `__init__()` overrides are skipped by `construct()`.
+    for base in model_cls.__mro__:
+        if "__init__" in vars(base):
+            if not base.__module__.startswith("pydantic."):
+                return True
+            break
+
+    if is_v1_model:
+        return (
+            len(getattr(model_cls, "__validators__", {})) > 0
+            or len(getattr(model_cls, "__pre_root_validators__", [])) > 0
+            or len(getattr(model_cls, "__post_root_validators__", [])) > 0
+            or any(
+                getattr(model_cls.__config__, key, default) != default
+                for key, default in _TRANSFORMING_CONFIG_DEFAULTS_V1.items()
+            )
+            or any(
+                len(field.field_info.get_constraints()) > 0
+                for field in model_cls.__fields__.values()
+            )
+        )
+
+    decorators = model_cls.__pydantic_decorators__
+    return (
+        len(decorators.validators) > 0
+        or len(decorators.field_validators) > 0
+        or len(decorators.root_validators) > 0
+        or len(decorators.model_validators) > 0
+        or any(
+            model_cls.model_config.get(key, default) != default
+            for key, default in _TRANSFORMING_CONFIG_DEFAULTS.items()
+        )
+        or any(len(field.metadata) > 0 for field in model_cls.model_fields.values())
+    )
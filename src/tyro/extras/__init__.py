@@ -7,13 +7,18 @@
 """
 
 from .._cli import get_parser as get_parser
+from .._fingerprint import UnstableFingerprintError as UnstableFingerprintError
+from .._fingerprint import schema_fingerprint as schema_fingerprint
 from .._settings import set_accent_color as set_accent_color
 from ._base_configs import overridable_config_cli as overridable_config_cli
 from ._base_configs import (
     subcommand_type_from_defaults as subcommand_type_from_defaults,
 )
 from ._choices_type import literal_type_from_choices as literal_type_from_choices
+from ._config_files import config_file_cli as config_file_cli
+from ._incremental import IncrementalParser as IncrementalParser
 from ._serialization import from_yaml as from_yaml
+from ._serialization import from_yaml_all as from_yaml_all
 from ._serialization import to_yaml as to_yaml
 from ._subcommand_app import SubcommandApp as SubcommandApp
 from ._subcommand_cli_from_dict import (
@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import inspect
+import json
+import os
+import pathlib
+import pickle
+import sys
+from typing import Any, Callable, Iterator, List, Mapping, Sequence, TypeVar
+
+from .. import (
+    _arguments,
+    _calling,
+    _cli,
+    _fields,
+    _fingerprint,
+    _parsers,
+    _resolver,
+    _singleton,
+    _strings,
+    _unsafe_cache,
+    conf,
+)
+from .._backends import _tyro_help_formatting
+from ..constructors import ConstructorRegistry
+
+T = TypeVar("T")
+
+_SNAPSHOT_FORMAT = 3
+"""Bumped whenever the layout of snapshot files changes."""
+
+
+def config_file_cli(
+    f: Callable[..., T],
+    *,
+    flag: str = "--config",
+    snapshot_dir: str | os.PathLike[str] | None = None,
+    use_snapshots: bool = False,
+    prog: str | None = None,
+    description: str | None = None,
+    args: Sequence[str] | None = None,
+    use_underscores: bool = False,
+    console_outputs: bool = True,
+    add_help: bool = True,
+    config: Sequence[Any] | None = None,
+    registry: ConstructorRegistry | None = None,
+) -> T:
+    """Call :func:`tyro.cli()`, with values loaded from config files passed via
+    ``--config PATH``. Command-line arguments are applied on top of the loaded
+    values.
+
+    Config files can be JSON (``.json``), TOML (``.toml``), or YAML (``.yaml``,
+    ``.yml``; requires ``pyyaml``). TOML files require ``tomli`` on
+    Python versions before 3.11. Keys are field names, and nested structures
+    are written as nested tables:
+
+    .. code-block:: yaml
+
+        seed: 3
+        optimizer:
+          lr: 0.0003
+        tags: [a, b]
+
+    ``--config`` can be passed more than once, in which case later files
+    override earlier ones. When ``f`` is a type and the config files provide
+    all of its required arguments, the loaded values are shown as defaults in
+    the helptext.
+
+    If ``use_snapshots`` is set, the instance built from the config files is
+    pickled to a snapshot. Snapshots are keyed by the contents of the config
+    files and by :func:`tyro.extras.schema_fingerprint()` of the CLI, so
+    repeated launches with the same files skip reading, parsing, and converting
+    them. Only types that the config files fully populate are snapshotted, and
+    CLIs that can't be fingerprinted, for example because of defaults without a
+    stable encoding, never are. Snapshots are written to ``snapshot_dir``,
+    which defaults to ``$XDG_CACHE_HOME/tyro/config-snapshots``. Like any
+    pickle, a snapshot can run arbitrary code when loaded, so the directory
+    should only be writable by trusted users.
+
+    Args:
+        f: The function or type to populate from config files and command-line
+            arguments.
+        flag: The flag used to pass config files.
+        snapshot_dir: Directory to store snapshots of loaded config files in.
+        use_snapshots: If True, snapshots of instances built from config files
+            are read and written.
+        prog: The name of the program printed in helptext. Mirrors argument from
+            `argparse.ArgumentParser()`.
+        description: Description text for the parser, displayed when the --help flag is
+            passed in. If not specified, the class docstring is used. Mirrors argument from
+            `argparse.ArgumentParser()`.
+        args: If set, parse arguments from a sequence of strings instead of the
+            commandline. Mirrors argument from `argparse.ArgumentParser.parse_args()`.
+        use_underscores: If True, use underscores as a word delimiter instead of hyphens.
+            This primarily impacts helptext; underscores and hyphens are treated equivalently
+            when parsing happens. We default helptext to hyphens to follow the GNU style guide.
+            https://www.gnu.org/software/libc/manual/html_node/Argument-Syntax.html
+        console_outputs: If set to `False`, parsing errors and help messages will be
+            suppressed.
+        add_help: Add a -h/--help option to the parser. This mirrors the argument from
+            `argparse.ArgumentParser()`.
+        config: Sequence of config marker objects, from `tyro.conf`.
+        registry: A :class:`tyro.constructors.ConstructorRegistry` instance containing custom
+            constructor rules.
+    """
+    paths, args = _pop_config_paths(
+        list(sys.argv[1:]) if args is None else list(args), flag
+    )
+
+    # Like in `tyro.cli()`, caches keyed by memory addresses are only valid
+    # within a single call.
+    _unsafe_cache.clear_cache()
+    try:
+        with _strings.delimiter_context("_" if use_underscores else "-"):
+            with registry if registry is not None else contextlib.nullcontext():
+                return _config_file_cli_impl(
+                    f,
+                    paths,
+                    args,
+                    flag=flag,
+                    snapshot_dir=snapshot_dir if use_snapshots else None,
+                    prog=prog if prog is not None else sys.argv[0],
+                    description=description,
+                    console_outputs=console_outputs,
+                    add_help=add_help,
+                    config=config,
+                )
+    finally:
+        _unsafe_cache.clear_cache()
+
+
+def _config_file_cli_impl(
+    f: Callable[..., T],
+    paths: list[str],
+    args: list[str],
+    *,
+    flag: str,
+    snapshot_dir: str | os.PathLike[str] | None,
+    prog: str,
+    description: str | None,
+    console_outputs: bool,
+    add_help: bool,
+    config: Sequence[Any] | None,
+) -> T:
+    """Body of :func:`config_file_cli()`. Should be called with the delimiter
+    and constructor registry active. Snapshots are used if `snapshot_dir` is
+    set."""
+
+    def error_and_exit(title: str, message: str) -> Any:
+        _tyro_help_formatting.error_and_exit(
+            title,
+            message,
+            prog=prog,
+            console_outputs=console_outputs,
+            add_help=add_help,
+        )
+
+    def parse(
+        parser_spec: _parsers.ParserSpecification,
+        default: Any,
+        args: list[str],
+        console_outputs: bool,
+    ) -> Any:
+        if add_help and _requests_help(args):
+            parser_spec = dataclasses.replace(
+                parser_spec, args=[*parser_spec.args, _config_flag_argument(flag)]
+            )
+        out = _cli._cli_impl(
+            f,
+            prog=prog,
+            description=description,
+            args=args,
+            default=default,
+            return_parser=False,
+            return_unknown_args=False,
+            console_outputs=console_outputs,
+            add_help=add_help,
+            compact_help=False,
+            config=config,
+            parser_spec=parser_spec,
+        )()
+        while isinstance(out, _calling.DummyWrapper):
+            out = out.__tyro_dummy_inner__
+        return out
+
+    # The specification without config values is used for reading config
+    # files, for the snapshot key, and for parsing when config values can't be
+    # used as defaults.
+    parser_spec = _fingerprint.build_parser_spec(
+        f, _singleton.MISSING_NONPROP, config, description=description
+    )
+    if len(paths) == 0:
+        return parse(parser_spec, _singleton.MISSING_NONPROP, args, console_outputs)
+
+    contents: list[bytes] = []
+    for path in paths:
+        try:
+            contents.append(pathlib.Path(path).read_bytes())
+        except OSError as e:
+            error_and_exit(
+                "Unreadable config file",
+                f"Could not read config file {path!r}: {e.strerror}.",
+            )
+
+    # Config values can only be used as defaults for types.
+    is_type = inspect.isclass(_resolver.unwrap_annotated(f))
+    snapshot_path = None
+    if snapshot_dir is not None and is_type:
+        # Snapshots are invalidated when the CLI's arguments, types, or
+        # defaults change. CLIs that can't be fingerprinted aren't snapshotted.
+        try:
+            fingerprint = _fingerprint.root_fingerprint(parser_spec)
+        except _fingerprint.UnstableFingerprintError:
+            pass
+        else:
+            key = hashlib.sha256(f"{_SNAPSHOT_FORMAT}:{fingerprint}".encode())
+            for path, content in zip(paths, contents):
+                key.update(pathlib.Path(path).suffix.lower().encode())
+                key.update(hashlib.sha256(content).digest())
+            snapshot_path = _get_snapshot_dir(snapshot_dir) / (
+                key.hexdigest() + ".pickle"
+            )
+
+    default = None if snapshot_path is None else _load_snapshot(snapshot_path)
+    if default is None:
+        arg_from_name = {
+            _strings.make_field_name([arg.intern_prefix, arg.field.intern_name]): arg
+            for arg in _iter_args(parser_spec)
+        }
+        tokens: list[str] = []
+        for path, content in zip(paths, contents):
+            try:
+                data = _parse_config_file(path, content)
+            except Exception as e:
+                error_and_exit(
+                    "Invalid config file", f"Could not parse config file {path!r}: {e}"
+                )
+            try:
+                tokens.extend(_tokens_from_config(data, arg_from_name))
+            except ValueError as e:
+                error_and_exit(
+                    "Invalid config file", f"In config file {path!r}: {e.args[0]}"
+                )
+
+        # When possible, build an instance from the config files alone, and
+        # use it as the default for the command-line arguments. If required
+        # arguments are missing or values are invalid, we instead pass the
+        # config values through as arguments, so errors are reported alongside
+        # the command-line ones.
+        if is_type:
+            try:
+                default = parse(parser_spec, _singleton.MISSING_NONPROP, tokens, False)
+            except SystemExit:
+                pass
+            else:
+                if snapshot_path is not None:
+                    _save_snapshot(snapshot_path, default)
+        if default is None:
+            return parse(
+                parser_spec, _singleton.MISSING_NONPROP, tokens + args, console_outputs
+            )
+
+    # Defaults are baked into parser specifications, so one with the loaded
+    # values as defaults is built for the command-line arguments.
+    return parse(
+        _fingerprint.build_parser_spec(f, default, config, description=description),
+        default,
+        args,
+        console_outputs,
+    )
+
+
+def _pop_config_paths(args: list[str], flag: str) -> tuple[list[str], list[str]]:
+    """Split `flag PATH` and `flag=PATH` occurrences out of a list of
+    arguments. Returns the config paths and the remaining arguments."""
+    flags = {flag, _strings.swap_delimiters(flag)}
+    paths: list[str] = []
+    rest: list[str] = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--":
+            rest.extend(args[i:])
+            break
+        name, sep, value = arg.partition("=")
+        if name in flags and sep != "":
+            paths.append(value)
+        elif arg in flags and i + 1 < len(args):
+            paths.append(args[i + 1])
+            i += 1
+        else:
+            rest.append(arg)
+        i += 1
+    return paths, rest
+
+
+def _requests_help(args: list[str]) -> bool:
+    """Whether a help flag appears before any `--` separator."""
+    for arg in args:
+        if arg == "--":
+            return False
+        if arg in ("-h", "--help"):
+            return True
+    return False
+
+
+def _config_flag_argument(flag: str) -> _arguments.ArgumentDefinition:
+    """Argument for showing the config file flag in helptext. Config paths are
+    popped before parsing, so this is never parsed."""
+    return _arguments.ArgumentDefinition(
+        intern_prefix="",
+        extern_prefix="",
+        subcommand_prefix="",
+        field=_fields.FieldDefinition.make(
+            name=flag.lstrip("-").replace("-", "_"),
+            typ=conf.UseAppendAction[List[pathlib.Path]],
+            default=[],
+            helptext="Config file to load values from. Can be passed more than"
+            " once; later files override earlier ones.",
+        ),
+    )
+
+
+def _iter_args(
+    parser_spec: _parsers.ParserSpecification,
+) -> Iterator[_arguments.ArgumentDefinition]:
+    """Yield the arguments of a parser and its nested (non-subcommand)
+    parsers."""
+    yield from parser_spec.args
+    for child in parser_spec.child_from_prefix.values():
+        yield from _iter_args(child)
+
+
+def _parse_config_file(path: str, content: bytes) -> Mapping[str, Any]:
+    suffix = pathlib.Path(path).suffix.lower()
+    if suffix == ".json":
+        data = json.loads(content)
+    elif suffix == ".toml":
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+        data = tomllib.loads(content.decode("utf-8"))
+    elif suffix in (".yaml", ".yml"):
+        import yaml
+
+        data = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    else:
+        raise ValueError(
+            f"unsupported file extension {suffix!r}. Expected one of .json,"
+            " .toml, .yaml, or .yml."
+        )
+    if not isinstance(data, Mapping):
+        raise ValueError("expected a mapping at the top level.")
+    return data
+
+
+def _tokens_from_config(
+    data: Mapping[str, Any],
+    arg_from_name: Mapping[str, _arguments.ArgumentDefinition],
+) -> list[str]:
+    """Convert values loaded from a config file to command-line arguments."""
+    prefixes = set()
+    for name in arg_from_name:
+        parts = name.split(".")
+        prefixes.update(".".join(parts[:i]) for i in range(1, len(parts)))
+
+    out: list[str] = []
+
+    def flatten(data: Mapping[str, Any], prefix: str) -> None:
+        for key, value in data.items():
+            name = _strings.make_field_name([prefix, str(key).replace("-", "_")])
+            if name in arg_from_name:
+                out.extend(_tokens_from_value(arg_from_name[name], name, value))
+            elif name in prefixes and isinstance(value, Mapping):
+                flatten(value, name)
+            else:
+                raise ValueError(f"unknown key {name!r}.")
+
+    flatten(data, "")
+    return out
+
+
+def _tokens_from_value(
+    arg: _arguments.ArgumentDefinition, name: str, value: Any
+) -> list[str]:
+    if arg.is_positional():
+        raise ValueError(f"positional argument {name!r} can't be set in config files.")
+    flags = arg.lowered.name_or_flags
+    flag = next((f for f in flags if f.startswith("--")), flags[0])
+    action = arg.lowered.action
+    if action in ("store_true", "store_false"):
+        return [flag] if bool(value) == (action == "store_true") else []
+    elif action == "boolean_optional_action":
+        inverse = _arguments.flag_to_inverse(flag)
+        assert inverse is not None
+        return [flag if value else inverse]
+    elif action == "count":
+        return [flag] * int(value)
+    elif action == "append":
+        items = value.items() if isinstance(value, Mapping) else value
+        return [token for item in items for token in _flag_tokens(flag, item)]
+    else:
+        return _flag_tokens(flag, value)
+
+
+def _flag_tokens(flag: str, value: Any) -> list[str]:
+    """Argument strings for passing a value loaded from a config file to a
+    flag. Single strings are attached to the flag as `--flag=value`, so values
+    that start with dashes aren't read as flags."""
+    strings = _strings_from(value)
+    if len(strings) == 1 and flag.startswith("--"):
+        return [f"{flag}={strings[0]}"]
+    for string in strings:
+        if string.startswith("-") and not _is_number(string):
+            raise ValueError(
+                f"value {string!r} for {flag} starts with a dash, which is only"
+                " supported for single values."
+            )
+    return [flag, *strings]
+
+
+def _strings_from(value: Any) -> list[str]:
+    """Flatten a value loaded from a config file into argument strings."""
+    if isinstance(value, Mapping):
+        return [s for item in value.items() for s in _strings_from(item)]
+    elif isinstance(value, (list, tuple)):
+        return [s for item in value for s in _strings_from(item)]
+    else:
+        return [str(value)]
+
+
+def _is_number(string: str) -> bool:
+    try:
+        complex(string)
+    except ValueError:
+        return False
+    return True
+
+
+def _get_snapshot_dir(snapshot_dir: str | os.PathLike[str] | None) -> pathlib.Path:
+    if snapshot_dir is not None:
+        return pathlib.Path(snapshot_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return pathlib.Path(cache_home) / "tyro" / "config-snapshots"
+
+
+def _load_snapshot(path: pathlib.Path) -> Any:
+    try:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+    except Exception:
+        # Missing, corrupted, or outdated snapshots are rebuilt from the config
+        # files.
+        return None
+
+
+def _save_snapshot(path: pathlib.Path, default: Any) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write and rename, so that concurrent launches never read a partially
+        # written snapshot.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(default))
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError, AttributeError, TypeError):
+        # Instances that can't be pickled, for example of locally defined
+        # classes, aren't snapshotted.
+        pass
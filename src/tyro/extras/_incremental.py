@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+from .. import _cli, _errors, _singleton
+from .._backends._tyro_backend import ParseCheckpoints, TyroBackend
+from ..constructors import ConstructorRegistry
+
+OutT = TypeVar("OutT")
+
+
+class IncrementalParser(Generic[OutT]):
+    """Parser for argument lists that are edited and re-parsed, for example to
+    validate command lines as they are typed in an interactive shell.
+
+    The parser specification is built once. Each call to :meth:`parse` resumes
+    from the parser state before the first token that changed since the
+    previous call, so editing the end of a long command line doesn't re-parse
+    the tokens before it.
+
+    .. code-block:: python
+
+        parser = tyro.extras.IncrementalParser(Config)
+        for line in edited_lines:
+            out = parser.parse(shlex.split(line))
+            if isinstance(out, tyro.ParseErrorEvent):
+                show_error(out)
+
+    Incremental parsing requires the tyro backend. With the argparse backend,
+    each argument list is parsed from scratch.
+
+    Args:
+        f: The function or type to populate from each argument list.
+        prog: The name of the program, as in :func:`tyro.cli`.
+        description: The description text, as in :func:`tyro.cli`.
+        default: An instance to use for default values, as in :func:`tyro.cli`.
+        use_underscores: If True, uses underscores as word delimiters.
+        add_help: Add a -h/--help option to the parser.
+        config: A sequence of configuration marker objects from :mod:`tyro.conf`.
+        registry: A :class:`tyro.constructors.ConstructorRegistry` instance
+            containing custom constructor rules.
+    """
+
+    def __init__(
+        self,
+        f: Callable[..., OutT],
+        *,
+        prog: str | None = None,
+        description: str | None = None,
+        default: Any = _singleton.MISSING_NONPROP,
+        use_underscores: bool = False,
+        add_help: bool = True,
+        config: Sequence[Any] | None = None,
+        registry: ConstructorRegistry | None = None,
+    ) -> None:
+        self._batch = _cli._CompiledBatch(
+            _cli._BatchSettings(
+                f=f,
+                prog=prog,
+                description=description,
+                default=default,
+                use_underscores=use_underscores,
+                add_help=add_help,
+                config=tuple(config or ()),
+                registry=registry,
+            )
+        )
+        if self._batch.backend_name == "tyro":
+            self._batch.backend = TyroBackend(checkpoints=ParseCheckpoints())
+
+    def parse(self, argv: Sequence[str]) -> OutT | _errors.ParseErrorEvent:
+        """Parse an argument list. Returns the output, or the error event if
+        parsing fails. Like in :func:`tyro.cli_many`, errors are not printed."""
+        return self._batch.parse(argv)
@@ -5,7 +5,21 @@ from __future__ import annotations
 import dataclasses
 import enum
 import functools
-from typing import IO, TYPE_CHECKING, Any, Optional, Set, Type, TypeVar, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 if TYPE_CHECKING:
     # Since serialization functionality is deprecated, the yaml dependency is optional.
@@ -22,6 +36,13 @@ MISSING_YAML_TAG_PREFIX = "!missing"
 
 DataclassType = TypeVar("DataclassType")
 
+_YAML_CLASS_CACHE_SIZE = 256
+"""Maximum number of root types to cache loader and dumper classes for."""
+
+_YamlClassCache = Dict[Any, Tuple[List[Type[Any]], Tuple[int, ...], Type[Any]]]
+_loader_cache: _YamlClassCache = {}
+_dumper_cache: _YamlClassCache = {}
+
 
 def _get_contained_special_types_from_type(
     cls: Type[Any],
@@ -76,10 +97,58 @@ def _get_contained_special_types_from_type(
     return contained_special_types
 
 
-def _make_loader(cls: Type[Any]) -> Type[yaml.Loader]:
+def _count_subclasses(contained_types: List[Type[Any]]) -> Tuple[int, ...]:
+    return tuple(len(typ.__subclasses__()) for typ in contained_types)
+
+
+def _get_yaml_class(
+    cache: _YamlClassCache,
+    root_type: Any,
+    make: Callable[[List[Type[Any]]], Type[Any]],
+) -> Type[Any]:
+    """Get a loader or dumper class for a root type, building it if needed.
+
+    Building these classes requires a recursive walk over every contained type,
+    so they are cached. Subclasses are part of the walk, so a cached class is
+    rebuilt if any contained type has gained subclasses since it was built.
+    """
+    try:
+        cached = cache.get(root_type)
+    except TypeError:
+        # Unhashable root types, for example `Annotated[]` with unhashable
+        # metadata, are never cached.
+        return make(list(_get_contained_special_types_from_type(root_type)))
+
+    if cached is not None:
+        contained_types, subclass_counts, yaml_class = cached
+        if _count_subclasses(contained_types) == subclass_counts:
+            return yaml_class
+
+    contained_types = list(_get_contained_special_types_from_type(root_type))
+    yaml_class = make(contained_types)
+    if root_type not in cache and len(cache) >= _YAML_CLASS_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[root_type] = (
+        contained_types,
+        _count_subclasses(contained_types),
+        yaml_class,
+    )
+    return yaml_class
+
+
+def _get_loader(cls: Type[Any]) -> Type[Any]:
+    return _get_yaml_class(_loader_cache, cls, _make_loader)
+
+
+def _get_dumper(instance: Any) -> Type[Any]:
+    return _get_yaml_class(_dumper_cache, type(instance), _make_dumper)
+
+
+def _make_loader(contained_types: List[Type[Any]]) -> Type[Any]:
     import yaml
 
-    class DataclassLoader(yaml.Loader):
+    # The libyaml-backed loader is much faster, when it's available.
+    class DataclassLoader(getattr(yaml, "CLoader", yaml.Loader)):  # type: ignore
         pass
 
     # Design Q: do we want to support multiple dataclass types with the same name?
@@ -90,7 +159,6 @@ def _make_loader(cls: Type[Any]) -> Type[yaml.Loader]:
     # => let's just keep things simple, assert uniqueness for now. Easier to add new
     # features later than remove them.
 
-    contained_types = list(_get_contained_special_types_from_type(cls))
     contained_type_names = list(map(lambda cls: cls.__name__, contained_types))
     assert len(set(contained_type_names)) == len(contained_type_names), (
         "Contained dataclass type names must all be unique, but got"
@@ -125,14 +193,16 @@ def _make_loader(cls: Type[Any]) -> Type[yaml.Loader]:
     return DataclassLoader
 
 
-def _make_dumper(instance: Any) -> Type[yaml.Dumper]:
+def _make_dumper(contained_types: List[Type[Any]]) -> Type[Any]:
     import yaml
 
+    # The pure-Python dumper is kept on purpose: libyaml's emitter quotes scalars
+    # differently (e.g. `!enum:E 'B'` vs `!enum:E B`), which would change the
+    # output of `to_yaml()` for existing configs.
     class DataclassDumper(yaml.Dumper):
         def ignore_aliases(self, data):
             return super().ignore_aliases(data) or data is MISSING
 
-    contained_types = list(_get_contained_special_types_from_type(type(instance)))
     contained_type_names = list(map(lambda cls: cls.__name__, contained_types))
 
     # Note: this is currently a stricter than necessary assert.
@@ -142,7 +212,7 @@ def _make_dumper(instance: Any) -> Type[yaml.Dumper]:
     )
 
     def make_representer(name: str):
-        def representer(dumper: DataclassDumper, data: Any) -> yaml.Node:
+        def representer(dumper: Any, data: Any) -> yaml.Node:
             if dataclasses.is_dataclass(data):
                 return dumper.represent_mapping(
                     tag=DATACLASS_YAML_TAG_PREFIX + name,
@@ -201,12 +271,43 @@ def from_yaml(
     """
     import yaml
 
-    out = yaml.load(stream, Loader=_make_loader(cls))
+    out = yaml.load(stream, Loader=_get_loader(cls))
     origin_cls = get_origin(cls)
     assert isinstance(out, origin_cls if origin_cls is not None else cls)
     return out
 
 
+def from_yaml_all(
+    cls: Type[DataclassType],
+    stream: Union[str, IO[str], bytes, IO[bytes]],
+) -> Iterator[DataclassType]:
+    """Lazily re-construct dataclass instances from a multi-document YAML stream.
+    Documents should each be generated from :func:`tyro.extras.to_yaml()`, and
+    separated by ``---``.
+
+    .. warning::
+
+        **Deprecated.** Serialization functionality is stable but deprecated.
+        It may be removed in a future version of :code:`tyro`.
+
+    Documents are parsed one at a time as the returned iterator is consumed, so
+    large streams never need to be held in memory at once.
+
+    Args:
+        cls: Type to reconstruct.
+        stream: YAML to read from.
+
+    Returns:
+        Iterator over instantiated dataclasses, one for each document.
+    """
+    import yaml
+
+    origin_cls = get_origin(cls)
+    for out in yaml.load_all(stream, Loader=_get_loader(cls)):
+        assert isinstance(out, origin_cls if origin_cls is not None else cls)
+        yield out
+
+
 def to_yaml(instance: Any) -> str:
     """Serialize a dataclass; returns a yaml-compatible string that can be deserialized
     via :func:`tyro.extras.from_yaml()`.
@@ -232,4 +333,4 @@ def to_yaml(instance: Any) -> str:
     """
     import yaml
 
-    return "# tyro YAML.\n" + yaml.dump(instance, Dumper=_make_dumper(instance))
+    return "# tyro YAML.\n" + yaml.dump(instance, Dumper=_get_dumper(instance))
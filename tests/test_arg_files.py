@@ -0,0 +1,83 @@
+import dataclasses
+import io
+import pathlib
+from typing import List
+
+import pytest
+
+import tyro
+from tyro._backends import _arg_files
+
+
+@dataclasses.dataclass
+class Args:
+    x: int
+    names: List[str] = dataclasses.field(default_factory=list)
+    flag: bool = False
+
+
+def test_arg_file(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "args.txt"
+    path.write_text("--x\n3\n--names\na b\nc\n")
+    assert tyro.cli(
+        Args, args=[f"@{path}", "--flag"], config=(tyro.conf.UseArgFiles,)
+    ) == Args(x=3, names=["a b", "c"], flag=True)
+
+    # The marker can also be applied to the type directly.
+    assert tyro.cli(tyro.conf.UseArgFiles[Args], args=[f"@{path}"]) == Args(
+        x=3, names=["a b", "c"]
+    )
+
+
+def test_arg_file_off_by_default(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "args.txt"
+    path.write_text("--x\n3\n")
+    with pytest.raises(SystemExit):
+        tyro.cli(Args, args=[f"@{path}"])
+    assert tyro.cli(Args, args=["--x", "3", "--names", f"@{path}"]) == Args(
+        x=3, names=[f"@{path}"]
+    )
+
+
+def test_arg_file_nested(tmp_path: pathlib.Path) -> None:
+    inner = tmp_path / "inner.txt"
+    inner.write_text("--names\r\nx\r\ny\r\n")
+    outer = tmp_path / "outer.txt"
+    outer.write_text(f"--x\n5\n@{inner}\n")
+    assert tyro.cli(Args, args=[f"@{outer}"], config=(tyro.conf.UseArgFiles,)) == Args(
+        x=5, names=["x", "y"]
+    )
+
+
+def test_arg_file_recursive(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "args.txt"
+    path.write_text(f"--x\n5\n@{path}\n")
+    with pytest.raises(SystemExit):
+        tyro.cli(Args, args=[f"@{path}"], config=(tyro.conf.UseArgFiles,))
+
+
+def test_arg_file_missing(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(SystemExit):
+        tyro.cli(
+            Args,
+            args=[f"@{tmp_path / 'missing.txt'}"],
+            config=(tyro.conf.UseArgFiles,),
+        )
+
+
+def test_arg_file_stdin(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO("--x\n7\n--flag\n"))
+    assert tyro.cli(Args, args=["@-"], config=(tyro.conf.UseArgFiles,)) == Args(
+        x=7, flag=True
+    )
+
+
+def test_arg_file_expansion(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "args.txt"
+    path.write_text("a\nb\n")
+    assert _arg_files.expand_arg_files(
+        ["first", f"@{path}", "last"],
+        prog="prog",
+        console_outputs=False,
+        add_help=True,
+    ) == ["first", "a", "b", "last"]
@@ -9,11 +9,15 @@ import dataclasses
 import enum
 import io
 import sys
+import types
 from typing import (
     Any,
     Deque,
     Dict,
     FrozenSet,
+    Generator,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -28,6 +32,7 @@ from helptext_utils import get_helptext_with_checks
 from typing_extensions import Literal
 
 import tyro
+from tyro import _resolver
 
 
 def test_tuples_fixed() -> None:
@@ -619,6 +624,43 @@ def test_tuple_narrowing_empty_default() -> None:
     assert tyro.cli(main, args="--x 0 1 2 3".split(" ")) == ("0", "1", "2", "3")
 
 
+def test_large_collection_narrowing() -> None:
+    floats = [float(i) for i in range(50_000)]
+    assert _resolver.narrow_collection_types(list, floats) == List[float]
+    assert _resolver.narrow_collection_types(tuple, tuple(floats)) == Tuple[float, ...]
+    assert (
+        _resolver.narrow_collection_types(list, floats + ["hello"])
+        == List[Union[float, str]]
+    )
+
+    # Nested containers are narrowed from a sample of their elements.
+    pairs = [(i, float(i)) for i in range(50_000)]
+    assert _resolver.narrow_collection_types(list, pairs) == List[Tuple[int, float]]
+
+    def main(x: list = pairs) -> Any:
+        return x
+
+    assert tyro.cli(main, args=[]) is pairs
+    assert tyro.cli(main, args="--x 1 2.5".split(" ")) == [(1, 2.5)]
+
+
+def test_large_collection_narrowing_exhaustive() -> None:
+    pairs = [(i, i) for i in range(100)]
+    pairs[1] = (1, "one")
+
+    # The odd element is not part of the sample.
+    assert _resolver.narrow_collection_types(list, pairs) == List[Tuple[int, ...]]
+    assert (
+        _resolver.narrow_collection_types(list, pairs, exhaustive=True)
+        == List[Union[Tuple[int, ...], Tuple[int, str]]]
+    )
+
+    def main(x: tyro.conf.DefaultValidationFull[list] = pairs) -> Any:
+        return x
+
+    assert tyro.cli(main, args="--x.1 1 two".split(" "))[1] == (1, "two")
+
+
 def test_narrowing_edge_case() -> None:
     """https://github.com/brentyi/tyro/issues/136"""
 
@@ -790,3 +832,86 @@ def test_ambiguous_collection_7() -> None:
         0,
         ["4"],
     )
+
+
+def test_fixed_arity_sequences() -> None:
+    """Sequences and dicts with fixed-arity inner types are split into chunks
+    directly, without backtracking."""
+    assert tyro.cli(List[int], args=[str(i) for i in range(100_000)]) == list(
+        range(100_000)
+    )
+    assert tyro.cli(List[Tuple[int, str]], args=["1", "a", "2", "b"]) == [
+        (1, "a"),
+        (2, "b"),
+    ]
+    assert tyro.cli(Dict[str, Tuple[int, int]], args=["a", "1", "2"]) == {"a": (1, 2)}
+    assert tyro.cli(List[Literal["a", "b"]], args=["a", "b", "a"]) == ["a", "b", "a"]
+    assert tyro.cli(List[int], args=[]) == []
+
+    # Argument counts that aren't a multiple of the inner arity.
+    with pytest.raises(SystemExit):
+        tyro.cli(List[Tuple[int, str]], args=["1", "a", "2"])
+    with pytest.raises(SystemExit):
+        tyro.cli(Dict[str, int], args=["a", "1", "b"])
+
+    # Invalid values and choices.
+    with pytest.raises(SystemExit):
+        tyro.cli(List[int], args=["1", "x"])
+    with pytest.raises(SystemExit):
+        tyro.cli(List[Literal["a", "b"]], args=["a", "c"])
+
+
+def test_iterator_types() -> None:
+    """Iterator and iterable values are converted while parsing."""
+
+    def main(
+        x: Iterator[int],
+        y: Iterable[Tuple[int, str]] = (),
+    ) -> Tuple[Iterator[int], Iterable[Tuple[int, str]]]:
+        return x, y
+
+    x, y = tyro.cli(main, args=["--x", "1", "2", "3", "--y", "1", "a", "2", "b"])
+    assert next(x) == 1
+    assert list(x) == [2, 3]
+    assert list(x) == []
+
+    # Iterables can be iterated more than once.
+    assert list(y) == [(1, "a"), (2, "b")]
+    assert list(y) == [(1, "a"), (2, "b")]
+
+    # Arity and conversion errors are both caught while parsing.
+    with pytest.raises(SystemExit):
+        tyro.cli(main, args=["--x", "1", "--y", "1", "a", "2"])
+    with pytest.raises(SystemExit):
+        tyro.cli(main, args=["--x", "1", "two"])
+
+
+def test_iterator_types_positional_and_defaults() -> None:
+    def main(
+        files: tyro.conf.Positional[Iterator[str]],
+        values: Generator[int, None, None] = (i for i in range(3)),
+        untyped: collections.abc.Iterable = ("a", "b"),
+    ) -> Tuple[Iterator[str], Iterator[int], collections.abc.Iterable]:
+        return files, values, untyped
+
+    files, values, untyped = tyro.cli(main, args=["a", "b"])
+    assert list(files) == ["a", "b"]
+    assert list(values) == [0, 1, 2]
+    assert untyped == ("a", "b")
+
+    files, values, untyped = tyro.cli(
+        main, args=["a", "--values", "5", "--untyped", "c"]
+    )
+    assert isinstance(values, types.GeneratorType)
+    assert list(files) == ["a"]
+    assert list(values) == [5]
+    assert list(untyped) == ["c"]
+
+    # Rendering the helptext shouldn't consume iterator defaults.
+    values_default = (i for i in range(3))
+
+    def main2(values: Iterator[int] = values_default) -> Iterator[int]:
+        return values
+
+    assert "(default: ...)" in get_helptext_with_checks(main2)
+    assert list(tyro.cli(main2, args=[])) == [0, 1, 2]
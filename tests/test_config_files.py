@@ -0,0 +1,249 @@
+import dataclasses
+import enum
+import json
+import pathlib
+import pickle
+from typing import Dict, List, Tuple
+
+import pytest
+
+import tyro
+from tyro.extras import _config_files
+
+
+class Mode(enum.Enum):
+    TRAIN = enum.auto()
+    EVAL = enum.auto()
+
+
+@dataclasses.dataclass(frozen=True)
+class Optimizer:
+    lr: float = 1e-3
+    betas: Tuple[float, float] = (0.9, 0.999)
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    seed: int
+    optimizer: Optimizer = Optimizer()
+    mode: Mode = Mode.TRAIN
+    verbose: bool = False
+    tags: List[str] = dataclasses.field(default_factory=list)
+    weights: Dict[str, float] = dataclasses.field(default_factory=dict)
+
+
+def test_config_file(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps(
+            {
+                "seed": 3,
+                "optimizer": {"lr": 3e-4, "betas": [0.8, 0.9]},
+                "mode": "EVAL",
+                "verbose": True,
+                "tags": ["a", "b"],
+                "weights": {"x": 1.5},
+            }
+        )
+    )
+    expected = Config(
+        seed=3,
+        optimizer=Optimizer(lr=3e-4, betas=(0.8, 0.9)),
+        mode=Mode.EVAL,
+        verbose=True,
+        tags=["a", "b"],
+        weights={"x": 1.5},
+    )
+    for use_snapshots in (False, True, True):
+        assert (
+            tyro.extras.config_file_cli(
+                Config,
+                args=["--config", str(path)],
+                snapshot_dir=tmp_path / "snapshots",
+                use_snapshots=use_snapshots,
+            )
+            == expected
+        )
+
+    # Command-line arguments override values from the config file.
+    assert tyro.extras.config_file_cli(
+        Config,
+        args=[f"--config={path}", "--optimizer.lr", "0.1", "--no-verbose"],
+        snapshot_dir=tmp_path / "snapshots",
+    ) == dataclasses.replace(
+        expected, optimizer=Optimizer(lr=0.1, betas=(0.8, 0.9)), verbose=False
+    )
+
+
+def test_config_file_layers(tmp_path: pathlib.Path) -> None:
+    base = tmp_path / "base.toml"
+    base.write_text('tags = ["base"]\n\n[optimizer]\nlr = 0.5\n')
+    override = tmp_path / "override.json"
+    override.write_text('{"optimizer": {"lr": 0.25}}')
+
+    # Required arguments can be passed on the command line.
+    assert tyro.extras.config_file_cli(
+        Config,
+        args=["--config", str(base), "--seed", "1", "--config", str(override)],
+        snapshot_dir=tmp_path,
+    ) == Config(seed=1, optimizer=Optimizer(lr=0.25), tags=["base"])
+    with pytest.raises(SystemExit):
+        tyro.extras.config_file_cli(
+            Config, args=["--config", str(base)], snapshot_dir=tmp_path
+        )
+
+
+def test_config_file_without_flag() -> None:
+    assert tyro.extras.config_file_cli(Config, args=["--seed", "2"]) == Config(seed=2)
+
+
+def test_config_file_errors(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "config.json"
+    for contents in ('{"seed": 1, "unknown": 2}', '{"seed": "x"}', "[1, 2]", "{"):
+        path.write_text(contents)
+        with pytest.raises(SystemExit):
+            tyro.extras.config_file_cli(
+                Config, args=["--config", str(path)], snapshot_dir=tmp_path
+            )
+    with pytest.raises(SystemExit):
+        tyro.extras.config_file_cli(
+            Config,
+            args=["--config", str(tmp_path / "missing.json")],
+            snapshot_dir=tmp_path,
+        )
+
+
+def test_config_file_snapshot(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "config.json"
+    path.write_text('{"seed": 5}')
+    snapshot_dir = tmp_path / "snapshots"
+
+    def config_file_cli(*args: str) -> Config:
+        return tyro.extras.config_file_cli(
+            Config,
+            args=["--config", str(path), *args],
+            snapshot_dir=snapshot_dir,
+            use_snapshots=True,
+        )
+
+    # Snapshots are opt-in.
+    assert tyro.extras.config_file_cli(
+        Config, args=["--config", str(path)], snapshot_dir=snapshot_dir
+    ) == Config(seed=5)
+    assert not snapshot_dir.exists()
+
+    assert config_file_cli() == Config(seed=5)
+    (snapshot_path,) = snapshot_dir.iterdir()
+    assert pickle.loads(snapshot_path.read_bytes()) == Config(seed=5)
+
+    # Snapshots are used instead of parsing the config file while its contents
+    # match. Command-line arguments are still applied on top.
+    snapshot_path.write_bytes(pickle.dumps(Config(seed=6, tags=["x"])))
+    with monkeypatch.context() as m:
+        m.setattr(_config_files, "_parse_config_file", None)
+        assert config_file_cli() == Config(seed=6, tags=["x"])
+        assert config_file_cli("--seed", "7") == Config(seed=7, tags=["x"])
+
+    path.write_text('{"seed": 7}')
+    assert config_file_cli() == Config(seed=7)
+    assert len(list(snapshot_dir.iterdir())) == 2
+
+    # Corrupted snapshots are rebuilt.
+    snapshot_path.write_text("not a pickle")
+    path.write_text('{"seed": 5}')
+    assert config_file_cli() == Config(seed=5)
+    assert pickle.loads(snapshot_path.read_bytes()) == Config(seed=5)
+
+
+def test_config_file_snapshot_requires_complete_config(
+    tmp_path: pathlib.Path,
+) -> None:
+    path = tmp_path / "config.json"
+    path.write_text('{"tags": ["a"]}')
+    snapshot_dir = tmp_path / "snapshots"
+    for _ in range(2):
+        assert tyro.extras.config_file_cli(
+            Config,
+            args=["--config", str(path), "--seed", "1"],
+            snapshot_dir=snapshot_dir,
+            use_snapshots=True,
+        ) == Config(seed=1, tags=["a"])
+    assert not snapshot_dir.exists()
+
+
+def test_config_file_unstable_fingerprint(tmp_path: pathlib.Path) -> None:
+    class Opaque:
+        pass
+
+    opaque = Opaque()
+
+    @dataclasses.dataclass
+    class Main:
+        seed: int
+        x: Opaque = opaque
+
+    path = tmp_path / "config.json"
+    path.write_text('{"seed": 5}')
+    snapshot_dir = tmp_path / "snapshots"
+    assert tyro.extras.config_file_cli(
+        Main,
+        args=["--config", str(path)],
+        snapshot_dir=snapshot_dir,
+        use_snapshots=True,
+    ) == Main(5, opaque)
+    assert not snapshot_dir.exists()
+
+
+def test_config_file_helptext(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "config.json"
+    path.write_text('{"seed": 5, "tags": ["a"]}')
+    for args in (["--help"], ["--config", str(path), "--help"]):
+        with pytest.raises(SystemExit):
+            tyro.extras.config_file_cli(Config, args=args)
+        helptext = capsys.readouterr().out
+        assert "--config" in helptext
+        assert "Config file to load values from." in helptext
+
+    # Loaded values are shown as defaults.
+    assert "(default: 5)" in helptext
+
+
+def test_config_file_dashed_strings(tmp_path: pathlib.Path) -> None:
+    @dataclasses.dataclass(frozen=True)
+    class Main:
+        name: str
+        offsets: Tuple[float, ...] = ()
+        names: List[str] = dataclasses.field(default_factory=list)
+
+    path = tmp_path / "config.json"
+    path.write_text('{"name": "--foo", "offsets": [-1, 2.5e-3]}')
+    assert tyro.extras.config_file_cli(Main, args=["--config", str(path)]) == Main(
+        name="--foo", offsets=(-1.0, 2.5e-3)
+    )
+
+    path.write_text('{"name": "x", "names": ["a", "-x"]}')
+    with pytest.raises(SystemExit):
+        tyro.extras.config_file_cli(Main, args=["--config", str(path)])
+
+
+def test_config_file_yaml_function(tmp_path: pathlib.Path) -> None:
+    pytest.importorskip("yaml")
+
+    def main(x: int, names: List[str], flag: bool = False) -> tuple:
+        return x, names, flag
+
+    path = tmp_path / "config.yaml"
+    path.write_text("x: 3\nnames: [a, b]\nflag: true\n")
+    assert tyro.extras.config_file_cli(
+        main, args=["--config", str(path), "--x", "4"], snapshot_dir=tmp_path
+    ) == (4, ["a", "b"], True)
+
+
+def test_pop_config_paths() -> None:
+    assert _config_files._pop_config_paths(
+        ["--config", "a", "--x", "--config=b", "--", "--config", "c"], "--config"
+    ) == (["a", "b"], ["--x", "--", "--config", "c"])
@@ -1,8 +1,10 @@
 import argparse
+import contextlib
 import copy
 import dataclasses
 import datetime
 import enum
+import io
 import os
 import pathlib
 import sys
@@ -448,6 +450,47 @@ def test_dynamic_literal() -> None:
         assert tyro.cli(A, args=["--x", "3"])
 
 
+def test_large_literal() -> None:
+    LargeChoices = tyro.extras.literal_type_from_choices(
+        [f"dataset{i:05d}" for i in range(20_000)]
+    )
+
+    def main(x: LargeChoices = "dataset00003") -> str:  # type: ignore
+        return x
+
+    assert tyro.cli(main, args=[]) == "dataset00003"
+    assert tyro.cli(main, args=["--x", "dataset19999"]) == "dataset19999"
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stderr(target):
+        tyro.cli(main, args=["--x", "dataset1234"])
+
+    # Huge choice sets should be elided in errors, with close matches suggested.
+    error = target.getvalue()
+    assert len(error) < 2_000
+    error = " ".join(error.replace("│", " ").split()).lower()
+    assert "19992 more" in error
+    assert "did you mean 'dataset" in error
+
+    # Huge choice sets should be elided in the helptext.
+    helptext = get_helptext_with_checks(main)
+    assert "dataset00007" in helptext
+    assert "dataset19999" not in helptext
+    assert "19992 more" in helptext
+
+
+def test_large_enum_values() -> None:
+    LargeEnum = enum.Enum(  # type: ignore
+        "LargeEnum", {f"MEMBER_{i}": f"value-{i}" for i in range(5_000)}
+    )
+
+    def main(x: tyro.conf.EnumChoicesFromValues[LargeEnum]) -> Any:  # type: ignore
+        return x
+
+    assert tyro.cli(main, args=["--x", "value-4321"]) is LargeEnum.MEMBER_4321
+    with pytest.raises(SystemExit):
+        tyro.cli(main, args=["--x", "MEMBER_4321"])
+
+
 def test_literal_bool() -> None:
     def main(x: Literal[True]) -> bool:
         return x
@@ -630,6 +630,76 @@ def test_similar_flag() -> None:
     assert error.count("--flag, --no-flag") == 1
 
 
+def test_option_string_index_matches_linear_scan() -> None:
+    import difflib
+
+    from tyro._backends._similar_args import SIMILARITY_THRESHOLD, OptionStringIndex
+
+    option_strings = [
+        f"--{group}.{name}"
+        for group in ("model", "optimizer", "data", "trainer")
+        for name in ("learning-rate", "lr", "batch-size", "seed", "num-layers")
+    ] + ["--flag", "--no-flag", "--fla", "-f"]
+    index = OptionStringIndex(option_strings)
+
+    def linear_score(unrecognized: str, option_string: str) -> float:
+        body = unrecognized[2:]
+        if option_string.endswith(body) or option_string.startswith(body):
+            return 0.9
+        elif len(unrecognized) >= 4 and all(
+            part in option_string for part in body.split(".")
+        ):
+            return 0.9
+        return difflib.SequenceMatcher(a=unrecognized, b=option_string).ratio()
+
+    for unrecognized in (
+        "--lag",
+        "--model.learnig-rate",
+        "--optimzer.lr",
+        "--batch-size",
+        "--trainer.num_layers",
+        "--x",
+        "--a.lr",
+        "--data..seed",
+        "--zzz",
+    ):
+        expected = {}
+        for option_string in option_strings:
+            score = linear_score(unrecognized, option_string)
+            if score >= SIMILARITY_THRESHOLD:
+                expected[option_string] = score
+        assert index.scores(unrecognized) == expected
+
+
+def test_similar_arguments_bounded_lazy_evaluation(backend: str, monkeypatch) -> None:
+    if backend == "argparse":
+        pytest.skip("The argparse backend evaluates every subparser.")
+
+    from tyro import _parsers
+    from tyro._backends._similar_args import MAX_LAZY_SUBPARSERS
+
+    subcommands = [
+        dataclasses.make_dataclass(f"Command{i}", [(f"option_{i}", int, 0)])
+        for i in range(MAX_LAZY_SUBPARSERS * 2)
+    ]
+    evaluated = set()
+    evaluate = _parsers.LazyParserSpecification.evaluate
+
+    def tracked(self):
+        evaluated.add(id(self))
+        return evaluate(self)
+
+    monkeypatch.setattr(_parsers.LazyParserSpecification, "evaluate", tracked)
+
+    target = io.StringIO()
+    with pytest.raises(SystemExit), contextlib.redirect_stderr(target):
+        tyro.cli(Union[tuple(subcommands)], args=["--option-1"])  # type: ignore
+
+    # Flags from the first subcommands are still suggested.
+    assert "--option-1" in target.getvalue()
+    assert len(evaluated) <= MAX_LAZY_SUBPARSERS
+
+
 def test_value_error() -> None:
     """https://github.com/brentyi/tyro/issues/86"""
 
@@ -0,0 +1,136 @@
+import dataclasses
+import os
+import subprocess
+import sys
+import textwrap
+from typing import FrozenSet, List, Union
+
+import pytest
+from helptext_utils import get_helptext_with_checks
+
+import tyro
+from tyro import _fingerprint
+
+
+@dataclasses.dataclass(frozen=True)
+class Layer:
+    width: int = 256
+    tags: FrozenSet[str] = frozenset({"a", "b", "c"})
+
+
+@dataclasses.dataclass(frozen=True)
+class Model:
+    encoder: Layer = Layer()
+    decoder: Layer = Layer()
+    head: Union[Layer, None] = None
+    names: List[str] = dataclasses.field(default_factory=list)
+
+
+def test_fingerprint_is_deterministic() -> None:
+    code = textwrap.dedent(
+        """
+        import dataclasses, enum, pathlib
+        from typing import Dict, Set, Union
+
+        import tyro
+
+        class Color(enum.Enum):
+            RED = enum.auto()
+
+        @dataclasses.dataclass
+        class Inner:
+            tags: Set[str] = dataclasses.field(default_factory=lambda: {"x", "y", "z"})
+            path: pathlib.Path = pathlib.Path("/tmp")
+
+        @dataclasses.dataclass
+        class Outer:
+            inner: Inner
+            color: Color = Color.RED
+            sub: Union[Inner, None] = None
+            weights: Dict[str, float] = dataclasses.field(default_factory=dict)
+
+        print(tyro.extras.schema_fingerprint(Outer))
+        """
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("0", "1", "2")
+    }
+    assert len(outputs) == 1
+
+
+def test_fingerprint_changes() -> None:
+    fingerprint = tyro.extras.schema_fingerprint(Model)
+    assert fingerprint == tyro.extras.schema_fingerprint(Model)
+    assert fingerprint != tyro.extras.schema_fingerprint(
+        Model, default=Model(encoder=Layer(width=3))
+    )
+    assert fingerprint != tyro.extras.schema_fingerprint(
+        Model, config=(tyro.conf.OmitSubcommandPrefixes,)
+    )
+    assert fingerprint != tyro.extras.schema_fingerprint(Model, use_underscores=True)
+
+    registry = tyro.constructors.ConstructorRegistry()
+
+    @registry.primitive_rule
+    def rule(type_info: tyro.constructors.PrimitiveTypeInfo) -> None:
+        return None
+
+    assert fingerprint != tyro.extras.schema_fingerprint(Model, registry=registry)
+
+    # Helptext isn't part of the fingerprint.
+    def main(x: int) -> None:
+        """Docstring."""
+
+    def main2(x: int) -> None:
+        del x
+
+    main2.__qualname__ = main.__qualname__
+    assert tyro.extras.schema_fingerprint(main) == tyro.extras.schema_fingerprint(main2)
+
+
+def test_fingerprint_is_shared_by_repeated_structs(monkeypatch) -> None:
+    calls = []
+    spec_fingerprint = _fingerprint.spec_fingerprint
+
+    def counted(parser_spec):
+        calls.append(parser_spec.f)
+        return spec_fingerprint(parser_spec)
+
+    monkeypatch.setattr(_fingerprint, "spec_fingerprint", counted)
+    tyro._unsafe_cache.clear_cache()
+    parser_spec = _fingerprint.build_parser_spec(Model, tyro.MISSING_NONPROP, None)
+    encoder = parser_spec.child_from_prefix["encoder"]
+    decoder = parser_spec.child_from_prefix["decoder"]
+    assert encoder.fingerprint == decoder.fingerprint
+    assert calls == [Layer]
+    assert parser_spec.fingerprint == parser_spec.fingerprint
+    assert calls.count(Model) == 1
+
+    # Computing the fingerprint doesn't change the CLI.
+    assert "--encoder.width" in get_helptext_with_checks(Model)
+
+
+def test_stable_repr() -> None:
+    assert _fingerprint.stable_repr(frozenset({"b", "a"})) == "frozenset({'a', 'b'})"
+    assert _fingerprint.stable_repr(Layer(3)) == _fingerprint.stable_repr(Layer(3))
+    assert _fingerprint.stable_repr(Layer) == f"{__name__}.Layer"
+
+    # Values without a stable encoding aren't collapsed to their type and repr.
+    with pytest.raises(_fingerprint.UnstableFingerprintError):
+        _fingerprint.stable_repr(object())
+
+    class Opaque:
+        pass
+
+    def main(x: Opaque = Opaque()) -> None:
+        del x
+
+    with pytest.raises(tyro.extras.UnstableFingerprintError):
+        tyro.extras.schema_fingerprint(main)
@@ -79,5 +79,35 @@ def test_scale_cols() -> None:
     ).render(width=8) == [" " * 8]
 
 
+def test_render_cache() -> None:
+    element = fmt.rows(
+        fmt.text["bold"]("Wrapped text, with a comma."),
+        fmt.cols(("left", 6), "right"),
+    )
+    first = element.render(width=12)
+    assert first == [
+        "Wrapped     ",
+        "text, with a",
+        "comma.      ",
+        "left  right ",
+    ]
+
+    # Returned lists should be safe to modify.
+    first.append("extra")
+    assert element.render(width=12) == first[:-1]
+    assert element.render(width=20)[0] == "Wrapped text, with a"
+
+    # Cached renders should respect the ANSI setting.
+    _backup = sys.stdout.isatty
+    sys.stdout.isatty = lambda: True  # type: ignore
+    fmt._FORCE_ANSI = True
+    try:
+        assert element.render(width=12)[0].startswith("\x1b[1mWrapped")
+    finally:
+        fmt._FORCE_ANSI = False
+        sys.stdout.isatty = _backup  # type: ignore
+    assert element.render(width=12) == first[:-1]
+
+
 if __name__ == "__main__":
     test_nested_box()
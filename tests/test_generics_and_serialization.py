@@ -406,6 +406,57 @@ def test_serialize_missing() -> None:
     )
 
 
+def test_from_yaml_all() -> None:
+    class Color(enum.Enum):
+        RED = enum.auto()
+        GREEN = enum.auto()
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        color: Color
+
+    points = [Point(i, Color.RED if i % 2 else Color.GREEN) for i in range(5)]
+    stream = "---\n".join(map(tyro.extras.to_yaml, points))
+    loaded = tyro.extras.from_yaml_all(Point, stream)
+    assert next(loaded) == points[0]
+    assert list(loaded) == points[1:]
+
+
+def test_to_yaml_output_is_stable() -> None:
+    class Color(enum.Enum):
+        RED = enum.auto()
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        color: Color
+
+    assert tyro.extras.to_yaml(Point(1, Color.RED)) == (
+        "# tyro YAML.\n!dataclass:Point\ncolor: !enum:Color 'RED'\nx: 1\n"
+    )
+
+
+def test_serialization_cache_sees_new_subclasses() -> None:
+    @dataclasses.dataclass
+    class Parent:
+        a: int
+
+    @dataclasses.dataclass
+    class Wrapper:
+        inner: Parent
+
+    _check_serialization_identity(Wrapper, Wrapper(Parent(1)))
+
+    # Subclasses defined after the first round trip should still get tags.
+    @dataclasses.dataclass
+    class Child(Parent):
+        b: int
+
+    _check_serialization_identity(Wrapper, Wrapper(Child(1, 2)))
+    assert "!dataclass:Child" in tyro.extras.to_yaml(Wrapper(Child(1, 2)))
+
+
 def test_generic_inherited_type_narrowing() -> None:
     T = TypeVar("T")
 
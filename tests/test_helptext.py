@@ -1687,3 +1687,146 @@ def test_callable_description_without_pydantic_imported() -> None:
         sys.modules.pop("pydantic", None)
         description = _docstrings.get_callable_description(FreshForNoPydantic)
     assert "Docstring for FreshForNoPydantic." in description
+
+
+@dataclasses.dataclass
+class _FilterAdam:
+    lr: float = 1e-3
+    """Learning rate. This description is long enough that it needs to be wrapped in an 80 column terminal."""
+
+
+@dataclasses.dataclass
+class _FilterOptimizer:
+    adam: _FilterAdam = dataclasses.field(default_factory=_FilterAdam)
+    weight_decay: float = 0.0
+    """Weight decay."""
+
+
+@dataclasses.dataclass
+class _FilterData:
+    path: str = "data/"
+    """Dataset path."""
+
+
+@dataclasses.dataclass
+class _FilterConfig:
+    optimizer: _FilterOptimizer = dataclasses.field(default_factory=_FilterOptimizer)
+    data: _FilterData = dataclasses.field(default_factory=_FilterData)
+    seed: int = 0
+
+
+def test_help_group_filter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """`--help=PATTERN` should only format groups with matching arguments."""
+    if tyro._experimental_options["backend"] != "tyro":
+        pytest.skip("Help filters are only supported by the tyro backend.")
+    from tyro import _arguments
+
+    formatted: list[str] = []
+    original = _arguments.generate_argument_helptext
+
+    def generate_argument_helptext(arg, lowered, compact=False):
+        formatted.append(arg.lowered.name_or_flags[0])
+        return original(arg, lowered, compact=compact)
+
+    monkeypatch.setattr(
+        _arguments, "generate_argument_helptext", generate_argument_helptext
+    )
+
+    def get_helptext(args: List[str]) -> str:
+        target = io.StringIO()
+        with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+            tyro.cli(_FilterConfig, args=args)
+        return target.getvalue()
+
+    helptext = get_helptext(["--help=optimizer.*"])
+    assert "optimizer options" in helptext
+    assert "optimizer.adam options" in helptext
+    assert "--optimizer.weight-decay" in helptext
+    assert "data options" not in helptext
+    assert "--seed" not in helptext
+    assert formatted == ["--optimizer.weight-decay", "--optimizer.adam.lr"]
+
+    # Group prefixes can also be matched directly.
+    helptext = get_helptext(["--help=optimizer"])
+    assert "optimizer options" in helptext
+    assert "optimizer.adam options" not in helptext
+
+    helptext = get_helptext(["--help=nope"])
+    assert helptext.startswith("usage:")
+    assert "No arguments match 'nope'." in helptext
+
+
+def test_help_is_streamed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """In single-column layouts, help should be written as each group is
+    formatted."""
+    if tyro._experimental_options["backend"] != "tyro":
+        pytest.skip("Streaming help is only supported by the tyro backend.")
+    from tyro import _arguments
+
+    monkeypatch.setenv("COLUMNS", "80")
+    formatted: list[str] = []
+    original = _arguments.generate_argument_helptext
+
+    def generate_argument_helptext(arg, lowered, compact=False):
+        formatted.append(arg.lowered.name_or_flags[0])
+        return original(arg, lowered, compact=compact)
+
+    monkeypatch.setattr(
+        _arguments, "generate_argument_helptext", generate_argument_helptext
+    )
+
+    # Record how many arguments had been formatted when each line was written.
+    formatted_count_from_line: dict[str, int] = {}
+
+    class _RecordingStream(io.StringIO):
+        def write(self, s: str) -> int:
+            formatted_count_from_line.setdefault(s, len(formatted))
+            return super().write(s)
+
+    target = _RecordingStream()
+    with pytest.raises(SystemExit), contextlib.redirect_stdout(target):
+        tyro.cli(_FilterConfig, args=["--help"])
+    helptext = target.getvalue()
+    assert "data options" in helptext
+
+    # The `optimizer.adam` group is wide enough to fix the render width, so the
+    # `data` group should not have been formatted when it was written.
+    adam_line = next(
+        line for line in formatted_count_from_line if "--optimizer.adam.lr" in line
+    )
+    assert "--data.path" not in formatted[: formatted_count_from_line[adam_line]]
+
+
+def test_helptext_large_container_defaults() -> None:
+    stringified: list[int] = []
+    CountedInt = Annotated[
+        int,
+        tyro.constructors.PrimitiveConstructorSpec(
+            nargs=1,
+            metavar="INT",
+            instance_from_str=lambda args: int(args[0]),
+            is_instance=lambda x: isinstance(x, int),
+            str_from_instance=lambda x: stringified.append(x) or [str(x)],
+        ),
+    ]
+
+    def main(
+        x: List[CountedInt] = list(range(100_000)),
+        y: Optional[Dict[str, int]] = {str(i): i for i in range(20)},
+        z: tyro.conf.UseAppendAction[Tuple[str, ...]] = ("a b",) * 50,
+        w: List[int] = [1, 2, 3],
+    ) -> None:
+        del x, y, z, w
+
+    # Normalize line wrapping.
+    helptext = " ".join(get_helptext_with_checks(main).replace("│", " ").split())
+    assert "(default: 0 1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 [... 99,984 more])" in (
+        helptext
+    )
+    assert "(default: 0 0 1 1 2 2 3 3" in helptext
+    assert "14 14 15 15 [... 4 more])" in helptext
+    assert "'a b' 'a b' [... 34 more])" in helptext
+    assert "(default: 1 2 3)" in helptext
+
+    # Only the displayed elements of the large default are stringified.
+    assert 0 < len(stringified) < 1000
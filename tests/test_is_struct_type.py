@@ -4,6 +4,12 @@ from typing import Any, Dict, List, Tuple
 
 from tyro._fields import is_struct_type
 from tyro._singleton import MISSING_NONPROP
+from tyro.constructors import (
+    ConstructorRegistry,
+    StructConstructorSpec,
+    StructTypeInfo,
+)
+from tyro.constructors._registry import check_default_instances_context
 
 
 def test_is_struct_type_simple():
@@ -55,3 +61,23 @@ def test_struct_dict():
     assert is_struct_type(Dict[str, int], {"x": 5}, in_union_context=False)
     assert is_struct_type(dict, {"x": 5}, in_union_context=False)
     assert is_struct_type(Any, {"x": 5}, in_union_context=False)
+
+
+def test_is_struct_type_matcher_checks_default() -> None:
+    registry = ConstructorRegistry()
+
+    class Point:
+        def __init__(self, x: int) -> None:
+            self.x = x
+
+    def point_rule(info: StructTypeInfo) -> StructConstructorSpec:
+        raise AssertionError("Classifying a type shouldn't build its fields.")
+
+    registry.struct_rule(point_rule, matches=lambda info: info.type is Point)
+
+    with registry:
+        assert is_struct_type(Point, Point(1), in_union_context=False)
+        assert is_struct_type(Color, "red", in_union_context=False)
+        with check_default_instances_context():
+            assert not is_struct_type(Point, "red", in_union_context=False)
+            assert not is_struct_type(Color, "blue", in_union_context=False)
@@ -134,6 +134,41 @@ def test_nested_configdict() -> None:
     assert "--config.level1.level2.level3.sequence" in helptext
 
 
+def test_configdict_shares_untouched_values() -> None:
+    """Values that aren't overridden should be shared with the default config,
+    while nested ConfigDicts and FieldReferences are copied."""
+    from ml_collections import ConfigDict, FieldReference
+
+    class Rows:
+        """Stand-in for a large table, which shouldn't be copied."""
+
+        def __deepcopy__(self, memo):
+            raise AssertionError("Rows should not be copied!")
+
+    default = ConfigDict()
+    default.steps = FieldReference(10)
+    default.table = ConfigDict()
+    default.table.rows = Rows()
+    default.table.steps = default.get_ref("steps")
+    default.table.scale = 1.0
+
+    def train(config: ConfigDict = default) -> ConfigDict:
+        return config
+
+    result = tyro.cli(train, args=["--config.steps=5", "--config.table.scale=2.0"])
+    assert result.table.rows is default.table.rows
+    assert result.table is not default.table
+    assert result.table.scale == 2.0
+    assert result.table.steps == 5
+
+    # The default config should be unchanged, including its references.
+    assert default.table.scale == 1.0
+    assert default.table.steps == 10
+    default.steps = 20
+    assert default.table.steps == 20
+    assert result.table.steps == 5
+
+
 def test_configdict_in_dataclass() -> None:
     """Test ConfigDict as a field within a dataclass."""
     from ml_collections import ConfigDict
@@ -0,0 +1,60 @@
+import dataclasses
+import itertools
+
+import tyro
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    lr: float
+    layers: int = 3
+
+
+def test_cli_many() -> None:
+    argvs = [["--lr", str(i)] for i in range(100)]
+    assert list(tyro.cli_many(Config, argvs)) == [
+        tyro.cli(Config, args=argv) for argv in argvs
+    ]
+
+
+def test_cli_many_function() -> None:
+    def main(x: int, y: int = 2) -> int:
+        return x * y
+
+    assert list(tyro.cli_many(main, [["--x", "1"], ["--x", "3", "--y", "3"]])) == [
+        2,
+        9,
+    ]
+
+
+def test_cli_many_errors() -> None:
+    outputs = list(
+        tyro.cli_many(
+            Config,
+            [
+                ["--lr", "0.1"],
+                ["--lr", "not-a-float"],
+                ["--layers", "2"],
+                ["--lr", "0.2", "--unknown"],
+                ["--lr", "0.3"],
+            ],
+        )
+    )
+    assert outputs[0] == Config(lr=0.1)
+    assert outputs[4] == Config(lr=0.3)
+    for output in outputs[1:4]:
+        assert isinstance(output, tyro.ParseErrorEvent)
+
+
+def test_cli_many_workers() -> None:
+    argvs = [["--lr", str(i)] for i in range(20)] + [["--layers", "1"]]
+    outputs = list(tyro.cli_many(Config, argvs, workers=2))
+    assert outputs[:-1] == [Config(lr=float(i)) for i in range(20)]
+    assert isinstance(outputs[-1], tyro.ParseErrorEvent)
+
+
+def test_cli_many_workers_lazy_argvs() -> None:
+    # Unbounded inputs are consumed in chunks, instead of all at once.
+    argvs = (["--lr", str(i)] for i in itertools.count())
+    outputs = itertools.islice(tyro.cli_many(Config, argvs, workers=2), 3)
+    assert list(outputs) == [Config(lr=float(i)) for i in range(3)]
@@ -4,6 +4,7 @@ import dataclasses
 import io
 import json as json_
 import shlex
+import warnings
 from typing import (
     Annotated,
     Any,
@@ -22,6 +23,7 @@ import pytest
 from helptext_utils import get_helptext_with_checks
 
 import tyro
+from tyro import _resolver
 
 
 def test_suppress_subcommand() -> None:
@@ -3373,3 +3375,80 @@ def test_append_works_for_optional_with_positional_required_args() -> None:
         args="--x hello --x world".split(" "),
         config=(tyro.conf.UseAppendAction, tyro.conf.PositionalRequiredArgs),
     ) == A(x=("hello", "world"))
+
+
+def test_default_validation_policies() -> None:
+    default = [0] * 100
+    default[1] = "hello"  # type: ignore
+
+    def main(x: List[int] = default) -> List[int]:
+        return x
+
+    with pytest.warns(UserWarning):
+        assert tyro.cli(main, args=[], config=(tyro.conf.DefaultValidationFull,)) is (
+            default
+        )
+    for config in (
+        (tyro.conf.DefaultValidationShallow,),
+        (tyro.conf.DefaultValidationOff,),
+    ):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert tyro.cli(main, args=[], config=config) is default
+
+    # Sampled validation inspects the same evenly spaced elements on each
+    # launch. Element 1 isn't inspected, but element 3 is.
+    for config in ((), (tyro.conf.DefaultValidationSampled,)):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert tyro.cli(main, args=[], config=config) is default
+    sampled_default = [0] * 100
+    sampled_default[3] = "hello"  # type: ignore
+    assert not _resolver.is_default_instance(List[int], sampled_default, "sampled")
+
+    # The innermost policy is used.
+    def main_off(
+        x: tyro.conf.DefaultValidationOff[List[int]] = default,
+    ) -> List[int]:
+        return x
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert (
+            tyro.cli(main_off, args=[], config=(tyro.conf.DefaultValidationFull,))
+            is default
+        )
+    with pytest.warns(UserWarning):
+        tyro.cli(
+            main,
+            args=[],
+            config=(tyro.conf.DefaultValidationOff, tyro.conf.DefaultValidationFull),
+        )
+
+
+def test_default_validation_shallow_and_off() -> None:
+    def main(
+        x: List[int] = ["hello"],  # type: ignore
+        y: Dict[str, int] = ("hello",),  # type: ignore
+    ) -> Tuple[List[int], Dict[str, int]]:
+        return x, y
+
+    # The sampled policy catches the mismatched element, and the shallow
+    # policy catches the mismatched container.
+    with pytest.warns(UserWarning) as record:
+        tyro.cli(main, args=[])
+    assert len(record) == 2
+    with pytest.warns(UserWarning) as record:
+        tyro.cli(main, args=[], config=(tyro.conf.DefaultValidationShallow,))
+    assert len(record) == 1
+    assert "`y`" in str(record[0].message)
+
+    # Policies can also be applied to individual fields.
+    def main_off(
+        x: tyro.conf.DefaultValidationOff[List[int]] = ["hello"],  # type: ignore
+    ) -> List[int]:
+        return x
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert tyro.cli(main_off, args=[]) == ["hello"]
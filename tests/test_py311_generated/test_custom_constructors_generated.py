@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from typing import Annotated, Any, Dict, List, Literal, Tuple, get_args
 
 import numpy as np
+import numpy.typing as npt
 import pytest
 from helptext_utils import get_helptext_with_checks
 
@@ -323,6 +324,46 @@ def test_registry_parameter_struct_constructor() -> None:
     assert result.value == "PREFIX_test"
 
 
+@dataclass(frozen=True)
+class Pair:
+    a: int
+    b: int
+
+
+@pytest.mark.parametrize("use_matcher", [False, True])
+def test_struct_rule_classification(use_matcher: bool) -> None:
+    """Struct specs built while classifying a type should be reused when its
+    fields are built. Rules registered with `matches` shouldn't be called for
+    classification at all."""
+    registry = tyro.constructors.ConstructorRegistry()
+    rule_calls = []
+
+    def matches(type_info: tyro.constructors.StructTypeInfo) -> bool:
+        return type_info.type is Pair
+
+    def pair_rule(
+        type_info: tyro.constructors.StructTypeInfo,
+    ) -> tyro.constructors.StructConstructorSpec | None:
+        if not matches(type_info):
+            return None
+        rule_calls.append(type_info.default)
+        return tyro.constructors.StructConstructorSpec(
+            instantiate=Pair,
+            fields=(
+                tyro.constructors.StructFieldSpec("a", int, tyro.MISSING_NONPROP),
+                tyro.constructors.StructFieldSpec("b", int, 2),
+            ),
+        )
+
+    registry.struct_rule(pair_rule, matches=matches if use_matcher else None)
+
+    def main(pair: Pair) -> Pair:
+        return pair
+
+    assert tyro.cli(main, args=["--pair.a", "1"], registry=registry) == Pair(1, 2)
+    assert len(rule_calls) == 1
+
+
 def test_numpy_array_default() -> None:
     """Test that numpy arrays can be used as default values with custom constructors.
 
@@ -440,3 +481,79 @@ def test_numpy_array_subcommand_matching() -> None:
     )
     assert np.array_equal(result.config.array, np.array([4, 5, 6]))
     assert result.config.value == 20
+
+
+def test_numpy_ndarray_rule() -> None:
+    def main(
+        x: npt.NDArray[np.float32],
+        y: np.ndarray = np.zeros(3),
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        return x, y
+
+    x, y = tyro.cli(main, args="--x 1 2.5 3".split(" "))
+    assert x.dtype == np.float32
+    assert np.array_equal(x, np.array([1.0, 2.5, 3.0], dtype=np.float32))
+    assert y.dtype == np.float64
+    assert np.array_equal(y, np.zeros(3))
+
+    x, y = tyro.cli(main, args="--x --y 4 5".split(" "))
+    assert x.shape == (0,)
+    assert np.array_equal(y, np.array([4.0, 5.0]))
+
+    with pytest.raises(SystemExit):
+        tyro.cli(main, args="--x 1 two".split(" "))
+
+
+def test_numpy_ndarray_shape() -> None:
+    def main(
+        x: np.ndarray[Tuple[Literal[2], Literal[3]], np.dtype[np.int64]],
+        y: np.ndarray[Tuple[int, Literal[2]], np.dtype[np.bool_]] = np.ones(
+            (1, 2), dtype=np.bool_
+        ),
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        return x, y
+
+    x, y = tyro.cli(main, args="--x 1 2 3 4 5 6".split(" "))
+    assert x.dtype == np.int64
+    assert np.array_equal(x, np.arange(1, 7).reshape((2, 3)))
+    assert y.shape == (1, 2) and y.all()
+
+    x, y = tyro.cli(main, args="--x 1 2 3 4 5 6 --y True False False True".split(" "))
+    assert np.array_equal(y, np.array([[True, False], [False, True]]))
+
+    # Wrong number of values for a fixed shape.
+    with pytest.raises(SystemExit):
+        tyro.cli(main, args="--x 1 2 3".split(" "))
+    # Values that can't be reshaped into the partially known shape.
+    with pytest.raises(SystemExit):
+        tyro.cli(main, args="--x 1 2 3 4 5 6 --y True".split(" "))
+    # Invalid boolean values.
+    with pytest.raises(SystemExit):
+        tyro.cli(main, args="--x 1 2 3 4 5 6 --y true false".split(" "))
+
+
+def test_numpy_ndarray_large_default_helptext() -> None:
+    def main(x: np.ndarray = np.arange(1_000_000, dtype=np.int64)) -> np.ndarray:
+        return x
+
+    helptext = get_helptext_with_checks(main)
+    assert "INT64" in helptext
+    assert "(default: 0 1 2 ... 999997 999998 999999)" in helptext
+    assert tyro.cli(main, args=[]).shape == (1_000_000,)
+
+
+def test_numpy_ndarray_dtype_from_default() -> None:
+    def main(
+        x: np.ndarray = np.array([1, 2], dtype=np.int32),
+        y: np.ndarray = np.array([True]),
+        z: npt.NDArray[np.float32] = np.array([1, 2]),
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return x, y, z
+
+    x, y, z = tyro.cli(main, args="--x 3 4 5 --y False --z 1".split(" "))
+    assert x.dtype == np.int32 and np.array_equal(x, np.array([3, 4, 5]))
+    assert y.dtype == np.bool_ and not y.any()
+    # Annotated dtypes take precedence over the default.
+    assert z.dtype == np.float32
+    with pytest.raises(SystemExit):
+        tyro.cli(main, args="--x 1.5".split(" "))
@@ -0,0 +1,137 @@
+import dataclasses
+from typing import List, Tuple
+
+import pytest
+
+import tyro
+from tyro._backends._tyro_backend import TyroBackend
+
+
+@dataclasses.dataclass(frozen=True)
+class Train:
+    lr: float = 1e-3
+    names: Tuple[str, ...] = ()
+
+
+@dataclasses.dataclass(frozen=True)
+class Eval:
+    split: str = "val"
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    command: Train | Eval
+    seed: int = 0
+    verbose: tyro.conf.UseCounterAction[int] = 0
+    tags: tyro.conf.UseAppendAction[List[str]] = dataclasses.field(default_factory=list)
+
+
+def _parse(f, argv):
+    try:
+        return tyro.cli(f, args=argv)
+    except SystemExit:
+        return None
+
+
+def test_incremental_matches_full_parse() -> None:
+    parser = tyro.extras.IncrementalParser(Config)
+    edits = [
+        [],
+        ["--seed"],
+        ["--seed", "3"],
+        ["--seed", "3", "--tags", "a"],
+        ["--seed", "3", "--tags", "a", "-v"],
+        ["--seed", "3", "--tags", "a", "-v", "command:train"],
+        ["--seed", "3", "--tags", "a", "-v", "command:train", "--command.names"],
+        ["--seed", "3", "--tags", "a", "-v", "command:train", "--command.names", "x"],
+        [
+            "--seed",
+            "3",
+            "--tags",
+            "a",
+            "-v",
+            "command:train",
+            "--command.names",
+            "x",
+            "y",
+        ],
+        ["--seed", "3", "--tags", "a", "-v", "command:train", "--command.lr=0.1"],
+        ["--seed", "3", "--tags", "b", "-v", "command:train", "--command.lr=0.1"],
+        ["--seed", "4", "--tags", "b", "command:eval"],
+        ["--seed", "4", "--tags", "b", "command:eval", "--command.split", "test"],
+        ["--seed", "4", "--tags", "b", "command:eval", "--command.split"],
+        ["--seed", "4", "--tags", "b", "command:eval", "--command.bogus"],
+        ["--seed", "4", "-vv", "--tags=c", "command:eval"],
+    ]
+    for argv in edits:
+        out = parser.parse(argv)
+        expected = _parse(Config, argv)
+        if expected is None:
+            assert isinstance(out, tyro.ParseErrorEvent)
+        else:
+            assert out == expected
+
+
+def test_incremental_positional_reservation() -> None:
+    def main(
+        a: tyro.conf.Positional[Tuple[int, ...]],
+        b: tyro.conf.Positional[int],
+    ) -> Tuple[Tuple[int, ...], int]:
+        return a, b
+
+    parser = tyro.extras.IncrementalParser(main)
+    assert parser.parse(["1", "2", "3"]) == ((1, 2), 3)
+    # Appending a token changes how many values are left for `b`.
+    assert parser.parse(["1", "2", "3", "4"]) == ((1, 2, 3), 4)
+    assert parser.parse(["1", "2", "3"]) == ((1, 2), 3)
+
+
+def test_incremental_append_outputs_not_shared() -> None:
+    def main(xs: tyro.conf.UseAppendAction[List[int]]) -> List[int]:
+        return xs
+
+    parser = tyro.extras.IncrementalParser(main)
+    out = parser.parse(["--xs", "1", "--xs", "2", "--xs", "3"])
+    assert out == [1, 2, 3]
+    assert isinstance(out, list)
+    out.append(4)
+    assert parser.parse(["--xs", "1", "--xs", "2", "--xs", "5"]) == [1, 2, 5]
+    assert parser.parse(["--xs", "1", "--xs", "6"]) == [1, 6]
+
+
+def test_incremental_reuses_prefix(backend: str, monkeypatch) -> None:
+    if backend == "argparse":
+        pytest.skip("Incremental parsing requires the tyro backend.")
+
+    @dataclasses.dataclass(frozen=True)
+    class Flat:
+        x: int = 0
+        y: int = 0
+
+    consumed: List[str] = []
+    consume_argument = TyroBackend._consume_argument
+
+    def counted(arg, *args, **kwargs):
+        consumed.append(arg.lowered.dest)
+        return consume_argument(arg, *args, **kwargs)
+
+    monkeypatch.setattr(TyroBackend, "_consume_argument", staticmethod(counted))
+
+    parser = tyro.extras.IncrementalParser(Flat)
+    argv = ["--x", "1"] * 100 + ["--y", "1"]
+    assert parser.parse(argv) == Flat(x=1, y=1)
+    assert len(consumed) == 101
+
+    # Only the edited flag is consumed again.
+    del consumed[:]
+    assert parser.parse(argv[:-1] + ["2"]) == Flat(x=1, y=2)
+    assert consumed == ["y"]
+
+    del consumed[:]
+    assert parser.parse(argv[:-1] + ["2", "--x", "3"]) == Flat(x=3, y=2)
+    assert consumed == ["y", "x"]
+
+    # Failed parses keep the checkpoints before the error.
+    del consumed[:]
+    assert isinstance(parser.parse(argv + ["--z"]), tyro.ParseErrorEvent)
+    assert consumed == ["y"]
@@ -510,3 +510,33 @@ def test_msgspec_nested_default_instance() -> None:
         "Expected x value from the default instance"
     )
     assert tyro.cli(Outside, args=["--m.i.x", "3"]).m.i.x == 3
+
+
+def test_msgspec_convert() -> None:
+    class Color(enum.Enum):
+        RED = "red"
+        BLUE = "blue"
+
+    class Inner(msgspec.Struct, rename="camel"):
+        """Inner struct."""
+
+        max_width: Annotated[int, msgspec.Meta(gt=0)] = 1
+        colors: List[Color] = msgspec.field(default_factory=lambda: [Color.RED])
+
+    class Outer(msgspec.Struct):
+        inner: Inner = msgspec.field(default_factory=Inner)
+        color: Color = Color.RED
+
+    config = (tyro.conf.UseMsgspecConvert,)
+    assert tyro.cli(
+        Outer,
+        args=["--inner.max-width", "3", "--inner.colors", "BLUE", "--color", "BLUE"],
+        config=config,
+    ) == Outer(Inner(3, [Color.BLUE]), Color.BLUE)
+    assert tyro.cli(Outer, args=[], config=config) == Outer()
+    assert "Inner struct." in get_helptext_with_checks(Inner, config=config)
+
+    # msgspec.Meta constraints are only checked when structs are converted.
+    with pytest.raises(SystemExit):
+        tyro.cli(Outer, args=["--inner.max-width", "0"], config=config)
+    assert tyro.cli(Outer, args=["--inner.max-width", "0"]).inner.max_width == 0
@@ -1554,3 +1554,56 @@ def test_nargs_then_subcommand() -> None:
     assert tyro.cli(Config, args=["--x", "a", "b", "c", "y:subconfig-a"]) == Config(
         ["a", "b", "c"], SubconfigA()
     )
+
+
+def test_repeated_struct_types() -> None:
+    @dataclasses.dataclass
+    class Optimizer:
+        lr: float = 1e-3
+        """Learning rate."""
+        betas: Tuple[float, float] = (0.9, 0.999)
+        tags: List[str] = dataclasses.field(default_factory=lambda: ["adam"])
+
+    @dataclasses.dataclass
+    class Module:
+        optimizer: Optimizer = dataclasses.field(default_factory=Optimizer)
+        enabled: bool = True
+
+    @dataclasses.dataclass
+    class Model:
+        encoder: Module = dataclasses.field(default_factory=Module)
+        decoder: Module = dataclasses.field(default_factory=Module)
+        head: Annotated[Module, tyro.conf.arg(prefix_name=False)] = dataclasses.field(
+            default_factory=Module
+        )
+        slow: Module = dataclasses.field(
+            default_factory=lambda: Module(Optimizer(lr=1e-5), enabled=False)
+        )
+
+    default = Model()
+    out = tyro.cli(
+        Model,
+        default=default,
+        args=[
+            "--decoder.optimizer.lr",
+            "0.1",
+            "--head.optimizer.tags",
+            "sgd",
+            "--slow.enabled",
+        ],
+    )
+    assert out == Model(
+        decoder=Module(Optimizer(lr=0.1)),
+        head=Module(Optimizer(tags=["sgd"])),
+        slow=Module(Optimizer(lr=1e-5), enabled=True),
+    )
+
+    # Mutable defaults shouldn't be shared between locations.
+    assert out.encoder.optimizer.tags is default.encoder.optimizer.tags
+    assert out.decoder.optimizer.tags is default.decoder.optimizer.tags
+
+    helptext = get_helptext_with_checks(Model)
+    for prefix in ("encoder", "decoder", "head", "slow"):
+        assert f"--{prefix}.optimizer.lr FLOAT" in helptext
+    assert "(default: 1e-05)" in helptext
+    assert "--slow.enabled, --slow.no-enabled" in helptext
@@ -283,3 +283,78 @@ def test_annotations_propagate_through_flattening() -> None:
         tyro.cli(typ, args=["command-b", "--a", "2.5", "--b", "True"])
     with pytest.raises(SystemExit):
         tyro.cli(typ, args=["command-c", "--p", "1", "--q", "k", "3"])
+
+
+def _make_optimizer_union() -> Any:
+    options = []
+    for i in range(10):
+        cls = dataclasses.make_dataclass(
+            f"opt{i}", [("x", int, dataclasses.field(default=i))]
+        )
+        cls.__doc__ = f"opt{i}"
+        options.append(Annotated[cls, tyro.conf.subcommand(f"opt{i}")])
+    return Union[tuple(options)]  # type: ignore
+
+
+_Optimizer = _make_optimizer_union()
+
+
+@dataclasses.dataclass
+class _BigModel:
+    """big"""
+
+    optimizer: _Optimizer  # type: ignore
+
+
+@dataclasses.dataclass
+class _SmallModel:
+    """small"""
+
+    optimizer: _Optimizer  # type: ignore
+
+
+@dataclasses.dataclass
+class _ModelConfig:
+    model: (
+        Annotated[_BigModel, tyro.conf.subcommand("big")]
+        | Annotated[_SmallModel, tyro.conf.subcommand("small")]
+    ) = dataclasses.field(
+        default_factory=lambda: _BigModel(optimizer=_Optimizer.__args__[1].__origin__())
+    )
+
+
+def test_subcommand_help_does_not_evaluate_siblings(
+    backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Printing help for one subcommand path should only evaluate the parsers
+    along that path, regardless of how many alternatives exist."""
+    if backend != "tyro":
+        pytest.skip("The argparse backend builds the full parser tree.")
+    from tyro import _parsers
+
+    evaluated: list[str] = []
+    original_evaluate = _parsers.LazyParserSpecification.evaluate
+
+    def evaluate(self: _parsers.LazyParserSpecification):
+        if self._cached is None:
+            evaluated.append(str(self.description))
+        return original_evaluate(self)
+
+    monkeypatch.setattr(_parsers.LazyParserSpecification, "evaluate", evaluate)
+
+    for config in ((), (tyro.conf.CascadeSubcommandArgs,)):
+        evaluated.clear()
+        with pytest.raises(SystemExit):
+            tyro.cli(
+                _ModelConfig,
+                args=["model:big", "model.optimizer:opt7", "--help"],
+                config=config,
+            )
+        assert evaluated == ["big", "opt7"]
+
+        # The default subcommand (big) should not be evaluated when a different
+        # one is selected.
+        evaluated.clear()
+        with pytest.raises(SystemExit):
+            tyro.cli(_ModelConfig, args=["model:small", "--help"], config=config)
+        assert evaluated == ["small"]
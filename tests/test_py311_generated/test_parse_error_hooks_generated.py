@@ -372,3 +372,41 @@ def test_missing_args_in_subcommand() -> None:
     (event,) = seen
     names = [a.arg.lowered.name_or_flags[-1] for a in event.missing_arguments]
     assert names == ["--b"]
+
+
+def test_cli_many_event_types() -> None:
+    """cli_many() yields the same concrete events that hooks receive."""
+    outputs = list(
+        tyro.cli_many(
+            Config,
+            [
+                ["--token", "a", "--number", "x"],
+                ["--token", "a"],
+                ["--token", "a", "--number", "1", "--unknown"],
+            ],
+        )
+    )
+    assert isinstance(outputs[0], _errors.InstantiationFailure)
+    assert isinstance(outputs[1], _errors.MissingArgs)
+    assert isinstance(outputs[2], _errors.UnrecognizedArgs)
+
+
+def test_cli_many_fires_hooks() -> None:
+    events: List[_errors.ParseErrorEvent] = []
+    with _errors.on_parse_error(events.append):
+        outputs = list(
+            tyro.cli_many(Config, [["--token", "a", "--number", "1"], ["--token", "a"]])
+        )
+    assert outputs[0] == Config(token="a", number=1)
+    assert events == [outputs[1]]
+
+    # Hooks can still raise to take over error handling.
+    class Abort(Exception):
+        pass
+
+    def abort(event: _errors.ParseErrorEvent) -> None:
+        raise Abort()
+
+    with _errors.on_parse_error(abort):
+        with pytest.raises(Abort):
+            list(tyro.cli_many(Config, [["--token", "a"]]))
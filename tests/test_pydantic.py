@@ -2,11 +2,11 @@ import contextlib
 import io
 import pathlib
 import sys
-from typing import cast
+from typing import Any, List, cast
 
 import pytest
 from helptext_utils import get_helptext_with_checks
-from pydantic import BaseModel, Field, v1
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, v1
 from typing_extensions import Annotated
 
 import tyro
@@ -264,3 +264,79 @@ def test_pydantic_dataclass_init_false_with_default_instance() -> None:
     )
     assert config3.in_channel == 0
     assert config3.out_channel == 7
+
+
+def test_pydantic_validation_off() -> None:
+    construct_calls = []
+    factory_calls = []
+
+    def make_tags() -> List[str]:
+        factory_calls.append(None)
+        return ["a"]
+
+    class Inner(BaseModel):
+        x: int = 1
+
+        @classmethod
+        def model_construct(cls, *args, **kwargs):  # type: ignore
+            construct_calls.append(cls)
+            return super().model_construct(*args, **kwargs)
+
+    class Config(BaseModel):
+        inner: Inner = Field(default_factory=Inner)
+        tags: List[str] = Field(default_factory=make_tags)
+        lr: float = 1e-3
+
+    config = (tyro.conf.PydanticValidationOff,)
+    out = tyro.cli(Config, args=["--inner.x", "2", "--tags", "b"], config=config)
+    assert out == Config(inner=Inner(x=2), tags=["b"])
+    assert construct_calls == [Inner]
+
+    # Default factories should only be called for unset fields.
+    assert factory_calls == []
+    assert tyro.cli(Config, args=[], config=config).tags == ["a"]
+    assert len(factory_calls) == 1
+
+    # Models with constraints should still be validated.
+    class Positive(BaseModel):
+        x: int = Field(default=1, gt=0)
+
+    assert tyro.cli(Positive, args=["--x", "2"], config=config) == Positive(x=2)
+    with pytest.raises(ValidationError):
+        tyro.cli(Positive, args=["--x", "-1"], config=config)
+
+    # So should models with transforming config options or a custom `__init__`.
+    class Upper(BaseModel):
+        model_config = ConfigDict(str_to_upper=True)
+        name: str = "a"
+
+    assert tyro.cli(Upper, args=["--name", "b"], config=config).name == "B"
+
+    class CustomInit(BaseModel):
+        x: int = 1
+
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**{**kwargs, "x": kwargs.get("x", 1) * 2})
+
+    assert tyro.cli(CustomInit, args=["--x", "2"], config=config).x == 4
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 14), reason="Pydantic v1 does not support Python 3.14"
+)
+def test_pydantic_v1_validation_off() -> None:
+    class Config(v1.BaseModel):
+        tags: List[str] = v1.Field(default_factory=lambda: ["a"])
+        lr: float = 1e-3
+
+    config = (tyro.conf.PydanticValidationOff,)
+    assert tyro.cli(Config, args=["--lr", "0.1"], config=config) == Config(lr=0.1)
+    assert tyro.cli(Config, args=["--tags", "b"], config=config) == Config(tags=["b"])
+
+    class Upper(v1.BaseModel):
+        name: str = "a"
+
+        class Config:
+            anystr_upper = True
+
+    assert tyro.cli(Upper, args=["--name", "b"], config=config).name == "B"
@@ -0,0 +1,173 @@
+import dataclasses
+import enum
+import itertools
+from typing import List, Literal, Optional, Union
+
+import pytest
+
+import tyro
+from tyro import _sweeps
+
+
+@dataclasses.dataclass(frozen=True)
+class Optimizer:
+    lr: float = 1e-3
+    weight_decay: float = 0.0
+
+
+@dataclasses.dataclass(frozen=True)
+class Config:
+    optimizer: Optimizer
+    seed: int = 0
+    mode: Literal["train", "eval"] = "train"
+    tags: List[str] = dataclasses.field(default_factory=list)
+
+
+def test_parse_sweep_values() -> None:
+    assert _sweeps.parse_sweep_values("1e-3,3e-4") == ["1e-3", "3e-4"]
+    assert _sweeps.parse_sweep_values("0..3") == ["0", "1", "2", "3"]
+    assert _sweeps.parse_sweep_values("3..1") == ["3", "2", "1"]
+    assert _sweeps.parse_sweep_values("0..1,5") == ["0", "1", "5"]
+    assert _sweeps.parse_sweep_values("a..b") == ["a..b"]
+    assert _sweeps.parse_sweep_values("x") == ["x"]
+
+
+def test_sweep() -> None:
+    outputs = tyro.cli_sweep(
+        Config,
+        args=["--optimizer.lr", "1e-3,3e-4", "--seed", "0..2", "--tags", "a", "b"],
+    )
+    assert not isinstance(outputs, Config)
+    outputs = list(outputs)
+    assert sorted(outputs, key=lambda c: (c.seed, -c.optimizer.lr)) == [
+        Config(Optimizer(lr=lr), seed=seed, tags=["a", "b"])
+        for seed, lr in itertools.product(range(3), [1e-3, 3e-4])
+    ]
+
+    # Mutable values aren't shared between outputs.
+    assert outputs[0].tags is not outputs[1].tags
+    outputs[0].tags.append("c")
+    assert outputs[1].tags == ["a", "b"]
+
+
+def test_sweep_without_sweep_values() -> None:
+    outputs = tyro.cli_sweep(Config, args=["--seed", "3", "--mode", "eval"])
+    assert list(outputs) == [Config(Optimizer(), seed=3, mode="eval")]
+
+
+def test_sweep_literal_and_enum() -> None:
+    class Color(enum.Enum):
+        RED = enum.auto()
+        GREEN = enum.auto()
+
+    def main(mode: Literal["train", "eval"], color: Color = Color.RED) -> tuple:
+        return mode, color
+
+    assert list(
+        tyro.cli_sweep(main, args=["--mode", "train,eval", "--color", "RED,GREEN"])
+    ) == [
+        ("train", Color.RED),
+        ("train", Color.GREEN),
+        ("eval", Color.RED),
+        ("eval", Color.GREEN),
+    ]
+    assert list(tyro.cli_sweep(main, args=["--mode", "eval"])) == [("eval", Color.RED)]
+    with pytest.raises(SystemExit):
+        tyro.cli_sweep(main, args=["--mode", "train,test"])
+    with pytest.raises(SystemExit):
+        tyro.cli_sweep(main, args=["--mode", "test"])
+
+
+def test_sweep_only_numeric_and_choices() -> None:
+    def main(name: str = "", path: Optional[str] = None) -> tuple:
+        return name, path
+
+    # Other types are passed through as-is.
+    assert list(tyro.cli_sweep(main, args=["--name", "a,b", "--path", "0..2"])) == [
+        ("a,b", "0..2")
+    ]
+
+
+def test_sweep_is_lazy() -> None:
+    outputs = tyro.cli_sweep(
+        Config, args=["--seed", "0..99999", "--optimizer.weight-decay", "0,0.1"]
+    )
+    first = list(itertools.islice(outputs, 3))
+    assert [c.seed for c in first] == [0, 0, 1]
+    assert [c.optimizer.weight_decay for c in first] == [0.0, 0.1, 0.0]
+
+
+def test_sweep_function_and_subcommands() -> None:
+    @dataclasses.dataclass(frozen=True)
+    class A:
+        x: int = 0
+
+    @dataclasses.dataclass(frozen=True)
+    class B:
+        y: Literal["p", "q"] = "p"
+
+    def main(cmd: Union[A, B], scale: float = 1.0) -> tuple:
+        return cmd, scale
+
+    assert list(
+        tyro.cli_sweep(main, args=["--scale", "1,2", "cmd:a", "--cmd.x", "3,4"])
+    ) == [(A(3), 1.0), (A(4), 1.0), (A(3), 2.0), (A(4), 2.0)]
+    assert list(tyro.cli_sweep(main, args=["cmd:b", "--cmd.y", "p,q"])) == [
+        (B("p"), 1.0),
+        (B("q"), 1.0),
+    ]
+
+
+def test_sweep_underscores_and_registry() -> None:
+    class Scale(float):
+        pass
+
+    registry = tyro.constructors.ConstructorRegistry()
+
+    @registry.primitive_rule
+    def scale_rule(
+        type_info: tyro.constructors.PrimitiveTypeInfo,
+    ) -> Optional[tyro.constructors.PrimitiveConstructorSpec]:
+        if type_info.type is not Scale:
+            return None
+        return tyro.constructors.PrimitiveConstructorSpec(
+            nargs=1,
+            metavar="SCALE",
+            instance_from_str=lambda args: Scale(args[0].rstrip("x")),
+            is_instance=lambda x: isinstance(x, Scale),
+            str_from_instance=lambda x: [f"{x}x"],
+        )
+
+    @dataclasses.dataclass(frozen=True)
+    class Cfg:
+        opt: Optimizer
+        num_seeds: int = 1
+        scale: Scale = Scale(1.0)
+
+    outputs = tyro.cli_sweep(
+        Cfg,
+        args=[
+            "--num_seeds",
+            "0,1",
+            "--opt.weight_decay",
+            "3",
+            "--scale",
+            "2x",
+        ],
+        use_underscores=True,
+        registry=registry,
+    )
+    assert list(outputs) == [
+        Cfg(Optimizer(weight_decay=3.0), num_seeds=0, scale=Scale(2.0)),
+        Cfg(Optimizer(weight_decay=3.0), num_seeds=1, scale=Scale(2.0)),
+    ]
+
+
+def test_sweep_invalid_value() -> None:
+    with pytest.raises(SystemExit):
+        tyro.cli_sweep(Config, args=["--seed", "1,x"])
+
+
+def test_cli_without_sweeps() -> None:
+    with pytest.raises(SystemExit):
+        tyro.cli(Config, args=["--seed", "0..2"])
@@ -729,3 +729,72 @@ def test_nested_subcommands_cascaded() -> None:
     )
     assert isinstance(result.subcommand, SubcommandA)
     assert isinstance(result.subcommand.nested, NestedA)
+
+
+def test_nargs_terminated_by_flag_spellings() -> None:
+    """Flags spelled with either delimiter, or a mix of both, end a list."""
+
+    @dataclasses.dataclass
+    class Config:
+        names: List[str]
+        foo_bar_baz: int = 0
+        flag: bool = False
+
+    for flag in ("--foo-bar-baz", "--foo_bar_baz", "--foo_bar-baz", "--foo-bar_baz"):
+        assert tyro.cli(Config, args=["--names", "a", flag, "3"]) == Config(["a"], 3)
+        assert tyro.cli(
+            Config, args=["--names", "a", flag, "3"], use_underscores=True
+        ) == Config(["a"], 3)
+    for flag in ("--no-flag", "--no_flag"):
+        assert tyro.cli(Config, args=["--names", "a", flag]) == Config(["a"])
+
+
+def test_kwarg_map_normalized_index() -> None:
+    """The precomputed index in `KwargMap` should match normalizing each token."""
+    from types import SimpleNamespace
+
+    from tyro import _strings
+    from tyro._backends._tyro_backend import KwargMap, _normalize_flag
+
+    def make_arg(*name_or_flags: str):
+        return SimpleNamespace(
+            get_output_key=lambda: name_or_flags[0],
+            lowered=SimpleNamespace(name_or_flags=name_or_flags, action="store"),
+        )
+
+    tokens = [
+        prefix + body
+        for prefix in ("-", "--")
+        for body in ("a", "b", "a-b", "a_b", "a-b_c", "a_b-c", "a_b_c", "a-b-c")
+        + ("_a", "a_", "-a", "x_y", "x-y", "value")
+    ] + ["value", "--", "-"]
+    for delimiter in ("-", "_"):
+        with _strings.delimiter_context(delimiter):  # type: ignore
+            kwarg_map = KwargMap()
+            args = [
+                make_arg("--a-b", "-a"),
+                make_arg("--a_b"),
+                make_arg("--a-b-c", "-b"),
+                make_arg("--x_y"),
+                make_arg("--_a"),
+            ]
+            for arg in args:
+                kwarg_map.push(arg)  # type: ignore
+
+            for popped in (None, args[0], args[3], args[1]):
+                if popped is not None:
+                    kwarg_map.pop(popped)  # type: ignore
+                for current in (kwarg_map, kwarg_map.copy()):
+                    for token in tokens:
+                        assert current.contains_normalized(token) == (
+                            current.contains(token)
+                            or current.contains(_normalize_flag(token))
+                        ), token
+                        if token.startswith("--"):
+                            assert current.normalize_flag(token) == _normalize_flag(
+                                token
+                            )
+                    # `-a` takes a value, so the rest of the cluster is its value.
+                    assert current.expand_short_cluster("-ab") == (
+                        None if popped is not None else ["-a", "b"]
+                    )